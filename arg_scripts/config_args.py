@@ -70,6 +70,18 @@ OTHER_OPTIONS = {
         'filter_mods': bool,
         'snapshot_step': int,
         'print_step': int,
+        'use_cache': str_to_bool,
+        'num_workers': int,
+        'use_traces': str_to_bool,
+        'rng_streams': str_to_bool,
+        'columnar_stats': str_to_bool,
+        'stream_stats': str_to_bool,
+        'async_writer': str_to_bool,
+        'use_catalog': str_to_bool,
+        'phase_timing': str_to_bool,
+        'memory_report': str_to_bool,
+        'bounded_memory': str_to_bool,
+        'compact_spectrum': str_to_bool,
     },
     'topology_settings': {
         'bi_directional': str_to_bool,
@@ -117,6 +129,11 @@ OTHER_OPTIONS = {
         'core_beta': float,
         'decay_rate': float,
         'n_trials': int,
+        'fast_reset': str_to_bool,
+        'n_jobs': int,
+        'optuna_storage': str,
+        'optuna_pruner': str,
+        'parallel_arrivals': str_to_bool,
     },
     'ml_settings': {
         'output_train_data': str_to_bool,
@@ -214,6 +231,25 @@ COMMAND_LINE_PARAMS = [
     ['spectrum_priority', str, ''],
     ['save_step', int, ''],
     ['save_start_end_slots', bool, ''],
+    ['use_cache', bool, ''],
+    ['num_workers', int, ''],
+    ['use_traces', bool, ''],
+    ['rng_streams', bool, ''],
+    ['columnar_stats', bool, ''],
+    ['stream_stats', bool, ''],
+    ['async_writer', bool, ''],
+    ['use_catalog', bool, ''],
+    ['phase_timing', bool, ''],
+    ['memory_report', bool, ''],
+    ['bounded_memory', bool, ''],
+    ['compact_spectrum', bool, ''],
+    ['fast_reset', bool, ''],
+    ['n_jobs', int, ''],
+    ['optuna_storage', str, ''],
+    ['optuna_pruner', str, ''],
+    ['parallel_arrivals', bool, ''],
+    ['queue_dir', str, 'Shared directory of the job queue, used to enqueue a sweep or with --worker'],
+    ['lease_time', float, 'Seconds without a heartbeat before a queued job is requeued'],
 
     # StableBaselines3 arguments
     ['algo', str, ''],
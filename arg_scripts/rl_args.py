@@ -88,8 +88,10 @@ class QProps:
         # Total sum of TD errors each episode
         self.sum_errors_dict = {}
 
-        self.routes_matrix = None  # Main routing q-table used by the path agent
-        self.cores_matrix = None  # Main core q-table used by the core agent
+        self.routes_matrix = None  # Main routing q-table used by the path agent, q-values per (src, dst, k, level)
+        self.cores_matrix = None  # Main core q-table used by the core agent, q-values per (src, dst, k, core, level)
+        self.path_ids_matrix = None  # Index of every k-shortest path in the paths list per (src, dst, k), -1 if unknown
+        self.paths_list = []  # Every path found so far, shared by both q-tables
         self.num_nodes = None  # Total number of nodes in the topology
 
         # All important parameters to be saved in a QL simulation run
@@ -121,7 +123,10 @@ class BanditProps:
     """
 
     def __init__(self):
-        self.rewards_matrix = []  # Total sum of rewards for each episode
+        self.rewards_arr = None  # Rewards of the current episode, preallocated to the number of requests
+        self.num_rewards = 0  # Number of rewards received in the current episode
+        self.rewards_sum_arr = None  # Rewards of every ended episode summed per request
+        self.num_episodes = 0  # Number of ended episodes
         self.counts_list = []  # Total number of counts for each action taken for every episode
         self.state_values_list = []  # Every possible V(s)
 
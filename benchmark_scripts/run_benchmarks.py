@@ -0,0 +1,94 @@
+import argparse
+import concurrent.futures
+import os
+import sys
+from datetime import datetime
+
+from arg_scripts.config_args import COMMAND_LINE_PARAMS
+from config_scripts.setup_config import read_config
+from helper_scripts.benchmark_helpers import get_cases, run_case, compare_results, save_results, load_results
+
+CONFIG_FP = os.path.join('benchmark_scripts', 'benchmark_config.ini')
+BASELINE_FP = os.path.join('benchmark_scripts', 'baseline.json')
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description='Benchmarks the simulation engine and compares it to a baseline.')
+    parser.add_argument('--suite', default='quick', choices=['quick', 'full'], help='The cases to run.')
+    parser.add_argument('--case', action='append', default=None,
+                        help='Only runs cases whose name contains this, may be given more than once.')
+    parser.add_argument('--config', default=CONFIG_FP, help='The configuration every case starts from.')
+    parser.add_argument('--output', default=None, help='Where to save the results JSON.')
+    parser.add_argument('--baseline', default=BASELINE_FP, help='The results to compare to.')
+    parser.add_argument('--save_baseline', action='store_true', help='Saves the results as the new baseline.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='The relative change of a metric that counts as a regression.')
+    return vars(parser.parse_args())
+
+
+def run_benchmarks(cases_dict: dict, base_props: dict):
+    """
+    Runs every benchmark case in its own process, so the peak memory of one case never hides that of another.
+
+    :param cases_dict: The name and settings of every case.
+    :param base_props: The simulation properties every case starts from.
+    :return: The results of every case.
+    :rtype: dict
+    """
+    resp = dict()
+    sim_start = datetime.now().strftime("%H_%M_%S_%f")
+    for case_num, (case_name, case_dict) in enumerate(cases_dict.items()):
+        print(f'Benchmark {case_num + 1} out of {len(cases_dict)}: {case_name}')
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(run_case, case_dict=case_dict, base_props=base_props,
+                                     sim_start=f'{sim_start}_{case_num}')
+            resp[case_name] = future.result()
+
+        if 'error' in resp[case_name]:
+            print(f"\tFailed: {resp[case_name]['error']}")
+        else:
+            print(f"\t{resp[case_name]['requests_per_s']:.1f} requests/s, "
+                  f"peak RSS: {resp[case_name]['peak_rss_mb']} MB")
+
+    return resp
+
+
+def main():
+    """
+    Controls the benchmark script.
+    """
+    args_dict = _parse_args()
+    config_dict = read_config(args_dict={param[0]: None for param in COMMAND_LINE_PARAMS},
+                              config_path=args_dict['config'])
+
+    cases_dict = get_cases(suite=args_dict['suite'])
+    if args_dict['case']:
+        cases_dict = {case_name: case_dict for case_name, case_dict in cases_dict.items()
+                      if any(case_str in case_name for case_str in args_dict['case'])}
+    results_dict = run_benchmarks(cases_dict=cases_dict, base_props=config_dict['s1'])
+
+    if args_dict['output'] is None:
+        args_dict['output'] = os.path.join('data', 'benchmarks', f"{datetime.now().strftime('%m%d_%H_%M_%S')}.json")
+    save_results(results_dict=results_dict, save_fp=args_dict['output'])
+    print(f"Results saved to: {args_dict['output']}")
+
+    if args_dict['save_baseline']:
+        save_results(results_dict=results_dict, save_fp=args_dict['baseline'])
+        print(f"Baseline saved to: {args_dict['baseline']}")
+        return
+
+    if not os.path.isfile(args_dict['baseline']):
+        print(f"No baseline found at: {args_dict['baseline']}, run with --save_baseline to create one.")
+        return
+
+    regressions_list = compare_results(results_dict=results_dict, baseline_dict=load_results(args_dict['baseline']),
+                                       threshold=args_dict['threshold'])
+    for case_name, metric, old_value, new_value, change in regressions_list:
+        print(f'Regression in {case_name}: {metric} went from {old_value:.2f} to {new_value:.2f} ({change:+.1%})')
+    if regressions_list:
+        sys.exit(1)
+    print('No regressions found.')
+
+
+if __name__ == '__main__':
+    main()
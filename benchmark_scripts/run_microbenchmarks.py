@@ -0,0 +1,80 @@
+import argparse
+import os
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from helper_scripts.os_helpers import create_dir
+from helper_scripts.benchmark_helpers import save_results
+from helper_scripts.microbenchmark_helpers import run_microbenchmarks, AXIS_DICT, BASE_SETUP_DICT
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description='Times the spectrum primitives as the spectrum grows.')
+    parser.add_argument('--axis', action='append', default=None, choices=list(AXIS_DICT),
+                        help='The setting to vary, may be given more than once, defaults to every setting.')
+    parser.add_argument('--primitive', action='append', default=None,
+                        help='The primitive to time, may be given more than once, defaults to every primitive.')
+    parser.add_argument('--max_seconds', type=float, default=1.0,
+                        help='Stops timing a primitive along a curve once one call takes longer than this.')
+    parser.add_argument('--output', default=None, help='The directory to save the results and plots in.')
+    return vars(parser.parse_args())
+
+
+def plot_curves(results_df: pd.DataFrame, save_dir: str):
+    """
+    Plots the time per call of every primitive along every scaling curve, one plot per varied setting.
+
+    :param results_df: One row per varied setting, setup, and primitive.
+    :param save_dir: The directory to save the plots in.
+    """
+    timed_df = results_df[results_df['seconds'].notna()]
+    for axis, axis_df in timed_df.groupby('axis'):
+        plt.figure(figsize=(6.4, 4.8), dpi=100, layout='constrained')
+        for primitive, primitive_df in axis_df.groupby('primitive'):
+            plt.plot(primitive_df[axis], primitive_df['seconds'] * 1e6, marker='o', label=primitive)
+
+        base_str = ', '.join(f'{key}={value}' for key, value in BASE_SETUP_DICT.items() if key != axis)
+        plt.title(f'Spectrum Primitives ({base_str})', fontsize=9)
+        plt.xlabel(axis)
+        plt.ylabel('Time per Call (us)')
+        plt.yscale('log')
+        if axis == 'num_slots':
+            plt.xscale('log', base=2)
+        plt.grid()
+        plt.legend(fontsize=7)
+        plt.savefig(os.path.join(save_dir, f'{axis}.png'))
+        plt.close()
+
+
+def main():
+    """
+    Controls the microbenchmark script.
+    """
+    args_dict = _parse_args()
+    save_dir = args_dict['output']
+    if save_dir is None:
+        save_dir = os.path.join('data', 'benchmarks', f"micro_{datetime.now().strftime('%m%d_%H_%M_%S')}")
+    create_dir(save_dir)
+
+    results_list = run_microbenchmarks(axis_list=args_dict['axis'], primitive_list=args_dict['primitive'],
+                                       max_seconds=args_dict['max_seconds'])
+    save_results(results_dict={'base_setup': BASE_SETUP_DICT, 'results': results_list},
+                 save_fp=os.path.join(save_dir, 'microbenchmarks.json'))
+    results_df = pd.DataFrame(results_list)
+    results_df.to_csv(os.path.join(save_dir, 'microbenchmarks.csv'), index=False)
+    plot_curves(results_df=results_df, save_dir=save_dir)
+
+    for (axis, primitive), primitive_df in results_df.groupby(['axis', 'primitive'], sort=False):
+        timed_df = primitive_df[primitive_df['seconds'].notna()]
+        if timed_df.empty:
+            print(f"{axis}, {primitive}: {primitive_df['error'].iloc[0]}")
+            continue
+        print(f"{axis}, {primitive}: {timed_df['seconds'].iloc[0] * 1e6:.1f} us at {timed_df[axis].iloc[0]} to "
+              f"{timed_df['seconds'].iloc[-1] * 1e6:.1f} us at {timed_df[axis].iloc[-1]}")
+    print(f'Results saved to: {save_dir}')
+
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,10 @@ def parse_args():
         parser.add_argument(f'--{argument}', type=arg_type, help=arg_help)
         parser.add_argument(f'-{argument}', type=arg_type, help=arg_help)
 
+    parser.add_argument('--worker', action='store_true', help='Pull simulations from the job queue in --queue_dir')
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile every simulation and Erlang, then merge the profiles in data/profiles')
+
     # fixme: Two 'optimize' variables for SB3 and our variable interferes, needs to be fixed for DRL
     # parser.add_argument('-optimize', action='store_true', help='Enable optimization')
     args = parser.parse_args()
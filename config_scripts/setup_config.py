@@ -1,4 +1,8 @@
 import os
+import ast
+import copy
+import json
+import itertools
 import configparser
 import re
 
@@ -67,6 +71,80 @@ def _setup_threads(config: configparser.ConfigParser, config_dict: dict, section
     return config_dict
 
 
+def _parse_sweep_values(value: str, type_obj):
+    """
+    Converts a sweep option, e.g., [first_fit, last_fit] or [4, 7], to a list of typed values.
+
+    :param value: The raw value from the sweep section.
+    :param type_obj: The conversion type of the option.
+    :return: Every value to sweep over.
+    :rtype: list
+    """
+    try:
+        values_list = ast.literal_eval(value)
+        if not isinstance(values_list, (list, tuple)):
+            values_list = [values_list]
+    # Plain strings are not valid Python literals
+    except (ValueError, SyntaxError):
+        values_list = [curr_val.strip() for curr_val in value.strip().strip('[]').split(',')]
+
+    resp_list = list()
+    for curr_val in values_list:
+        if type_obj is ast.literal_eval and not isinstance(curr_val, str):
+            resp_list.append(curr_val)
+        else:
+            resp_list.append(type_obj(str(curr_val)))
+
+    return resp_list
+
+
+def _expand_sweep(config: configparser.ConfigParser, config_dict: dict, types_dict: dict, other_dict: dict,
+                  args_dict: dict):
+    """
+    Expands the sweep section into one simulation per combination of values for every simulation section and removes
+    duplicate configurations.
+
+    :param config: The configuration object.
+    :param config_dict: Every simulation's structured parameters.
+    :param types_dict: Contains option conversion types.
+    :param other_dict: Contains non-required options.
+    :param args_dict: Arguments passed via the command line (if any).
+    :return: Every unique simulation, renumbered from s1.
+    :rtype: dict
+    """
+    sweep_dict = dict()
+    for key, value in config.items('sweep'):
+        # Command line arguments take priority over the sweep
+        if args_dict.get(key) is not None:
+            continue
+
+        category = _find_category(category_dict=types_dict, target_key=key)
+        if category is not None:
+            type_obj = types_dict[category][key]
+        else:
+            category = _find_category(category_dict=other_dict, target_key=key)
+            if category is None:
+                raise ValueError(f"Unknown option '{key}' in the sweep section.")
+            type_obj = other_dict[category][key]
+
+        sweep_dict[key] = _parse_sweep_values(value=value, type_obj=type_obj)
+
+    resp = dict()
+    seen_set = set()
+    for sim_dict in config_dict.values():
+        for combination in itertools.product(*sweep_dict.values()):
+            new_dict = copy.deepcopy(sim_dict)
+            new_dict.update(dict(zip(sweep_dict.keys(), combination)))
+
+            config_str = json.dumps(new_dict, sort_keys=True, default=str)
+            if config_str in seen_set:
+                continue
+            seen_set.add(config_str)
+            resp[f's{len(resp) + 1}'] = new_dict
+
+    return resp
+
+
 def read_config(args_dict: dict, config_path: str = None):
     """
     Structures necessary data from the configuration file in the run_ini directory.
@@ -126,6 +204,9 @@ def read_config(args_dict: dict, config_path: str = None):
         # Ignoring index zero since we've already handled s1, the first simulation
         resp = _setup_threads(config=config, config_dict=config_dict, section_list=config.sections()[1:],
                               types_dict=required_dict, other_dict=other_dict, args_dict=args_dict)
+        if config.has_section('sweep'):
+            resp = _expand_sweep(config=config, config_dict=resp, types_dict=required_dict, other_dict=other_dict,
+                                 args_dict=args_dict)
 
         return resp
 
@@ -7,7 +7,8 @@ import numpy as np
 import pandas as pd
 
 from helper_scripts.os_helpers import create_dir
-from helper_scripts.plot_helpers import find_times, PlotHelpers
+from helper_scripts.plot_helpers import find_sims, PlotHelpers
+from helper_scripts.catalog_helpers import load_result
 from arg_scripts.plot_args import PlotProps
 
 NETWORK_LIST = ['NSFNet', 'USNet']
@@ -172,8 +173,10 @@ for network in NETWORK_LIST:
             ]
         }
 
-        sims_info_dict = find_times(dates_dict={'1014': network, '1015': network},
-                                    filter_dict=filter_dict)
+        plot_props = PlotProps()
+        # Query the results catalog, and the input files of simulations saved without it
+        sims_info_dict = find_sims(dates_dict={'1014': network, '1015': network}, filter_dict=filter_dict,
+                                   catalog_fp=plot_props.catalog_fp)
 
         is_empty = True  # pylint: disable=invalid-name
         for _, data_list in sims_info_dict.items():
@@ -185,7 +188,7 @@ for network in NETWORK_LIST:
             print(f'No file matches for: {filter_dict}')
             continue
 
-        helpers_obj = PlotHelpers(plot_props=PlotProps(), net_names_list=sims_info_dict['networks_matrix'])
+        helpers_obj = PlotHelpers(plot_props=plot_props, net_names_list=sims_info_dict['networks_matrix'])
         helpers_obj.get_file_info(sims_info_dict=sims_info_dict)
 
         counter = 0  # pylint: disable=invalid-name
@@ -204,6 +207,11 @@ for network in NETWORK_LIST:
             :return: The input and output JSON files.
             :rtype: tuple
             """
+            key_dict = {'network': network, 'date': date, 'sim_start': run_time, 'thread_num': 's1', 'erlang': erlang}
+            input_dict, output_dict = load_result(key_dict=key_dict, catalog_fp=plot_props.catalog_fp)
+            if output_dict is not None:
+                return input_dict, output_dict
+
             output_fp = os.path.join('..', 'data', 'output', network, date, run_time, 's1',
                                      f'{erlang}_erlang.json')
             input_fp = os.path.join('..', 'data', 'input', network, date, run_time, 'sim_input_s1.json')
@@ -0,0 +1,321 @@
+import math
+
+import numpy as np
+
+# Quantiles saved alongside the mean, minimum, and maximum
+QUANTILES_LIST = [0.5, 0.9, 0.99]
+
+
+class Histogram:
+    """
+    Counts values in fixed-width bins, values outside the range fall into an underflow or overflow bin.
+    """
+
+    def __init__(self, lower: float, upper: float, num_bins: int):
+        self.lower = lower
+        self.upper = upper
+        self.num_bins = num_bins
+        self.width = (upper - lower) / num_bins
+        # Index zero is the underflow bin and the last index the overflow bin
+        self.counts_arr = np.zeros(num_bins + 2, dtype=np.int64)
+
+    def append(self, value: float):
+        """
+        Adds a value to its bin.
+
+        :param value: The value.
+        """
+        if value < self.lower:
+            index = 0
+        elif value >= self.upper:
+            index = self.num_bins + 1
+        else:
+            index = int((value - self.lower) // self.width) + 1
+        self.counts_arr[index] += 1
+
+    def merge(self, other: 'Histogram'):
+        """
+        Adds the counts of another histogram with the same bins.
+
+        :param other: The other histogram.
+        """
+        if (self.lower, self.upper, self.num_bins) != (other.lower, other.upper, other.num_bins):
+            raise ValueError('Histograms with different bins can not be merged.')
+        self.counts_arr += other.counts_arr
+
+    def to_dict(self):
+        """
+        Converts the histogram to a JSON serializable dictionary.
+
+        :return: The histogram state.
+        :rtype: dict
+        """
+        return {'lower': self.lower, 'upper': self.upper, 'num_bins': self.num_bins,
+                'counts_list': self.counts_arr.tolist()}
+
+    @classmethod
+    def from_dict(cls, state_dict: dict):
+        """
+        Rebuilds a histogram saved with to_dict.
+
+        :param state_dict: The histogram state.
+        :return: The histogram.
+        :rtype: Histogram
+        """
+        resp = cls(lower=state_dict['lower'], upper=state_dict['upper'], num_bins=state_dict['num_bins'])
+        resp.counts_arr = np.array(state_dict['counts_list'], dtype=np.int64)
+        return resp
+
+
+class QuantileSketch:
+    """
+    Estimates quantiles of non-negative values within a relative error using logarithmically sized buckets, the number
+    of buckets grows with the range of the values and not their count.
+    """
+
+    def __init__(self, rel_error: float = 0.01):
+        self.rel_error = rel_error
+        self.gamma = (1.0 + rel_error) / (1.0 - rel_error)
+        self.log_gamma = math.log(self.gamma)
+        # Values too small to have a bucket, e.g., zero
+        self.zero_count = 0
+        self.buckets_dict = dict()
+        self.count = 0
+
+    def append(self, value: float):
+        """
+        Adds a value to its bucket.
+
+        :param value: The value.
+        """
+        self.count += 1
+        if value <= 1e-9:
+            self.zero_count += 1
+            return
+
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets_dict[index] = self.buckets_dict.get(index, 0) + 1
+
+    def merge(self, other: 'QuantileSketch'):
+        """
+        Adds the buckets of another sketch with the same relative error.
+
+        :param other: The other sketch.
+        """
+        if self.rel_error != other.rel_error:
+            raise ValueError('Sketches with a different relative error can not be merged.')
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for index, count in other.buckets_dict.items():
+            self.buckets_dict[index] = self.buckets_dict.get(index, 0) + count
+
+    def get_quantile(self, quantile: float):
+        """
+        Estimates a quantile.
+
+        :param quantile: The quantile between zero and one.
+        :return: The estimated value, None if nothing was added.
+        :rtype: float
+        """
+        if self.count == 0:
+            return None
+
+        rank = quantile * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.buckets_dict):
+            seen += self.buckets_dict[index]
+            if seen > rank:
+                # Middle of the bucket (gamma^(index - 1), gamma^index], within the relative error of every value in it
+                return 2.0 * self.gamma ** index / (self.gamma + 1.0)
+
+        return 2.0 * self.gamma ** max(self.buckets_dict) / (self.gamma + 1.0)
+
+    def to_dict(self):
+        """
+        Converts the sketch to a JSON serializable dictionary.
+
+        :return: The sketch state.
+        :rtype: dict
+        """
+        return {'rel_error': self.rel_error, 'zero_count': self.zero_count, 'count': self.count,
+                'buckets_dict': {str(index): count for index, count in self.buckets_dict.items()}}
+
+    @classmethod
+    def from_dict(cls, state_dict: dict):
+        """
+        Rebuilds a sketch saved with to_dict.
+
+        :param state_dict: The sketch state.
+        :return: The sketch.
+        :rtype: QuantileSketch
+        """
+        resp = cls(rel_error=state_dict['rel_error'])
+        resp.zero_count = state_dict['zero_count']
+        resp.count = state_dict['count']
+        resp.buckets_dict = {int(index): count for index, count in state_dict['buckets_dict'].items()}
+        return resp
+
+
+class RunningStats:
+    """
+    Keeps the count, mean, variance, minimum, and maximum of a stream of values in constant memory. Replaces a list in
+    the statistics, values are added with append.
+    """
+
+    def __init__(self, histogram_obj: Histogram = None, rel_error: float = 0.01):
+        self.count = 0
+        self.mean = 0.0
+        # Sum of squared differences from the mean (Welford)
+        self.sum_sq = 0.0
+        self.min = None
+        self.max = None
+        self.sketch_obj = QuantileSketch(rel_error=rel_error)
+        self.histogram_obj = histogram_obj
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value: float):
+        """
+        Adds a value.
+
+        :param value: The value.
+        """
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_sq += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        self.sketch_obj.append(value=value)
+        if self.histogram_obj is not None:
+            self.histogram_obj.append(value=value)
+
+    def merge(self, other: 'RunningStats'):
+        """
+        Combines the values of another aggregate, e.g., from a parallel replication, as if they were added here.
+
+        :param other: The other aggregate.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.mean, self.sum_sq, self.min, self.max = other.mean, other.sum_sq, other.min, other.max
+        else:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self.sum_sq += other.sum_sq + delta ** 2 * self.count * other.count / total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.count += other.count
+
+        self.sketch_obj.merge(other=other.sketch_obj)
+        if self.histogram_obj is not None and other.histogram_obj is not None:
+            self.histogram_obj.merge(other=other.histogram_obj)
+
+    def get_std(self):
+        """
+        Gets the sample standard deviation.
+
+        :return: The standard deviation, zero for a single value.
+        :rtype: float
+        """
+        if self.count <= 1:
+            return 0.0
+
+        return math.sqrt(max(self.sum_sq, 0.0) / (self.count - 1))
+
+    def get_summary(self, decimals: int = None):
+        """
+        Summarizes the values in the format of the list based statistics.
+
+        :param decimals: Round every value to this many decimals.
+        :return: The mean, standard deviation, minimum, and maximum.
+        :rtype: dict
+        """
+        if self.count == 0:
+            return {'mean': None, 'std': None, 'min': None, 'max': None}
+
+        resp = {'mean': self.mean, 'std': self.get_std(), 'min': self.min, 'max': self.max}
+        if decimals is not None:
+            resp = {key: round(value, decimals) for key, value in resp.items()}
+
+        return resp
+
+    def get_quantiles(self, quantiles_list: list = None):
+        """
+        Estimates quantiles from the sketch.
+
+        :param quantiles_list: Quantiles between zero and one, defaults to QUANTILES_LIST.
+        :return: The estimate of each quantile keyed by e.g., 'p50'.
+        :rtype: dict
+        """
+        if quantiles_list is None:
+            quantiles_list = QUANTILES_LIST
+
+        return {f'p{round(quantile * 100, 2):g}': self.sketch_obj.get_quantile(quantile=quantile)
+                for quantile in quantiles_list}
+
+    def to_dict(self):
+        """
+        Converts the aggregate to a JSON serializable dictionary.
+
+        :return: The aggregate state.
+        :rtype: dict
+        """
+        resp = {'count': self.count, 'mean': self.mean, 'sum_sq': self.sum_sq, 'min': self.min, 'max': self.max,
+                'sketch': self.sketch_obj.to_dict()}
+        if self.histogram_obj is not None:
+            resp['histogram'] = self.histogram_obj.to_dict()
+
+        return resp
+
+    @classmethod
+    def from_dict(cls, state_dict: dict):
+        """
+        Rebuilds an aggregate saved with to_dict.
+
+        :param state_dict: The aggregate state.
+        :return: The aggregate.
+        :rtype: RunningStats
+        """
+        resp = cls()
+        resp.count = state_dict['count']
+        resp.mean = state_dict['mean']
+        resp.sum_sq = state_dict['sum_sq']
+        resp.min = state_dict['min']
+        resp.max = state_dict['max']
+        resp.sketch_obj = QuantileSketch.from_dict(state_dict=state_dict['sketch'])
+        if 'histogram' in state_dict:
+            resp.histogram_obj = Histogram.from_dict(state_dict=state_dict['histogram'])
+
+        return resp
+
+
+def merge_stats(state_list: list):
+    """
+    Merges saved aggregates, e.g., the same statistic from parallel replications or iterations.
+
+    :param state_list: Aggregate states saved with RunningStats.to_dict.
+    :return: The combined aggregate.
+    :rtype: RunningStats
+    """
+    resp = None
+    for state_dict in state_list:
+        stats_obj = RunningStats.from_dict(state_dict=state_dict)
+        if resp is None:
+            resp = stats_obj
+        else:
+            resp.merge(other=stats_obj)
+
+    if resp is None:
+        return RunningStats()
+
+    return resp
@@ -9,13 +9,16 @@ from arg_scripts.rl_args import BanditProps
 
 def load_model(train_fp: str):
     """
-    Loads a pre-trained bandit model.
+    Loads a pre-trained bandit model, saved as a NumPy array or, for older models, as JSON.
 
     :param train_fp: File path the model has been saved on.
     :return: The state-value functions V(s, a)
-    :rtype: dict
+    :rtype: np.ndarray or dict
     """
     train_fp = os.path.join('logs', train_fp)
+    if train_fp.endswith('.npy'):
+        return np.load(train_fp)
+
     with open(train_fp, 'r', encoding='utf-8') as file_obj:
         state_vals_dict = json.load(file_obj)
 
@@ -31,36 +34,30 @@ def _get_base_fp(is_path: bool, erlang: float, cores_per_link: int):
     return base_fp
 
 
-def _save_model(state_values_dict: dict, erlang: float, cores_per_link: int, save_dir: str, is_path: bool):
-    if state_values_dict is None:
+def _save_model(state_values_arr: np.ndarray, erlang: float, cores_per_link: int, save_dir: str, is_path: bool):
+    if state_values_arr is None:
         return
-    # Convert tuples to strings and arrays to lists for JSON format
-    state_values_dict = {str(key): value.tolist() for key, value in state_values_dict.items()}
 
-    if is_path:
-        state_vals_fp = f"state_vals_e{erlang}_routes_c{cores_per_link}.json"
-    else:
-        state_vals_fp = f"state_vals_e{erlang}_cores_c{cores_per_link}.json"
+    state_vals_fp = f"state_vals_{_get_base_fp(is_path=is_path, erlang=erlang, cores_per_link=cores_per_link)}"
     save_fp = os.path.join(os.getcwd(), save_dir, state_vals_fp)
-    with open(save_fp, 'w', encoding='utf-8') as file_obj:
-        json.dump(state_values_dict, file_obj)
+    np.save(save_fp, state_values_arr)
 
 
 def save_model(iteration: int, algorithm: str, self: object):
     """
-    Saves a trained bandit model.
+    Saves a trained bandit model, called once an iteration ends.
 
     :param iteration: Current iteration.
     :param algorithm: The algorithm used.
     :param self: The object to be saved.
     """
     max_iters = self.engine_props['max_iters']
-    rewards_matrix = self.props.rewards_matrix
+    num_requests = self.engine_props['num_requests']
     # TODO: Hard coded to save every 50 iterations, should be in the configuration file
-    if (iteration in (max_iters - 1, (max_iters - 1) % 50)) and \
-            (len(self.props.rewards_matrix[iteration]) == self.engine_props['num_requests']):
-        rewards_matrix = np.array(rewards_matrix)
-        rewards_arr = rewards_matrix.mean(axis=0)
+    if (iteration in (max_iters - 1, (max_iters - 1) % 50)) and self.props.num_rewards == num_requests:
+        # The average reward of every request over every episode so far, this one included
+        rewards_sum_arr = self.props.rewards_sum_arr[:num_requests] + self.props.rewards_arr[:num_requests]
+        rewards_arr = rewards_sum_arr / (self.props.num_episodes + 1)
 
         date_time = os.path.join(self.engine_props['network'], self.engine_props['date'],
                                  self.engine_props['sim_start'])
@@ -75,37 +72,53 @@ def save_model(iteration: int, algorithm: str, self: object):
         save_fp = os.path.join(os.getcwd(), save_dir, rewards_fp)
         np.save(save_fp, rewards_arr)
 
-        _save_model(state_values_dict=self.values, erlang=erlang, cores_per_link=cores_per_link,
+        _save_model(state_values_arr=self.values, erlang=erlang, cores_per_link=cores_per_link,
                     save_dir=save_dir, is_path=self.is_path)
 
 
 def get_q_table(self: object):
     """
-    Constructs the q-table.
+    Constructs the q-table, indexed by (source, destination) for paths and (source, destination, path index) for
+    cores, with one entry per arm.
 
     :param self: The current bandit object.
     :return: The initial V(s, a) and N(s, a) values.
     :rtype: tuple
     """
-    self.counts = {}
-    self.values = {}
-    for source in range(self.num_nodes):
-        for destination in range(self.num_nodes):
-            if source == destination:
-                continue
-
-            if self.is_path:
-                self.counts[(source, destination)] = np.zeros(self.n_arms)
-                self.values[(source, destination)] = np.zeros(self.n_arms)
-            else:
-                for path_index in range(self.engine_props['k_paths']):
-                    self.counts[(source, destination, path_index)] = np.zeros(self.n_arms)
-                    self.values[(source, destination, path_index)] = np.zeros(self.n_arms)
+    if self.is_path:
+        shape = (self.num_nodes, self.num_nodes, self.n_arms)
+    else:
+        shape = (self.num_nodes, self.num_nodes, self.engine_props['k_paths'], self.n_arms)
 
+    self.counts = np.zeros(shape, dtype=np.int64)
+    self.values = np.zeros(shape)
     return self.counts, self.values
 
 
-def _update_bandit(self: object, iteration: int, reward: float, arm: int, algorithm: str):
+def _add_reward(props: object, reward: float, num_requests: int):
+    if props.rewards_arr is None:
+        props.rewards_arr = np.zeros(num_requests)
+        props.rewards_sum_arr = np.zeros(num_requests)
+    # Grow the buffers should an episode have more rewards than requests
+    if props.num_rewards >= len(props.rewards_arr):
+        props.rewards_arr = np.pad(props.rewards_arr, (0, len(props.rewards_arr)))
+        props.rewards_sum_arr = np.pad(props.rewards_sum_arr, (0, len(props.rewards_sum_arr)))
+
+    props.rewards_arr[props.num_rewards] = reward
+    props.num_rewards += 1
+
+
+def _end_episode(props: object):
+    if props.num_rewards == 0:
+        return
+
+    props.rewards_sum_arr += props.rewards_arr
+    props.num_episodes += 1
+    props.rewards_arr.fill(0.0)
+    props.num_rewards = 0
+
+
+def _update_bandit(self: object, reward: float, arm: int):
     if self.is_path:
         pair = (self.source, self.dest)
     else:
@@ -116,12 +129,7 @@ def _update_bandit(self: object, iteration: int, reward: float, arm: int, algori
     value = self.values[pair][arm]
     self.values[pair][arm] = value + (reward - value) / n_times
 
-    if self.iteration >= len(self.props.rewards_matrix):
-        self.props.rewards_matrix.append([])
-    self.props.rewards_matrix[self.iteration].append(reward)
-
-    # Check if we need to save the model
-    save_model(iteration=iteration, algorithm=algorithm, self=self)
+    _add_reward(props=self.props, reward=reward, num_requests=self.engine_props['num_requests'])
 
 
 class EpsilonGreedyBandit:
@@ -147,14 +155,19 @@ class EpsilonGreedyBandit:
             self.n_arms = engine_props['cores_per_link']
 
         self.epsilon = None
+        # Independent random stream, None uses the global numpy state
+        self.rng = None
         self.num_nodes = rl_props.num_nodes
         self.counts, self.values = get_q_table(self=self)  # Amount of times an action has been taken and every V(s,a)
 
     def _get_action(self, state_action_pair: tuple):
-        if np.random.rand() < self.epsilon:
-            return np.random.randint(self.n_arms)
+        if self.rng is None:
+            if np.random.rand() < self.epsilon:
+                return np.random.randint(self.n_arms)
+        elif self.rng.random() < self.epsilon:
+            return int(self.rng.integers(self.n_arms))
 
-        return np.argmax(self.values[state_action_pair])
+        return int(np.argmax(self.values[state_action_pair]))
 
     def select_path_arm(self, source: int, dest: int):
         """
@@ -194,7 +207,15 @@ class EpsilonGreedyBandit:
         :param reward: Reward received from R(s, a).
         :param iteration: Current episode or iteration.
         """
-        _update_bandit(self=self, iteration=iteration, reward=reward, arm=arm, algorithm='epsilon_greedy_bandit')
+        self.iteration = iteration
+        _update_bandit(self=self, reward=reward, arm=arm)
+
+    def end_iter(self):
+        """
+        Ends an iteration, saving the model when due.
+        """
+        save_model(iteration=self.iteration, algorithm='epsilon_greedy_bandit', self=self)
+        _end_episode(props=self.props)
 
 
 class UCBBandit:
@@ -223,13 +244,12 @@ class UCBBandit:
         self.counts, self.values = get_q_table(self=self)
 
     def _get_action(self, state_action_pair: tuple):
-        if 0 in self.counts[state_action_pair]:
-            return np.argmin(self.counts[state_action_pair])
+        counts_arr = self.counts[state_action_pair]
+        if not counts_arr.all():
+            return int(np.argmin(counts_arr))
 
-        total_counts = sum(self.counts[state_action_pair])
-        ucb_values = self.values[state_action_pair] + \
-                     np.sqrt(2 * np.log(total_counts) / self.counts[state_action_pair])
-        return np.argmax(ucb_values)
+        ucb_values = self.values[state_action_pair] + np.sqrt(2 * np.log(counts_arr.sum()) / counts_arr)
+        return int(np.argmax(ucb_values))
 
     def select_path_arm(self, source: int, dest: int):
         """
@@ -271,4 +291,12 @@ class UCBBandit:
         :param reward: Reward received from R(s, a).
         :param iteration: Current episode or iteration.
         """
-        _update_bandit(iteration=iteration, arm=arm, reward=reward, self=self, algorithm='ucb_bandit')
+        self.iteration = iteration
+        _update_bandit(arm=arm, reward=reward, self=self)
+
+    def end_iter(self):
+        """
+        Ends an iteration, saving the model when due.
+        """
+        save_model(iteration=self.iteration, algorithm='ucb_bandit', self=self)
+        _end_episode(props=self.props)
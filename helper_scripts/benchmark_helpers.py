@@ -0,0 +1,210 @@
+import copy
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+from helper_scripts.memory_helpers import get_peak_rss
+from helper_scripts.os_helpers import create_dir
+from helper_scripts.setup_helpers import create_input
+from src.engine import Engine
+
+# Every bundled topology
+TOPOLOGY_LIST = ['NSFNet', 'USNet', 'Pan-European', 'USbackbone60', 'Spainbackbone30']
+# Multi-core fibers with a crosstalk model
+CORES_LIST = [4, 7, 13, 19]
+# Slots per band of each band setup
+BANDS_DICT = {
+    'single_band': {'c_band': 128},
+    'multi_band': {'c_band': 128, 'l_band': 128},
+}
+ROUTE_LIST = ['k_shortest_path', 'shortest_path', 'least_congested', 'xt_aware', 'nli_aware']
+ALLOCATION_LIST = ['first_fit', 'last_fit', 'best_fit', 'priority_first', 'priority_last', 'xt_aware']
+SNR_LIST = [None, 'xt_calculation']
+# Every case varies one setting of this case
+BASE_CASE_DICT = {
+    'network': 'NSFNet',
+    'cores_per_link': 7,
+    'bands': 'single_band',
+    'route_method': 'k_shortest_path',
+    'allocation_method': 'first_fit',
+    'snr_type': None,
+}
+# The slowest methods simulate at most this many requests so the full suite finishes in minutes
+MAX_REQUESTS_DICT = {
+    ('route_method', 'xt_aware'): 100,
+    ('allocation_method', 'xt_aware'): 20,
+}
+# Benchmark results are saved under this date, so they never mix with simulation results
+BENCHMARK_DATE = 'benchmark'
+# Higher is better for these metrics, lower is better for every other metric
+HIGHER_BETTER_LIST = ['requests_per_s']
+COMPARE_KEY_LIST = ['requests_per_s', 'peak_rss_mb']
+
+
+def _get_case_name(case_dict: dict):
+    return '-'.join(str(case_dict[key]) for key in BASE_CASE_DICT)
+
+
+def get_cases(suite: str = 'full'):
+    """
+    Finds the benchmark cases of a suite. The full suite varies one setting at a time from the base case: the
+    topology, number of cores, bands, routing method, allocation method, and SNR type.
+
+    :param suite: The suite, quick runs only the base case and one case per topology.
+    :return: The name and settings of every case.
+    :rtype: dict
+    """
+    variations_list = [('network', TOPOLOGY_LIST)]
+    if suite == 'full':
+        variations_list += [('cores_per_link', CORES_LIST), ('bands', list(BANDS_DICT)), ('route_method', ROUTE_LIST),
+                            ('allocation_method', ALLOCATION_LIST), ('snr_type', SNR_LIST)]
+    elif suite != 'quick':
+        raise ValueError(f'Expected the quick or full suite, got: {suite}')
+
+    resp = {_get_case_name(case_dict=BASE_CASE_DICT): dict(BASE_CASE_DICT)}
+    for case_key, value_list in variations_list:
+        for value in value_list:
+            case_dict = dict(BASE_CASE_DICT, **{case_key: value})
+            resp.setdefault(_get_case_name(case_dict=case_dict), case_dict)
+
+    return resp
+
+
+def get_case_props(case_dict: dict, base_props: dict, sim_start: str):
+    """
+    Creates the engine properties of a benchmark case.
+
+    :param case_dict: The settings of the case.
+    :param base_props: The simulation properties every case starts from, e.g., from the benchmark configuration.
+    :param sim_start: The start time the input of the case is saved under.
+    :return: The engine properties.
+    :rtype: dict
+    """
+    engine_props = copy.deepcopy(base_props)
+    for case_key, value in case_dict.items():
+        if case_key == 'bands':
+            continue
+        engine_props[case_key] = value
+
+    for band in ['c', 'l', 's', 'o', 'e']:
+        engine_props[f'{band}_band'] = BANDS_DICT[case_dict['bands']].get(f'{band}_band')
+
+    for (case_key, value), max_requests in MAX_REQUESTS_DICT.items():
+        if case_dict.get(case_key) == value:
+            engine_props['num_requests'] = min(engine_props['num_requests'], max_requests)
+
+    engine_props['date'] = BENCHMARK_DATE
+    engine_props['sim_start'] = sim_start
+    engine_props['thread_num'] = 's1'
+    engine_props['phase_timing'] = True
+    erlang = float(engine_props['erlangs']['start'])
+    engine_props['erlang'] = erlang
+    engine_props['arrival_rate'] = (engine_props['cores_per_link'] * erlang) / engine_props['holding_time']
+
+    return engine_props
+
+
+def _remove_case_files(engine_props: dict, base_fp: str):
+    for dir_name in ['input', 'output']:
+        case_fp = os.path.join(base_fp, dir_name, engine_props['network'], BENCHMARK_DATE, engine_props['sim_start'])
+        if os.path.exists(case_fp):
+            shutil.rmtree(case_fp)
+        # Other benchmarks may still be running in the same directory
+        if os.path.isdir(os.path.dirname(case_fp)) and not os.listdir(os.path.dirname(case_fp)):
+            os.rmdir(os.path.dirname(case_fp))
+
+
+def run_case(case_dict: dict, base_props: dict, sim_start: str, base_fp: str = 'data'):
+    """
+    Runs the engine for a benchmark case. The peak memory is only that of the case if it runs in a fresh process.
+
+    :param case_dict: The settings of the case.
+    :param base_props: The simulation properties every case starts from.
+    :param sim_start: A unique start time, the input and output of the case are removed afterward.
+    :param base_fp: The base file path.
+    :return: The throughput, memory, phase times, and blocking of the case, or the error it raised.
+    :rtype: dict
+    """
+    engine_props = get_case_props(case_dict=case_dict, base_props=base_props, sim_start=sim_start)
+    resp = {'case_dict': case_dict}
+    try:
+        engine_props = create_input(base_fp=base_fp, engine_props=engine_props)
+        engine = Engine(engine_props=engine_props)
+        start_time = time.perf_counter()
+        engine.run()
+        seconds = time.perf_counter() - start_time
+    # Not every method supports every setup, the remaining cases are still worth running
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        resp['error'] = f'{type(error).__name__}: {error}'
+        return resp
+    finally:
+        _remove_case_files(engine_props=engine_props, base_fp=base_fp)
+
+    num_requests = engine_props['num_requests'] * (engine.iteration + 1)
+    resp.update({
+        'num_requests': num_requests,
+        'seconds': seconds,
+        'requests_per_s': num_requests / seconds,
+        'peak_rss_mb': get_peak_rss(),
+        'blocking_mean': float(np.mean(engine.stats_obj.stats_props.sim_block_list)),
+        'phase_times_dict': engine.timer_obj.get_stats(),
+    })
+    return resp
+
+
+def compare_results(results_dict: dict, baseline_dict: dict, threshold: float = 0.1):
+    """
+    Compares benchmark results to a baseline.
+
+    :param results_dict: The results of every case.
+    :param baseline_dict: The baseline results of every case.
+    :param threshold: The relative change of a metric that counts as a regression, e.g., 0.1 for ten percent.
+    :return: The case, metric, baseline value, new value, and relative change of every regression.
+    :rtype: list
+    """
+    resp = list()
+    for case_name, case_dict in results_dict.items():
+        baseline_case = baseline_dict.get(case_name)
+        if baseline_case is None or 'error' in case_dict or 'error' in baseline_case:
+            continue
+
+        for metric in COMPARE_KEY_LIST:
+            old_value, new_value = baseline_case.get(metric), case_dict.get(metric)
+            if not old_value or new_value is None:
+                continue
+
+            change = (new_value - old_value) / old_value
+            is_worse = -change > threshold if metric in HIGHER_BETTER_LIST else change > threshold
+            if is_worse:
+                resp.append((case_name, metric, old_value, new_value, change))
+
+    return resp
+
+
+def save_results(results_dict: dict, save_fp: str):
+    """
+    Saves benchmark results as JSON.
+
+    :param results_dict: The results of every case.
+    :param save_fp: The file path.
+    """
+    save_dir = os.path.dirname(save_fp)
+    if save_dir:
+        create_dir(save_dir)
+    with open(save_fp, 'w', encoding='utf-8') as file_obj:
+        json.dump(results_dict, file_obj, indent=4)
+
+
+def load_results(load_fp: str):
+    """
+    Loads benchmark results saved as JSON.
+
+    :param load_fp: The file path.
+    :return: The results of every case.
+    :rtype: dict
+    """
+    with open(load_fp, 'r', encoding='utf-8') as file_obj:
+        return json.load(file_obj)
@@ -0,0 +1,135 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+from functools import lru_cache
+
+from helper_scripts.os_helpers import create_dir
+
+# Keys that only identify a run (timestamps, output folders, live objects) and never change its results
+CACHE_IGNORE_LIST = ['date', 'sim_start', 'thread_num', 'band_list', 'topology', 'callback', 'use_cache',
+                     'print_step', 'save_step', 'config_path',
+                     # How a sweep is split up and dispatched, every point is keyed by its own Erlang
+                     'erlangs', 'thread_erlangs', 'num_workers', 'queue_dir', 'lease_time',
+                     # How results are written and reported, not what they are
+                     'async_writer', 'use_catalog', 'phase_timing', 'memory_report']
+# Source directories whose contents affect simulation results
+CODE_DIR_LIST = ['src', 'helper_scripts', 'arg_scripts', 'data_scripts']
+
+
+def _canonicalize(obj):
+    if isinstance(obj, dict):
+        return {str(key): _canonicalize(value) for key, value in sorted(obj.items(), key=lambda item: str(item[0]))}
+    if isinstance(obj, (list, tuple)):
+        return [_canonicalize(value) for value in obj]
+    if isinstance(obj, float) and obj.is_integer():
+        # 250 and 250.0 Erlang are the same sweep point
+        return int(obj)
+    if isinstance(obj, (str, int, bool)) or obj is None:
+        return obj
+
+    return str(obj)
+
+
+@lru_cache(maxsize=None)
+def get_code_version(base_dir: str = None):
+    """
+    Hashes every Python file the simulator depends on, any change to the code invalidates the cache.
+
+    :param base_dir: The repository root, defaults to the directory above this file.
+    :return: The hex digest of the code version.
+    :rtype: str
+    """
+    if base_dir is None:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    hash_obj = hashlib.sha256()
+    for code_dir in CODE_DIR_LIST:
+        for file_path in sorted(glob.glob(os.path.join(base_dir, code_dir, '**', '*.py'), recursive=True)):
+            hash_obj.update(os.path.relpath(file_path, base_dir).encode('utf-8'))
+            with open(file_path, 'rb') as file_obj:
+                hash_obj.update(file_obj.read())
+
+    return hash_obj.hexdigest()
+
+
+def get_cache_key(engine_props: dict):
+    """
+    Finds the content address of a single simulation, the effective engine properties (topology, modulation formats,
+    algorithm flags, Erlang, and seeds) plus the code version.
+
+    :param engine_props: Properties of the engine after input creation.
+    :return: The cache key.
+    :rtype: str
+    """
+    props_dict = {key: value for key, value in engine_props.items() if key not in CACHE_IGNORE_LIST}
+    key_dict = {'engine_props': _canonicalize(props_dict), 'code_version': get_code_version()}
+    key_str = json.dumps(key_dict, sort_keys=True, separators=(',', ':'))
+
+    return hashlib.sha256(key_str.encode('utf-8')).hexdigest()
+
+
+def _get_result_files(engine_props: dict, base_fp: str):
+    erlang = engine_props['erlang']
+    sim_info = os.path.join(engine_props['network'], engine_props['date'], engine_props['sim_start'])
+    resp = {f'{erlang}_erlang.json': os.path.join(base_fp, 'output', sim_info, engine_props['thread_num'],
+                                                  f'{erlang}_erlang.json')}
+    if engine_props.get('output_train_data'):
+        resp[f'{erlang}_train_data.csv'] = os.path.join(base_fp, 'output', sim_info, f'{erlang}_train_data.csv')
+
+    return resp
+
+
+def _link_file(src_fp: str, dest_fp: str):
+    create_dir(os.path.dirname(dest_fp))
+    if os.path.exists(dest_fp):
+        os.remove(dest_fp)
+    try:
+        os.link(src_fp, dest_fp)
+    # Different file systems or no hard link support
+    except OSError:
+        shutil.copy2(src_fp, dest_fp)
+
+
+def load_cached_result(engine_props: dict, base_fp: str = 'data'):
+    """
+    Links a cached result into the output tree of the current simulation.
+
+    :param engine_props: Properties of the engine after input creation.
+    :param base_fp: The base file path for the cache and output directories.
+    :return: If the result was found in the cache.
+    :rtype: bool
+    """
+    cache_fp = os.path.join(base_fp, 'cache', get_cache_key(engine_props=engine_props))
+    files_dict = _get_result_files(engine_props=engine_props, base_fp=base_fp)
+    for file_name in files_dict:
+        if not os.path.isfile(os.path.join(cache_fp, file_name)):
+            return False
+
+    for file_name, dest_fp in files_dict.items():
+        _link_file(src_fp=os.path.join(cache_fp, file_name), dest_fp=dest_fp)
+
+    return True
+
+
+def save_cached_result(engine_props: dict, base_fp: str = 'data'):
+    """
+    Stores the results of a finished simulation in the cache.
+
+    :param engine_props: Properties of the engine after input creation.
+    :param base_fp: The base file path for the cache and output directories.
+    """
+    cache_fp = os.path.join(base_fp, 'cache', get_cache_key(engine_props=engine_props))
+    files_dict = _get_result_files(engine_props=engine_props, base_fp=base_fp)
+    for file_name, src_fp in files_dict.items():
+        # Nothing was saved, e.g., the simulation was interrupted
+        if not os.path.isfile(src_fp):
+            return
+
+    create_dir(cache_fp)
+    for file_name, src_fp in files_dict.items():
+        # Write to a temporary file first so parallel workers never see a partial result
+        tmp_fp = os.path.join(cache_fp, f'.{file_name}.{os.getpid()}.tmp')
+        shutil.copy2(src_fp, tmp_fp)
+        os.replace(tmp_fp, os.path.join(cache_fp, file_name))
@@ -0,0 +1,283 @@
+import json
+import os
+import sqlite3
+
+CATALOG_NAME = 'catalog.sqlite'
+# Identifies the results of one Erlang in one simulation of a run
+RUN_KEY_LIST = ['network', 'date', 'sim_start', 'thread_num', 'erlang']
+# Scalar statistics of an iteration given their own column for fast queries
+METRIC_KEY_LIST = ['blocking_prob', 'bit_rate_blocking_prob', 'blocking_mean', 'bit_rate_blocking_mean', 'trans_mean',
+                   'hops_mean', 'lengths_mean', 'route_times_mean']
+# Too large to be useful in a catalog, still in the results JSON
+CATALOG_IGNORE_LIST = ['start_slot_list', 'end_slot_list']
+
+
+def get_catalog_fp(base_fp: str = 'data'):
+    """
+    Finds the catalog file path.
+
+    :param base_fp: The base file path, the catalog is saved in the output directory.
+    :return: The catalog file path.
+    :rtype: str
+    """
+    return os.path.join(base_fp, 'output', CATALOG_NAME)
+
+
+def _quote(name: str):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _connect(catalog_fp: str):
+    # Many simulations write to the same catalog, wait for the lock instead of failing
+    conn = sqlite3.connect(catalog_fp, timeout=60)
+    conn.execute('PRAGMA journal_mode=WAL')
+    keys_str = ', '.join(RUN_KEY_LIST)
+    conn.execute(f'CREATE TABLE IF NOT EXISTS configs (network TEXT, date TEXT, sim_start TEXT, thread_num TEXT, '
+                 f'erlang REAL, config_json TEXT, PRIMARY KEY ({keys_str}))')
+    metrics_str = ', '.join(f'{metric} REAL' for metric in METRIC_KEY_LIST)
+    conn.execute(f'CREATE TABLE IF NOT EXISTS results (network TEXT, date TEXT, sim_start TEXT, thread_num TEXT, '
+                 f'erlang REAL, iteration INTEGER, {metrics_str}, header_json TEXT, stats_json TEXT, '
+                 f'PRIMARY KEY ({keys_str}, iteration))')
+
+    return conn
+
+
+def _get_columns(conn: sqlite3.Connection, table: str):
+    return [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+
+
+def _get_config(engine_props: dict):
+    config_dict = dict()
+    for key, value in engine_props.items():
+        try:
+            json.dumps(value)
+        # Live objects, e.g., the topology graph
+        except TypeError:
+            continue
+        config_dict[key] = value
+
+    return config_dict
+
+
+def _add_config_columns(conn: sqlite3.Connection, config_dict: dict):
+    columns_list = _get_columns(conn=conn, table='configs')
+    for key, value in config_dict.items():
+        if key in columns_list or not isinstance(value, (str, int, float, bool)):
+            continue
+        try:
+            conn.execute(f'ALTER TABLE configs ADD COLUMN {_quote(key)}')
+        # Added by another simulation in the meantime
+        except sqlite3.OperationalError as error:
+            if 'duplicate column' not in str(error):
+                raise
+
+
+def _get_metrics(header_dict: dict, iter_dict: dict):
+    resp = {
+        'blocking_prob': iter_dict['sim_block_list'][-1] if iter_dict.get('sim_block_list') else None,
+        'bit_rate_blocking_prob': iter_dict['sim_br_block_list'][-1] if iter_dict.get('sim_br_block_list') else None,
+        'blocking_mean': header_dict.get('blocking_mean'),
+        'bit_rate_blocking_mean': header_dict.get('bit_rate_blocking_mean'),
+    }
+    for metric in ('trans_mean', 'hops_mean', 'lengths_mean', 'route_times_mean'):
+        resp[metric] = iter_dict.get(metric)
+
+    return resp
+
+
+def update_catalog(engine_props: dict, iteration: int, header_dict: dict, iter_dict: dict, base_fp: str = 'data'):
+    """
+    Adds or replaces the results of an iteration in the catalog.
+
+    :param engine_props: Properties from the engine class.
+    :param iteration: The iteration number.
+    :param header_dict: The overall statistics, e.g., the blocking mean and confidence interval.
+    :param iter_dict: The statistics of this iteration as saved in the results JSON.
+    :param base_fp: The base file path, the catalog is saved in the output directory.
+    """
+    catalog_fp = get_catalog_fp(base_fp=base_fp)
+    os.makedirs(os.path.dirname(catalog_fp), exist_ok=True)
+
+    key_list = [engine_props['network'], engine_props['date'], engine_props['sim_start'], engine_props['thread_num'],
+                float(engine_props['erlang'])]
+    config_dict = _get_config(engine_props=engine_props)
+    stats_dict = {key: value for key, value in iter_dict.items() if key not in CATALOG_IGNORE_LIST}
+    metrics_dict = _get_metrics(header_dict=header_dict, iter_dict=iter_dict)
+
+    conn = _connect(catalog_fp=catalog_fp)
+    try:
+        with conn:
+            _add_config_columns(conn=conn, config_dict=config_dict)
+            scalars_dict = {key: value for key, value in config_dict.items()
+                            if key not in RUN_KEY_LIST and isinstance(value, (str, int, float, bool))}
+            columns_list = RUN_KEY_LIST + ['config_json'] + list(scalars_dict)
+            values_list = key_list + [json.dumps(config_dict)] + list(scalars_dict.values())
+            conn.execute(f'INSERT OR REPLACE INTO configs ({", ".join(_quote(col) for col in columns_list)}) '
+                         f'VALUES ({", ".join("?" * len(values_list))})', values_list)
+
+            columns_list = RUN_KEY_LIST + ['iteration'] + METRIC_KEY_LIST + ['header_json', 'stats_json']
+            values_list = key_list + [iteration] + [metrics_dict[metric] for metric in METRIC_KEY_LIST] + \
+                [json.dumps(header_dict), json.dumps(stats_dict)]
+            conn.execute(f'INSERT OR REPLACE INTO results ({", ".join(columns_list)}) '
+                         f'VALUES ({", ".join("?" * len(values_list))})', values_list)
+    finally:
+        conn.close()
+
+
+def list_results(network: str, date: str, sim_start: str, catalog_fp: str):
+    """
+    Finds the simulations and Erlangs of a run in the catalog.
+
+    :param network: The network name.
+    :param date: The date of the run.
+    :param sim_start: The start time of the run.
+    :param catalog_fp: The catalog file path.
+    :return: The Erlangs, as in the results file names, of each simulation number.
+    :rtype: dict
+    """
+    if not os.path.isfile(catalog_fp):
+        return dict()
+
+    conn = _connect(catalog_fp=catalog_fp)
+    try:
+        rows_list = conn.execute('SELECT DISTINCT thread_num, erlang FROM results WHERE network = ? AND date = ? AND '
+                                 'sim_start = ? ORDER BY thread_num, erlang', (network, date, sim_start)).fetchall()
+    finally:
+        conn.close()
+
+    resp = dict()
+    for thread_num, erlang in rows_list:
+        resp.setdefault(thread_num, list()).append(str(erlang))
+
+    return resp
+
+
+def load_result(key_dict: dict, catalog_fp: str):
+    """
+    Rebuilds the input and results JSON of one Erlang from the catalog.
+
+    :param key_dict: The network, date, sim_start, thread_num, and erlang.
+    :param catalog_fp: The catalog file path.
+    :return: The input and output dictionaries, None for both if the catalog does not have them.
+    :rtype: tuple
+    """
+    if not os.path.isfile(catalog_fp):
+        return None, None
+
+    where_str = ' AND '.join(f'{key} = ?' for key in RUN_KEY_LIST)
+    values_list = [key_dict[key] for key in RUN_KEY_LIST[:-1]] + [float(key_dict['erlang'])]
+    conn = _connect(catalog_fp=catalog_fp)
+    try:
+        config_row = conn.execute(f'SELECT config_json FROM configs WHERE {where_str}', values_list).fetchone()
+        rows_list = conn.execute(f'SELECT iteration, header_json, stats_json FROM results WHERE {where_str} '
+                                 f'ORDER BY iteration', values_list).fetchall()
+    finally:
+        conn.close()
+
+    if config_row is None or not rows_list:
+        return None, None
+
+    output_dict = {'iter_stats': dict()}
+    for iteration, header_json, stats_json in rows_list:
+        output_dict['iter_stats'][str(iteration)] = json.loads(stats_json)
+        output_dict.update(json.loads(header_json))
+
+    return json.loads(config_row[0]), output_dict
+
+
+def list_runs(dates_dict: dict, catalog_fp: str):
+    """
+    Finds every simulation saved to the catalog on the given dates, whatever its configuration.
+
+    :param dates_dict: The dates to search and their network.
+    :param catalog_fp: The catalog file path.
+    :return: The date, network, start time, and simulation number of each simulation.
+    :rtype: set
+    """
+    if not os.path.isfile(catalog_fp) or not dates_dict:
+        return set()
+
+    conn = _connect(catalog_fp=catalog_fp)
+    try:
+        dates_str = ' OR '.join('(date = ? AND network = ?)' for _ in dates_dict)
+        values_list = [value for date, network in dates_dict.items() for value in (date, network)]
+        rows_list = conn.execute(f'SELECT DISTINCT date, network, sim_start, thread_num FROM configs WHERE {dates_str}',
+                                 values_list).fetchall()
+    finally:
+        conn.close()
+
+    return set(rows_list)
+
+
+def _get_filter_sql(filter_dict: dict, columns_list: list):
+    # Like the JSON filters, only the last key of each filter is compared
+    sql_list = list()
+    values_list = list()
+    for flags_list in filter_dict['and_filter_list']:
+        if flags_list[-2] not in columns_list:
+            return '0', list()
+        sql_list.append(f'{_quote(flags_list[-2])} = ?')
+        values_list.append(flags_list[-1])
+
+    or_list = [flags_list for flags_list in filter_dict['or_filter_list'] if flags_list[-2] in columns_list]
+    if filter_dict['or_filter_list']:
+        if not or_list:
+            return '0', list()
+        sql_list.append('(' + ' OR '.join(f'{_quote(flags_list[-2])} = ?' for flags_list in or_list) + ')')
+        values_list += [flags_list[-1] for flags_list in or_list]
+
+    for flags_list in filter_dict['not_filter_list']:
+        if flags_list[-2] in columns_list:
+            sql_list.append(f'{_quote(flags_list[-2])} IS NOT ?')
+            values_list.append(flags_list[-1])
+
+    return ' AND '.join(sql_list) if sql_list else '1', values_list
+
+
+def find_runs(dates_dict: dict, filter_dict: dict, catalog_fp: str):
+    """
+    Searches the catalog with the same filters as find_times.
+
+    :param dates_dict: The dates to search and their network.
+    :param filter_dict: A dictionary containing all search filters.
+    :param catalog_fp: The catalog file path.
+    :return: A dictionary with all times, sim numbers, networks, and dates that matched the filter dict.
+    :rtype: dict
+    """
+    resp = {
+        'times_matrix': list(),
+        'sims_matrix': list(),
+        'networks_matrix': list(),
+        'dates_matrix': list(),
+    }
+    if not os.path.isfile(catalog_fp) or not dates_dict:
+        return resp
+
+    conn = _connect(catalog_fp=catalog_fp)
+    try:
+        filter_str, values_list = _get_filter_sql(filter_dict=filter_dict,
+                                                  columns_list=_get_columns(conn=conn, table='configs'))
+        dates_str = ' OR '.join('(date = ? AND network = ?)' for _ in dates_dict)
+        for date, network in dates_dict.items():
+            values_list += [date, network]
+        rows_list = conn.execute(f'SELECT DISTINCT sim_start, thread_num, network, date FROM configs '
+                                 f'WHERE {filter_str} AND ({dates_str}) ORDER BY sim_start, thread_num',
+                                 values_list).fetchall()
+    finally:
+        conn.close()
+
+    info_dict = dict()
+    for sim_start, thread_num, network, date in rows_list:
+        if sim_start not in info_dict:
+            info_dict[sim_start] = {'sim_list': list(), 'network_list': list(), 'dates_list': list()}
+        info_dict[sim_start]['sim_list'].append(thread_num)
+        info_dict[sim_start]['network_list'].append(network)
+        info_dict[sim_start]['dates_list'].append(date)
+
+    for time, obj in info_dict.items():
+        resp['times_matrix'].append([time])
+        resp['sims_matrix'].append(obj['sim_list'])
+        resp['networks_matrix'].append(obj['network_list'])
+        resp['dates_matrix'].append(obj['dates_list'])
+
+    return resp
@@ -0,0 +1,120 @@
+import numpy as np
+
+# Allocation methods whose outcome only depends on whether a free window exists
+SUPPORTED_METHOD_LIST = ['first_fit', 'priority_first']
+PRIORITY_CORE_LIST = [0, 2, 4, 1, 3, 5, 6]
+
+
+class FeasibilityOracle:
+    """
+    Answers whether a request fits on each of several paths without allocating it, for the same network state as a
+    spectrum assignment would see. Answers are cached until the spectrum version changes, i.e., until the next
+    allocation or release.
+    """
+
+    def __init__(self, engine_props: dict):
+        self.engine_props = engine_props
+
+        self.version = None
+        # Kept so answers for a rebuilt network are never reused
+        self.net_spec_dict = None
+        # If every core has a free window, per path, band, and slots needed
+        self.windows_dict = dict()
+
+    def is_supported(self):
+        """
+        Checks if the oracle gives the same answers as the configured spectrum assignment, SNR checks and allocation
+        methods that do more than search for a free window are not supported.
+
+        :return: If queries are supported.
+        :rtype: bool
+        """
+        snr_type = self.engine_props['snr_type']
+        return self.engine_props['allocation_method'] in SUPPORTED_METHOD_LIST and snr_type in (None, 'None')
+
+    def _get_core_list(self):
+        if self.engine_props['allocation_method'] == 'priority_first':
+            return PRIORITY_CORE_LIST
+        return list(range(self.engine_props['cores_per_link']))
+
+    def _get_width(self, slots_needed: int, path_len: int):
+        guard_slots = self.engine_props['guard_slots']
+        # Other links are checked up to the guard band of the request after its guard band on the first link
+        if path_len > 2 and guard_slots > 0:
+            return slots_needed + 2 * guard_slots - 1
+        return slots_needed + guard_slots
+
+    def _find_windows(self, net_spec_dict: dict, path_list: list, band: str, slots_needed: int):
+        width = self._get_width(slots_needed=slots_needed, path_len=len(path_list))
+        key = (tuple(path_list), band, slots_needed)
+        if key in self.windows_dict:
+            return self.windows_dict[key]
+
+        link_list = [(path_list[0], path_list[1])]
+        # A single link path is only checked in its direction
+        if len(path_list) > 2:
+            link_list = list(zip(path_list, path_list[1:])) + list(zip(path_list[1:], path_list))
+
+        taken_arr = None
+        for link_tuple in link_list:
+            link_arr = net_spec_dict[link_tuple]['cores_matrix'][band] != 0
+            taken_arr = link_arr if taken_arr is None else taken_arr | link_arr
+
+        # The request and its guard band must fit in the band, the extra slots of the other links are cut off at
+        # its end, as if they were free
+        num_extra = max(0, width - slots_needed - self.engine_props['guard_slots'])
+        num_slots = taken_arr.shape[1] + num_extra
+        # A window is free where the count of free slots grows by its width
+        free_sum_arr = np.zeros((taken_arr.shape[0], num_slots + 1), dtype=np.int64)
+        free_sum_arr[:, 1:taken_arr.shape[1] + 1] = np.cumsum(~taken_arr, axis=1)
+        free_sum_arr[:, taken_arr.shape[1] + 1:] = free_sum_arr[:, [taken_arr.shape[1]]] + np.arange(1, num_extra + 1)
+        if width > num_slots:
+            resp = np.zeros(taken_arr.shape[0], dtype=bool)
+        else:
+            resp = np.any(free_sum_arr[:, width:] - free_sum_arr[:, :-width] == width, axis=1)
+
+        self.windows_dict[key] = resp
+        return resp
+
+    def _get_slots_needed(self, modulation: str, mod_formats_dict: dict):
+        if self.engine_props['fixed_grid']:
+            return 1
+        return mod_formats_dict[modulation]['slots_needed']
+
+    def check_paths(self, net_spec_dict: dict, version: int, paths_matrix: list, mod_formats_matrix: list,
+                    mod_formats_dict: dict, core_num: int = None):
+        """
+        Checks if a request fits on every candidate path.
+
+        :param net_spec_dict: The network spectrum database.
+        :param version: The version of the spectrum, cached answers are dropped when it changes.
+        :param paths_matrix: The candidate paths.
+        :param mod_formats_matrix: The valid modulation formats of each path, False if a format is out of reach.
+        :param mod_formats_dict: The slots needed by each modulation format of the request.
+        :param core_num: Only checks this core if given.
+        :return: If the request fits on each path.
+        :rtype: np.ndarray
+        """
+        if version != self.version or net_spec_dict is not self.net_spec_dict:
+            self.version = version
+            self.net_spec_dict = net_spec_dict
+            self.windows_dict = dict()
+
+        core_list = self._get_core_list() if core_num is None else [core_num]
+        resp = np.zeros(len(paths_matrix), dtype=bool)
+        for path_index, path_list in enumerate(paths_matrix):
+            for modulation in mod_formats_matrix[path_index]:
+                if modulation is False:
+                    continue
+
+                slots_needed = self._get_slots_needed(modulation=modulation, mod_formats_dict=mod_formats_dict)
+                for band in self.engine_props['band_list']:
+                    windows_arr = self._find_windows(net_spec_dict=net_spec_dict, path_list=path_list, band=band,
+                                                     slots_needed=slots_needed)
+                    if np.any(windows_arr[core_list]):
+                        resp[path_index] = True
+                        break
+                if resp[path_index]:
+                    break
+
+        return resp
@@ -0,0 +1,132 @@
+import os
+import sys
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # pragma: no cover, not available on Windows
+    resource = None
+
+# Allocations are attributed to the component of the file that made them
+COMPONENT_DICT = {
+    'engine.py': 'engine',
+    'request_generator.py': 'requests',
+    'trace_helpers.py': 'requests',
+    'sdn_controller.py': 'sdn',
+    'sdn_args.py': 'sdn',
+    'routing.py': 'routing',
+    'routing_helpers.py': 'routing',
+    'spectrum_assignment.py': 'spectrum',
+    'spectrum_helpers.py': 'spectrum',
+    'snr_measurements.py': 'snr',
+    'snr_helpers.py': 'snr',
+    'stats_helpers.py': 'stats',
+    'aggregate_helpers.py': 'stats',
+    'stats_args.py': 'stats',
+}
+# Third-party packages reported as their own component
+PACKAGE_LIST = ['networkx', 'numpy', 'pandas']
+NUM_TOP = 5
+
+
+def get_peak_rss():
+    """
+    Finds the peak resident set size of this process.
+
+    :return: The peak in megabytes, None if the platform does not report it.
+    :rtype: float
+    """
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    if sys.platform == 'darwin':
+        return peak_rss / 2 ** 20
+    return peak_rss / 2 ** 10
+
+
+def _get_component(file_path: str):
+    component = COMPONENT_DICT.get(os.path.basename(file_path))
+    if component is not None:
+        return component
+
+    dir_list = file_path.replace('\\', '/').split('/')
+    for package in PACKAGE_LIST:
+        if package in dir_list:
+            return package
+
+    return 'other'
+
+
+class MemoryTracker:
+    """
+    Accounts the memory held by each component of the simulation with tracemalloc. Tracing slows the simulation down,
+    so it is only enabled for memory reports.
+    """
+
+    def __init__(self):
+        # Another tool may already be tracing, e.g., a profiler, leave it running in that case
+        self.is_owner = not tracemalloc.is_tracing()
+        if self.is_owner:
+            tracemalloc.start()
+
+    def get_report(self, counts_dict: dict = None):
+        """
+        Measures the memory currently held by each component.
+
+        :param counts_dict: The number of entries of containers that grow with the number of requests.
+        :return: The traced memory, its peak, and the peak resident set size in megabytes, the memory held by each
+            component, the largest allocation sites, and the container counts.
+        :rtype: dict
+        """
+        snapshot_obj = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ])
+        components_dict = dict()
+        for stat_obj in snapshot_obj.statistics('filename'):
+            component = _get_component(file_path=stat_obj.traceback[0].filename)
+            components_dict[component] = components_dict.get(component, 0.0) + stat_obj.size / 2 ** 20
+
+        top_list = list()
+        for stat_obj in snapshot_obj.statistics('lineno')[:NUM_TOP]:
+            frame_obj = stat_obj.traceback[0]
+            top_list.append([f'{os.path.basename(frame_obj.filename)}:{frame_obj.lineno}', stat_obj.size / 2 ** 20])
+
+        traced_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        return {
+            'traced_mb': traced_bytes / 2 ** 20,
+            'peak_traced_mb': peak_bytes / 2 ** 20,
+            'peak_rss_mb': get_peak_rss(),
+            'components_dict': dict(sorted(components_dict.items(), key=lambda item: -item[1])),
+            'top_list': top_list,
+            'counts_dict': counts_dict or dict(),
+        }
+
+    @staticmethod
+    def get_summary_list(report_dict: dict):
+        """
+        Gets readable lines of a memory report.
+
+        :param report_dict: The report from get_report.
+        :return: The summary lines.
+        :rtype: list
+        """
+        peak_rss = report_dict['peak_rss_mb']
+        rss_str = 'unknown' if peak_rss is None else f'{peak_rss:.2f} MB'
+        resp = [f"traced: {report_dict['traced_mb']:.2f} MB, peak traced: {report_dict['peak_traced_mb']:.2f} MB, "
+                f"peak RSS: {rss_str}"]
+        resp.append(', '.join(f'{component}: {size_mb:.2f} MB'
+                              for component, size_mb in report_dict['components_dict'].items()))
+        if report_dict['counts_dict']:
+            resp.append(', '.join(f'{name}: {count}' for name, count in report_dict['counts_dict'].items()))
+
+        return resp
+
+    def stop(self):
+        """
+        Stops tracing if this tracker started it.
+        """
+        if self.is_owner and tracemalloc.is_tracing():
+            tracemalloc.stop()
@@ -0,0 +1,211 @@
+import timeit
+
+import numpy as np
+
+from arg_scripts.sdn_args import SDNProps
+from arg_scripts.spectrum_args import SpectrumProps
+from helper_scripts.sim_helpers import find_free_channels, find_taken_channels, find_free_slots, get_channel_overlaps
+from helper_scripts.sim_helpers import get_hfrag, get_super_channels, find_core_frag_cong, find_path_cong
+from helper_scripts.spectrum_helpers import SpectrumHelpers
+
+SLOTS_LIST = [128, 256, 512, 1024, 2048, 4096, 8192]
+CORES_LIST = [4, 7, 13, 19]
+# Number of links on the path
+PATH_LEN_LIST = [1, 2, 4, 8]
+# Fraction of the slots that are taken
+OCCUPANCY_LIST = [0.1, 0.3, 0.5, 0.7, 0.9]
+# Every curve varies one setting of this setup, 256 slots is the only size find_core_frag_cong supports
+BASE_SETUP_DICT = {'num_slots': 256, 'num_cores': 7, 'path_len': 4, 'occupancy': 0.5}
+AXIS_DICT = {
+    'num_slots': SLOTS_LIST,
+    'num_cores': CORES_LIST,
+    'path_len': PATH_LEN_LIST,
+    'occupancy': OCCUPANCY_LIST,
+}
+# The request size and largest channel of the generated spectrum
+SLOTS_NEEDED = 4
+MAX_CHANNEL_LEN = 9
+GUARD_SLOTS = 1
+
+
+def _fill_core(core_arr: np.array, occupancy: float, rng: np.random.Generator, req_id: int):
+    # Alternates free gaps and allocated channels, each ending with a guard slot, until the target is reached
+    num_slots = len(core_arr)
+    mean_gap = (2 + MAX_CHANNEL_LEN) / 2 * (1 - occupancy) / occupancy
+    slot_index = 0
+    while slot_index < num_slots:
+        slot_index += int(round(rng.exponential(mean_gap)))
+        channel_len = int(rng.integers(2, MAX_CHANNEL_LEN + 1))
+        end_index = min(slot_index + channel_len, num_slots)
+        if end_index - slot_index < 2:
+            break
+        core_arr[slot_index:end_index - 1] = req_id
+        core_arr[end_index - 1] = -req_id
+        slot_index = end_index
+        req_id += 1
+
+    return req_id
+
+
+def create_spectrum(num_slots: int, num_cores: int, path_len: int, occupancy: float, seed: int = 0):
+    """
+    Creates a path whose links are partly taken by allocated channels and guard bands.
+
+    :param num_slots: The number of spectral slots on every core.
+    :param num_cores: The number of cores on every link.
+    :param path_len: The number of links on the path.
+    :param occupancy: Roughly the fraction of taken slots, greater than zero.
+    :param seed: The random seed.
+    :return: The path and the network spectrum database of its links in both directions.
+    :rtype: tuple
+    """
+    rng = np.random.default_rng(seed)
+    path_list = list(range(path_len + 1))
+    net_spec_dict = dict()
+    req_id = 1
+    for link_num, (source, dest) in enumerate(zip(path_list, path_list[1:])):
+        cores_matrix = {'c': np.zeros((num_cores, num_slots))}
+        for core_arr in cores_matrix['c']:
+            req_id = _fill_core(core_arr=core_arr, occupancy=occupancy, rng=rng, req_id=req_id)
+
+        net_spec_dict[(source, dest)] = {'cores_matrix': cores_matrix, 'link_num': link_num}
+        net_spec_dict[(dest, source)] = {'cores_matrix': cores_matrix, 'link_num': link_num}
+
+    return path_list, net_spec_dict
+
+
+def _get_spectrum_helpers(path_list: list, net_spec_dict: dict):
+    engine_props = {'guard_slots': GUARD_SLOTS, 'allocation_method': 'first_fit'}
+    sdn_props = SDNProps()
+    sdn_props.net_spec_dict = net_spec_dict
+    spectrum_props = SpectrumProps()
+    spectrum_props.path_list = path_list
+    spectrum_props.slots_needed = SLOTS_NEEDED
+    spec_help_obj = SpectrumHelpers(engine_props=engine_props, sdn_props=sdn_props, spectrum_props=spectrum_props)
+    spec_help_obj.curr_band = 'c'
+
+    return spec_help_obj
+
+
+def get_primitives(path_list: list, net_spec_dict: dict):
+    """
+    Binds every spectrum primitive to a spectrum, ready to be timed.
+
+    :param path_list: The path.
+    :param net_spec_dict: The network spectrum database of the path.
+    :return: A function with no arguments for each primitive.
+    :rtype: dict
+    """
+    link_tuple = (path_list[0], path_list[1])
+    num_slots = net_spec_dict[link_tuple]['cores_matrix']['c'].shape[1]
+    free_channels_dict = {link_tuple: find_free_channels(net_spec_dict=net_spec_dict, slots_needed=SLOTS_NEEDED,
+                                                         link_tuple=link_tuple)}
+    free_slots_dict = {link_tuple: find_free_slots(net_spec_dict=net_spec_dict, link_tuple=link_tuple)}
+
+    spec_help_obj = _get_spectrum_helpers(path_list=path_list, net_spec_dict=net_spec_dict)
+    open_slots_list = list()
+    for core_arr in net_spec_dict[link_tuple]['cores_matrix']['c']:
+        open_slots_arr = np.where(core_arr == 0)[0]
+        open_slots_list.append(np.split(open_slots_arr, np.where(np.diff(open_slots_arr) != 1)[0] + 1))
+
+    def _check_super_channels():
+        # First fit over the cores, as in the spectrum assignment
+        for core_num, open_slots_matrix in enumerate(open_slots_list):
+            spec_help_obj.core_num = core_num
+            if spec_help_obj.check_super_channels(open_slots_matrix=open_slots_matrix, flag='first_fit'):
+                return
+
+    return {
+        'find_free_channels': lambda: find_free_channels(net_spec_dict=net_spec_dict, slots_needed=SLOTS_NEEDED,
+                                                         link_tuple=link_tuple),
+        'find_taken_channels': lambda: find_taken_channels(net_spec_dict=net_spec_dict, link_tuple=link_tuple),
+        'get_channel_overlaps': lambda: get_channel_overlaps(free_channels_dict=free_channels_dict,
+                                                             free_slots_dict=free_slots_dict),
+        'get_hfrag': lambda: get_hfrag(path_list=path_list, core_num=0, band='c', slots_needed=SLOTS_NEEDED,
+                                       spectral_slots=num_slots, net_spec_dict=net_spec_dict),
+        'get_super_channels': lambda: get_super_channels(input_arr=net_spec_dict[link_tuple]['cores_matrix']['c'][0],
+                                                         slots_needed=SLOTS_NEEDED),
+        'find_core_frag_cong': lambda: find_core_frag_cong(net_spec_db=net_spec_dict, path=path_list, core=0,
+                                                           band='c'),
+        'find_path_cong': lambda: find_path_cong(path_list=path_list, net_spec_dict=net_spec_dict, band='c'),
+        'check_super_channels': _check_super_channels,
+    }
+
+
+def time_primitive(func, min_time: float = 0.05, num_repeats: int = 3):
+    """
+    Times a function with enough calls per measurement to be accurate, a function slower than the least time is
+    only called once.
+
+    :param func: The function with no arguments.
+    :param min_time: The least time in seconds of one measurement.
+    :param num_repeats: The number of measurements, the fastest is kept.
+    :return: The seconds per call.
+    :rtype: float
+    """
+    timer_obj = timeit.Timer(func)
+    resp = timer_obj.timeit(number=1)
+    if resp >= min_time:
+        return resp
+
+    num_calls = int(min_time / max(resp, 1e-9)) + 1
+    for _ in range(num_repeats):
+        resp = min(resp, timer_obj.timeit(number=num_calls) / num_calls)
+
+    return resp
+
+
+def get_setups(axis_list: list = None):
+    """
+    Finds the spectrum setups of every scaling curve, each curve varies one setting of the base setup.
+
+    :param axis_list: The settings to vary, defaults to every setting.
+    :return: The varied setting and the setup of every point.
+    :rtype: list
+    """
+    resp = list()
+    for axis in axis_list or list(AXIS_DICT):
+        for value in AXIS_DICT[axis]:
+            resp.append((axis, dict(BASE_SETUP_DICT, **{axis: value})))
+
+    return resp
+
+
+def run_microbenchmarks(axis_list: list = None, primitive_list: list = None, max_seconds: float = 1.0,
+                        min_time: float = 0.05):
+    """
+    Times every spectrum primitive along every scaling curve. A primitive is not timed at larger values of a curve
+    once one call took longer than the limit.
+
+    :param axis_list: The settings to vary, defaults to every setting.
+    :param primitive_list: The primitives to time, defaults to every primitive.
+    :param max_seconds: The most time in seconds one call may take.
+    :param min_time: The least time in seconds of one measurement.
+    :return: One row per varied setting, setup, and primitive with the seconds per call, the error, or a skip.
+    :rtype: list
+    """
+    resp = list()
+    stopped_set = set()
+    for axis, setup_dict in get_setups(axis_list=axis_list):
+        path_list, net_spec_dict = create_spectrum(**setup_dict)
+        primitives_dict = get_primitives(path_list=path_list, net_spec_dict=net_spec_dict)
+        for primitive, func in primitives_dict.items():
+            if primitive_list and primitive not in primitive_list:
+                continue
+
+            row_dict = dict(setup_dict, axis=axis, primitive=primitive, seconds=None, error=None)
+            resp.append(row_dict)
+            if (axis, primitive) in stopped_set:
+                row_dict['error'] = 'skipped'
+                continue
+
+            try:
+                row_dict['seconds'] = time_primitive(func=func, min_time=min_time)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                row_dict['error'] = f'{type(error).__name__}: {error}'
+                continue
+
+            if row_dict['seconds'] > max_seconds:
+                stopped_set.add((axis, primitive))
+
+    return resp
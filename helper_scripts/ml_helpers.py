@@ -1,4 +1,5 @@
 import os
+import warnings
 
 import pandas as pd
 import numpy as np
@@ -12,6 +13,10 @@ from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_sc
 from helper_scripts.os_helpers import create_dir
 from helper_scripts.sim_helpers import find_path_len, find_core_cong
 
+# The features of an observation, in the order deployed models are trained on
+FEATURE_LIST = ['path_length', 'longest_reach', 'ave_cong', 'old_bandwidth_50', 'old_bandwidth_100',
+                'old_bandwidth_200', 'old_bandwidth_400']
+
 
 def _plot_pie(input_df: pd.DataFrame, erlang: float, save_fp: str):
     for column in ['old_bandwidth', 'num_segments', 'longest_reach']:
@@ -61,24 +66,79 @@ def plot_data(sim_dict: dict, input_df: pd.DataFrame, erlang: float):
     _plot_hist(erlang=erlang, input_df=input_df, save_fp=save_fp)
 
 
-def _get_ml_obs(tmp_dict: dict, engine_props: dict, sdn_props: object):
-    df_processed = pd.DataFrame(tmp_dict, index=[0])
-    df_processed = pd.get_dummies(df_processed, columns=['old_bandwidth'])
-
-    for col in df_processed.columns:
-        if df_processed[col].dtype == bool:
-            df_processed[col] = df_processed[col].astype(int)
-
-    for bandwidth, percent in engine_props['request_distribution'].items():
-        if percent > 0:
-            if bandwidth != sdn_props.bandwidth:
-                df_processed[f'old_bandwidth_{bandwidth}'] = 0
-
-    column_order_list = ['path_length', 'longest_reach', 'ave_cong', 'old_bandwidth_50',
-                         'old_bandwidth_100', 'old_bandwidth_200', 'old_bandwidth_400']
-    df_processed = df_processed.reindex(columns=column_order_list)
+class FeatureEncoder:
+    """
+    Encodes the observations of a deployed machine learning model straight into numpy rows, one per candidate path,
+    so every path of a request is scored by a single prediction.
+    """
 
-    return df_processed
+    def __init__(self, engine_props: dict):
+        self.engine_props = engine_props
+        self.obs_matrix = np.zeros((engine_props['k_paths'], len(FEATURE_LIST)))
+        self.cong_arr = np.zeros(engine_props['cores_per_link'])
+        self.bandwidth_dict = {feature.split('_')[-1]: feature_index
+                               for feature_index, feature in enumerate(FEATURE_LIST)
+                               if feature.startswith('old_bandwidth_')}
+
+    def _encode_path(self, req_dict: dict, path_list: list, net_spec_dict: dict, obs_arr: np.array):
+        for core_num in range(len(self.cong_arr)):
+            self.cong_arr[core_num] = find_core_cong(core_index=core_num, net_spec_dict=net_spec_dict,
+                                                     path_list=path_list)
+
+        obs_arr[0] = find_path_len(path_list=path_list, topology=self.engine_props['topology'])
+        obs_arr[1] = req_dict['mod_formats']['QPSK']['max_length']
+        obs_arr[2] = float(np.mean(self.cong_arr))
+        # One-hot encoded bandwidth, a bandwidth the model was not trained on has no column
+        obs_arr[3:] = 0
+        bandwidth_index = self.bandwidth_dict.get(str(req_dict['bandwidth']))
+        if bandwidth_index is not None:
+            obs_arr[bandwidth_index] = 1
+
+    def get_obs_matrix(self, req_dict: dict, paths_matrix: list, net_spec_dict: dict):
+        """
+        Creates the observations of a request for every path, in the columns of FEATURE_LIST.
+
+        :param req_dict: Holds request information.
+        :param paths_matrix: The paths to create observations for.
+        :param net_spec_dict: The network spectrum database.
+        :return: One observation per path, a view of a reused matrix.
+        :rtype: np.array
+        """
+        if len(paths_matrix) > len(self.obs_matrix):
+            self.obs_matrix = np.zeros((len(paths_matrix), len(FEATURE_LIST)))
+
+        for path_index, path_list in enumerate(paths_matrix):
+            self._encode_path(req_dict=req_dict, path_list=path_list, net_spec_dict=net_spec_dict,
+                              obs_arr=self.obs_matrix[path_index])
+
+        return self.obs_matrix[:len(paths_matrix)]
+
+    def predict(self, model, req_dict: dict, paths_matrix: list, net_spec_dict: dict):
+        """
+        Predicts the number of segments of a request on every path, with one call to the model.
+
+        :param model: The trained model.
+        :param req_dict: Holds request information.
+        :param paths_matrix: The candidate paths, a path may be False.
+        :param net_spec_dict: The network spectrum database.
+        :return: The prediction for every path, None for paths that are False.
+        :rtype: list
+        """
+        resp_list = [None] * len(paths_matrix)
+        path_index_list = [path_index for path_index, path_list in enumerate(paths_matrix) if path_list is not False]
+        if not path_index_list:
+            return resp_list
+
+        obs_matrix = self.get_obs_matrix(req_dict=req_dict, net_spec_dict=net_spec_dict,
+                                         paths_matrix=[paths_matrix[path_index] for path_index in path_index_list])
+        with warnings.catch_warnings():
+            # Models are trained on data frames, their columns were checked when the model was loaded
+            warnings.filterwarnings('ignore', message='X does not have valid feature names')
+            pred_arr = model.predict(obs_matrix)
+
+        for row_index, path_index in enumerate(path_index_list):
+            resp_list[path_index] = pred_arr[row_index]
+        return resp_list
 
 
 def get_ml_obs(req_dict: dict, engine_props: dict, sdn_props: object):
@@ -91,26 +151,26 @@ def get_ml_obs(req_dict: dict, engine_props: dict, sdn_props: object):
     :return: The correctly formatted observation.
     :rtype: pd.DataFrame
     """
-    path_length = find_path_len(path_list=sdn_props.path_list, topology=engine_props['topology'])
-    cong_arr = np.array([])
-    for core_num in range(engine_props['cores_per_link']):
-        curr_cong = find_core_cong(core_index=core_num, net_spec_dict=sdn_props.net_spec_dict,
-                                   path_list=sdn_props.path_list)
-        cong_arr = np.append(cong_arr, curr_cong)
+    encoder_obj = FeatureEncoder(engine_props=engine_props)
+    obs_matrix = encoder_obj.get_obs_matrix(req_dict=req_dict, paths_matrix=[sdn_props.path_list],
+                                            net_spec_dict=sdn_props.net_spec_dict)
+    return pd.DataFrame(obs_matrix, columns=FEATURE_LIST)
 
-    tmp_dict = {
-        'old_bandwidth': req_dict['bandwidth'],
-        'path_length': path_length,
-        'longest_reach': req_dict['mod_formats']['QPSK']['max_length'],
-        'ave_cong': float(np.mean(cong_arr)),
-    }
 
-    return _get_ml_obs(engine_props=engine_props, sdn_props=sdn_props, tmp_dict=tmp_dict)
+def check_features(model):
+    """
+    Checks that a trained model expects the columns of FEATURE_LIST, in the same order.
+
+    :param model: The trained model.
+    """
+    feature_list = [str(feature) for feature in getattr(model, 'feature_names_in_', FEATURE_LIST)]
+    if feature_list != FEATURE_LIST:
+        raise ValueError(f"The model was trained on the features {feature_list}, expected {FEATURE_LIST}.")
 
 
 def load_model(engine_props: dict):
     """
-    Loads a trained machine learning model.
+    Loads a trained machine learning model, and checks the features it expects.
 
     :param engine_props: Properties from engine.
     :return: The trained model.
@@ -119,6 +179,7 @@ def load_model(engine_props: dict):
     model_fp = os.path.join('logs', engine_props['ml_model'], engine_props['train_file_path'],
                             f"{engine_props['ml_model']}_{str(int(engine_props['erlang']))}.joblib")
     resp = joblib.load(filename=model_fp)
+    check_features(model=resp)
 
     return resp
 
@@ -270,6 +331,8 @@ def plot_confusion(sim_dict: dict, y_test: np.array, y_pred: np.array, erlang: s
     :param y_pred: Predictions.
     :param erlang: The Erlang value.
     :param algorithm: The algorithm used.
+    :return: The accuracy, precision, recall, and F1 score.
+    :rtype: dict
     """
     accuracy = accuracy_score(y_test, y_pred)
     precision = precision_score(y_test, y_pred, average='weighted')
@@ -288,6 +351,8 @@ def plot_confusion(sim_dict: dict, y_test: np.array, y_pred: np.array, erlang: s
     _plot_confusion(y_test=y_test, y_pred=y_pred, accuracy=accuracy, precision=precision, recall=recall,
                     f_score=f_score, sim_dict=sim_dict, erlang=erlang)
 
+    return {'accuracy': accuracy, 'precision': precision, 'recall': recall, 'f_score': f_score}
+
 
 def plot_2d_clusters(df_pca: pd.DataFrame):
     """
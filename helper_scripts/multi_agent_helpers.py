@@ -6,6 +6,7 @@ from gymnasium import spaces
 from .ql_helpers import QLearningHelpers
 from .bandit_helpers import EpsilonGreedyBandit
 from .bandit_helpers import UCBBandit, get_q_table
+from .random_helpers import get_uniform_rv, get_random_int
 
 EPISODIC_STRATEGIES = ['exp_decay', 'linear_decay']
 
@@ -212,6 +213,8 @@ class PathAgent:
         self.rl_help_obj = rl_help_obj
         self.agent_obj = None
         self.context_obj = None
+        # Independent random stream, None uses the global numpy state
+        self.rng = None
 
         self.level_index = None
         self.cong_list = None
@@ -231,6 +234,8 @@ class PathAgent:
                 self.hyperparam_obj.update_alpha()
         if self.hyperparam_obj.epsilon_strategy in EPISODIC_STRATEGIES:
             self.hyperparam_obj.update_eps()
+        if 'bandit' in self.path_algorithm:
+            self.agent_obj.end_iter()
 
     def setup_env(self):
         """
@@ -306,7 +311,7 @@ class PathAgent:
 
     def __ql_route(self, random_float: float):
         if random_float < self.hyperparam_obj.curr_epsilon:
-            self.rl_props.chosen_path_index = np.random.choice(self.rl_props.k_paths)
+            self.rl_props.chosen_path_index = get_random_int(high=self.rl_props.k_paths, rng=self.rng)
             # The level will always be the last index
             self.level_index = self.cong_list[self.rl_props.chosen_path_index][-1]
 
@@ -319,13 +324,10 @@ class PathAgent:
             self.level_index = self.cong_list[self.rl_props.chosen_path_index][-1]
 
     def _ql_route(self):
-        random_float = float(np.round(np.random.uniform(0, 1), decimals=1))
-        routes_matrix = self.agent_obj.props.routes_matrix
-        self.rl_props.paths_list = routes_matrix[self.rl_props.source][self.rl_props.destination]['path']
-
+        random_float = float(np.round(get_uniform_rv(rng=self.rng), decimals=1))
+        self.rl_props.paths_list = self.agent_obj.get_paths(source=self.rl_props.source,
+                                                            destination=self.rl_props.destination)
         self.cong_list = self.rl_help_obj.classify_paths(paths_list=self.rl_props.paths_list)
-        if self.rl_props.paths_list.ndim != 1:
-            self.rl_props.paths_list = self.rl_props.paths_list[:, 0]
 
         self.__ql_route(random_float=random_float)
 
@@ -363,8 +365,8 @@ class PathAgent:
         """
         self.setup_env()
         if self.engine_props['path_algorithm'] == 'q_learning':
-            model_path = os.path.join('logs', model_path, f'e{erlang}_routes_c{num_cores}.npy')
-            self.agent_obj.props.routes_matrix = np.load(model_path, allow_pickle=True)
+            model_path = os.path.join('logs', model_path, f'e{erlang}_routes_c{num_cores}.npz')
+            self.agent_obj.load_model(model_fp=model_path, matrix_flag='routes_matrix')
 
 
 # TODO: This class is no longer supported
@@ -379,6 +381,8 @@ class CoreAgent:
         self.engine_props = None
         self.agent_obj = None
         self.rl_help_obj = rl_help_obj
+        # Independent random stream, None uses the global numpy state
+        self.rng = None
 
         self.level_index = None
         self.cong_list = list()
@@ -389,7 +393,10 @@ class CoreAgent:
         """
         Ends an iteration for the core agent.
         """
-        raise NotImplementedError
+        if 'bandit' not in self.core_algorithm:
+            raise NotImplementedError
+
+        self.agent_obj.end_iter()
 
     def setup_env(self):
         """
@@ -479,14 +486,16 @@ class CoreAgent:
             raise NotImplementedError
 
     def _ql_core(self):
-        random_float = np.round(np.random.uniform(0, 1), decimals=1)
+        random_float = np.round(get_uniform_rv(rng=self.rng), decimals=1)
         cores_matrix = self.agent_obj.props.cores_matrix
-        cores_matrix = cores_matrix[self.rl_props.source][self.rl_props.destination]
-        self.rl_props.cores_list = cores_matrix[self.rl_props.chosen_path_index]
-        self.cong_list = self.rl_help_obj.classify_cores(cores_list=self.rl_props.cores_list)
+        self.rl_props.cores_list = cores_matrix[self.rl_props.source, self.rl_props.destination,
+                                                self.rl_props.chosen_path_index]
+        path_list = self.agent_obj.get_paths(source=self.rl_props.source, destination=self.rl_props.destination)
+        self.cong_list = self.rl_help_obj.classify_cores(cores_list=self.rl_props.cores_list,
+                                                         path_list=path_list[self.rl_props.chosen_path_index])
 
         if random_float < self.agent_obj.props.epsilon:
-            self.rl_props.core_index = np.random.randint(0, self.engine_props['cores_per_link'])
+            self.rl_props.core_index = get_random_int(high=self.engine_props['cores_per_link'], rng=self.rng)
             self.level_index = self.cong_list[self.rl_props.core_index][-1]
         else:
             self.rl_props.core_index, self.rl_props.chosen_core = self.agent_obj.get_max_curr_q(
@@ -523,8 +532,8 @@ class CoreAgent:
         """
         self.setup_env()
         if self.core_algorithm == 'q_learning':
-            model_path = os.path.join('logs', model_path, f'e{erlang}_cores_c{num_cores}.npy')
-            self.agent_obj.props.cores_matrix = np.load(model_path, allow_pickle=True)
+            model_path = os.path.join('logs', model_path, f'e{erlang}_cores_c{num_cores}.npz')
+            self.agent_obj.load_model(model_fp=model_path, matrix_flag='cores_matrix')
 
 
 # TODO: This class is no longer supported
@@ -0,0 +1,55 @@
+import numpy as np
+
+# Request numbers and their negated guard bands fit in 32 bits, half the memory of the default float64
+COMPACT_DTYPE = np.int32
+
+
+def create_occupancy(cores_matrix: dict):
+    """
+    Packs the occupancy of every core into bits, one bit per spectral slot, set if the slot is taken.
+
+    :param cores_matrix: The cores of every band of a link.
+    :return: The packed occupancy of every band, one row of bytes per core.
+    :rtype: dict
+    """
+    return {band: np.packbits(cores_arr != 0, axis=-1) for band, cores_arr in cores_matrix.items()}
+
+
+def update_occupancy(link_dict: dict, band: str, core_num: int):
+    """
+    Repacks the occupancy of a core after its spectrum changed.
+
+    :param link_dict: The link holding the cores and their packed occupancy.
+    :param band: The band of the core.
+    :param core_num: The core number.
+    """
+    link_dict['occupied_matrix'][band][core_num] = np.packbits(link_dict['cores_matrix'][band][core_num] != 0)
+
+
+def _get_range_mask(start_slot: int, end_slot: int):
+    first_word, last_word = start_slot >> 3, (end_slot - 1) >> 3
+    # Bits are packed with the first slot in the highest bit of each byte
+    mask = ((1 << (end_slot - start_slot)) - 1) << (((last_word + 1) << 3) - end_slot)
+    return first_word, last_word, mask
+
+
+def is_range_free(occupied_list: list, start_slot: int, end_slot: int):
+    """
+    Checks if a range of slots is free on every core, e.g., the same core on every link of a path. Only the bytes
+    holding the range are compared, as one integer per core.
+
+    :param occupied_list: The packed occupancy of every core to check.
+    :param start_slot: The first slot of the range.
+    :param end_slot: The slot after the last slot of the range.
+    :return: If the range is free on every core, an empty range is never free.
+    :rtype: bool
+    """
+    if end_slot <= start_slot:
+        return False
+
+    first_word, last_word, mask = _get_range_mask(start_slot=start_slot, end_slot=end_slot)
+    for occupied_arr in occupied_list:
+        if int.from_bytes(occupied_arr[first_word:last_word + 1].tobytes(), 'big') & mask:
+            return False
+
+    return True
@@ -0,0 +1,91 @@
+import os
+import concurrent.futures
+
+import optuna
+from optuna.study import MaxTrialsCallback
+
+# Intermediate values reported before a trial may be pruned, one per arrival rate
+WARMUP_STEPS = 1
+# Trials finished before the median pruner starts pruning
+STARTUP_TRIALS = 5
+
+
+def get_storage(storage_type: str, save_dir: str):
+    """
+    Gets the storage shared by every process running trials of a study, kept on the local disk.
+
+    :param storage_type: Either sqlite or journal, anything else keeps the study in memory.
+    :param save_dir: The directory to keep the storage file in.
+    :return: The storage, or None to keep the study in memory.
+    """
+    if storage_type == 'sqlite':
+        os.makedirs(save_dir, exist_ok=True)
+        return f"sqlite:///{os.path.join(save_dir, 'study.db')}"
+    if storage_type == 'journal':
+        os.makedirs(save_dir, exist_ok=True)
+        return optuna.storages.JournalStorage(optuna.storages.JournalFileStorage(os.path.join(save_dir,
+                                                                                               'study.log')))
+    if storage_type in (None, '', 'None'):
+        return None
+
+    raise NotImplementedError(f'Optuna storage has not been implemented: {storage_type}')
+
+
+def get_pruner(pruner_type: str):
+    """
+    Gets the pruner that stops trials whose intermediate values are poor.
+
+    :param pruner_type: Either median or hyperband, anything else never prunes.
+    :return: The pruner.
+    :rtype: optuna.pruners.BasePruner
+    """
+    if pruner_type == 'median':
+        return optuna.pruners.MedianPruner(n_startup_trials=STARTUP_TRIALS, n_warmup_steps=WARMUP_STEPS)
+    if pruner_type == 'hyperband':
+        return optuna.pruners.HyperbandPruner()
+    if pruner_type in (None, '', 'None'):
+        return optuna.pruners.NopPruner()
+
+    raise NotImplementedError(f'Optuna pruner has not been implemented: {pruner_type}')
+
+
+def is_multi_process(n_jobs: int, storage_type: str):
+    """
+    Finds if trials of a study run in more than one process, only possible with storage on disk.
+
+    :param n_jobs: The number of processes running trials.
+    :param storage_type: The storage type of the study.
+    :return: If every job is a process of its own.
+    :rtype: bool
+    """
+    return bool(n_jobs) and n_jobs > 1 and storage_type in ('sqlite', 'journal')
+
+
+def _optimize(study_name: str, storage_type: str, save_dir: str, objective, n_trials: int):
+    study = optuna.load_study(study_name=study_name, storage=get_storage(storage_type=storage_type, save_dir=save_dir))
+    # Running trials are counted too, so workers stop once the study has enough trials
+    study.optimize(objective, callbacks=[MaxTrialsCallback(n_trials=n_trials, states=None)])
+
+
+def run_study(study: optuna.Study, objective, n_trials: int, n_jobs: int, storage_type: str, save_dir: str):
+    """
+    Runs the trials of a study. With storage on disk and more than one job, every job is a process pulling trials from
+    the shared storage until the study has enough trials, otherwise trials run one after another in this process.
+
+    :param study: The study, created with the same storage.
+    :param objective: The objective of every trial, defined at the module level so processes can find it.
+    :param n_trials: The number of trials of the study.
+    :param n_jobs: The number of processes running trials.
+    :param storage_type: The storage type the study was created with.
+    :param save_dir: The directory the storage is kept in.
+    """
+    if not is_multi_process(n_jobs=n_jobs, storage_type=storage_type):
+        study.optimize(objective, n_trials=n_trials)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        futures_list = [executor.submit(_optimize, study_name=study.study_name, storage_type=storage_type,
+                                        save_dir=save_dir, objective=objective, n_trials=n_trials)
+                        for _ in range(n_jobs)]
+        for future in concurrent.futures.as_completed(futures_list):
+            future.result()
@@ -5,6 +5,7 @@ from statistics import mean
 import numpy as np
 
 from helper_scripts.sim_helpers import dict_to_list, list_to_title
+from helper_scripts.catalog_helpers import list_results, load_result, list_runs, find_runs
 from arg_scripts.plot_args import PlotArgs, PlotProps
 
 
@@ -129,6 +130,13 @@ class PlotHelpers:  # pylint: disable=too-few-public-methods
                 return None
 
     def _read_input_output(self):
+        key_dict = {'network': self.data_dict['network'], 'date': self.data_dict['date'], 'sim_start': self.time,
+                    'thread_num': self.sim_num, 'erlang': self.erlang}
+        input_dict, erlang_dict = load_result(key_dict=key_dict, catalog_fp=self.plot_props.catalog_fp)
+        # Runs saved without the catalog
+        if erlang_dict is not None:
+            return input_dict, erlang_dict
+
         base_fp = os.path.join(self.data_dict['network'], self.data_dict['date'], self.time)
         file_name = f'{self.erlang}_erlang.json'
         output_fp = os.path.join(self.plot_props.output_dir, base_fp, self.sim_num, file_name)
@@ -186,6 +194,14 @@ class PlotHelpers:  # pylint: disable=too-few-public-methods
         for network_list, dates_list, times_list in zip(networks_matrix, dates_matrix, times_matrix):
             for network, date, time, in zip(network_list, dates_list, times_list):
                 self.file_info[time] = {'network': network, 'date': date, 'sim_dict': dict()}
+                catalog_dict = list_results(network=network, date=date, sim_start=time,
+                                            catalog_fp=self.plot_props.catalog_fp)
+                if catalog_dict:
+                    for sim in sorted(catalog_dict, key=lambda x: int(x[1:])):
+                        if sim in sims_info_dict['sims_matrix'][matrix_count]:
+                            self.file_info[time]['sim_dict'][sim] = sorted(catalog_dict[sim], key=float)
+                    continue
+
                 curr_dir = os.path.join(self.plot_props.output_dir, network, date, time)
                 # Sort by sim number
                 try:
@@ -287,12 +303,13 @@ def _check_filters(file_dict: dict, filter_dict: dict):
     return keep_config
 
 
-def find_times(dates_dict: dict, filter_dict: dict):
+def find_times(dates_dict: dict, filter_dict: dict, skip_set: set = None):
     """
     Searches output directories based on filters and retrieves simulation directory information.
 
     :param dates_dict: The date directory to search.
     :param filter_dict: A dictionary containing all search filters.
+    :param skip_set: The date, network, start time, and simulation number of simulations not to read.
     :return: A dictionary with all times, sim numbers, networks, and dates that matched the filter dict.
     :rtype: dict
     """
@@ -314,6 +331,11 @@ def find_times(dates_dict: dict, filter_dict: dict):
                                'sim' in input_file]
 
             for input_file in input_file_list:
+                sim = input_file.split('_')[2]
+                sim = sim.split('.')[0]
+                if skip_set and (date, network, curr_time, sim) in skip_set:
+                    continue
+
                 file_path = os.path.join(sims_path, input_file)
                 with open(file_path, 'r', encoding='utf-8') as file_obj:
                     try:
@@ -327,8 +349,6 @@ def find_times(dates_dict: dict, filter_dict: dict):
                     if curr_time not in info_dict:
                         info_dict[curr_time] = {'sim_list': list(), 'network_list': list(), 'dates_list': list()}
 
-                    sim = input_file.split('_')[2]
-                    sim = sim.split('.')[0]
                     info_dict[curr_time]['sim_list'].append(sim)
                     info_dict[curr_time]['network_list'].append(network)
                     info_dict[curr_time]['dates_list'].append(date)
@@ -341,3 +361,38 @@ def find_times(dates_dict: dict, filter_dict: dict):
         resp['dates_matrix'].append(obj['dates_list'])
 
     return resp
+
+
+def find_sims(dates_dict: dict, filter_dict: dict, catalog_fp: str):
+    """
+    Searches the results catalog and the input files of simulations saved without it, e.g., before it existed.
+
+    :param dates_dict: The dates to search and their network.
+    :param filter_dict: A dictionary containing all search filters.
+    :param catalog_fp: The catalog file path.
+    :return: A dictionary with all times, sim numbers, networks, and dates that matched the filter dict.
+    :rtype: dict
+    """
+    catalog_set = list_runs(dates_dict=dates_dict, catalog_fp=catalog_fp)
+    if not catalog_set:
+        return find_times(dates_dict=dates_dict, filter_dict=filter_dict)
+
+    resp = find_runs(dates_dict=dates_dict, filter_dict=filter_dict, catalog_fp=catalog_fp)
+    # Catalogued dates may no longer have their input files
+    input_dict = {date: network for date, network in dates_dict.items()
+                  if os.path.isdir(os.path.join('..', 'data', 'input', network, date))}
+    times_dict = find_times(dates_dict=input_dict, filter_dict=filter_dict, skip_set=catalog_set)
+    for time_list, sims_list, networks_list, dates_list in zip(times_dict['times_matrix'], times_dict['sims_matrix'],
+                                                               times_dict['networks_matrix'],
+                                                               times_dict['dates_matrix']):
+        if time_list not in resp['times_matrix']:
+            resp['times_matrix'].append(time_list)
+            resp['sims_matrix'].append(list())
+            resp['networks_matrix'].append(list())
+            resp['dates_matrix'].append(list())
+        time_index = resp['times_matrix'].index(time_list)
+        resp['sims_matrix'][time_index] += sims_list
+        resp['networks_matrix'][time_index] += networks_list
+        resp['dates_matrix'][time_index] += dates_list
+
+    return resp
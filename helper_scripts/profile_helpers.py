@@ -0,0 +1,152 @@
+import cProfile
+import glob
+import os
+import pstats
+
+from helper_scripts.os_helpers import create_dir
+
+MERGED_NAME = 'merged.prof'
+COLLAPSED_NAME = 'collapsed.txt'
+# Stops call graph cycles and very deep recursion from exploding the collapsed stacks
+MAX_DEPTH = 64
+
+
+def get_profile_dir(sim_start: str, base_fp: str = 'data'):
+    """
+    Finds the directory profiles of a run are saved in.
+
+    :param sim_start: The start time of the run.
+    :param base_fp: The base file path.
+    :return: The profile directory.
+    :rtype: str
+    """
+    return os.path.join(base_fp, 'profiles', sim_start)
+
+
+def run_profiled(func, profile_fp: str, **kwargs):
+    """
+    Calls a function under cProfile and saves its profile.
+
+    :param func: The function to profile.
+    :param profile_fp: Where to save the profile.
+    :return: Whatever the function returns.
+    """
+    profile_obj = cProfile.Profile()
+    try:
+        resp = profile_obj.runcall(func, **kwargs)
+    finally:
+        create_dir(os.path.dirname(profile_fp))
+        # Other workers may be merging, never leave a partial profile behind
+        tmp_fp = f'{profile_fp}.{os.getpid()}.tmp'
+        profile_obj.dump_stats(tmp_fp)
+        os.replace(tmp_fp, profile_fp)
+
+    return resp
+
+
+def _get_func_name(func_tuple: tuple):
+    file_path, line_num, func_name = func_tuple
+    # Built-in functions have no file, e.g., ('~', 0, "<method 'append' of 'list' objects>")
+    if file_path != '~':
+        func_name = f'{os.path.basename(file_path)}:{line_num}:{func_name}'
+
+    # Collapsed stacks separate frames with semicolons and the time with a space
+    return func_name.replace(';', ',').replace(' ', '_')
+
+
+def get_collapsed_stacks(stats_obj: pstats.Stats):
+    """
+    Approximates collapsed stacks (one line per stack and its time) from a profile for flame graph tools. cProfile
+    only records callers, so the time of a function is split between its callers by their share of its cumulative time.
+
+    :param stats_obj: The profile statistics.
+    :return: The time in microseconds of each stack, keyed by frames separated by semicolons.
+    :rtype: dict
+    """
+    callees_dict = dict()
+    roots_list = list()
+    for func_tuple, (_, _, _, _, callers_dict) in stats_obj.stats.items():
+        if not callers_dict:
+            roots_list.append(func_tuple)
+        for caller_tuple, caller_stats in callers_dict.items():
+            # The cumulative time of this function when called from the caller
+            callees_dict.setdefault(caller_tuple, list()).append((func_tuple, caller_stats[3]))
+
+    resp = dict()
+
+    def _expand(func_tuple: tuple, budget: float, stack_list: list):
+        total_time, cum_time = stats_obj.stats[func_tuple][2:4]
+        if budget <= 0 or cum_time <= 0:
+            return
+        stack_list = stack_list + [_get_func_name(func_tuple=func_tuple)]
+        share = budget / cum_time
+        self_time = total_time * share
+        if self_time > 0:
+            stack_str = ';'.join(stack_list)
+            resp[stack_str] = resp.get(stack_str, 0.0) + self_time * 1e6
+
+        if len(stack_list) >= MAX_DEPTH:
+            return
+        for callee_tuple, edge_time in callees_dict.get(func_tuple, list()):
+            if _get_func_name(func_tuple=callee_tuple) in stack_list:
+                continue
+            _expand(func_tuple=callee_tuple, budget=edge_time * share, stack_list=stack_list)
+
+    for root_tuple in roots_list:
+        _expand(func_tuple=root_tuple, budget=stats_obj.stats[root_tuple][3], stack_list=list())
+
+    return {stack_str: int(round(time_us)) for stack_str, time_us in resp.items() if round(time_us) > 0}
+
+
+def merge_profiles(profile_dir: str):
+    """
+    Merges every profile in a directory into one pstats file and a collapsed stack file.
+
+    :param profile_dir: The directory with one profile per simulation and Erlang.
+    :return: The merged profile statistics, None if there are no profiles.
+    :rtype: pstats.Stats
+    """
+    profile_list = sorted(file_path for file_path in glob.glob(os.path.join(profile_dir, '**', '*.prof'),
+                                                               recursive=True)
+                          if os.path.basename(file_path) != MERGED_NAME)
+    if not profile_list:
+        return None
+
+    stats_obj = pstats.Stats(profile_list[0])
+    for profile_fp in profile_list[1:]:
+        stats_obj.add(profile_fp)
+    stats_obj.dump_stats(os.path.join(profile_dir, MERGED_NAME))
+
+    with open(os.path.join(profile_dir, COLLAPSED_NAME), 'w', encoding='utf-8') as file_obj:
+        for stack_str, time_us in sorted(get_collapsed_stacks(stats_obj=stats_obj).items()):
+            file_obj.write(f'{stack_str} {time_us}\n')
+
+    return stats_obj
+
+
+def get_top_functions(stats_obj: pstats.Stats, num_funcs: int = 20):
+    """
+    Finds the functions with the most time spent in them, excluding the functions they call.
+
+    :param stats_obj: The profile statistics.
+    :param num_funcs: The number of functions to return.
+    :return: The name, number of calls, total time, and cumulative time of each function.
+    :rtype: list
+    """
+    resp = list()
+    for func_tuple, (_, num_calls, total_time, cum_time, _) in stats_obj.stats.items():
+        resp.append((_get_func_name(func_tuple=func_tuple), num_calls, total_time, cum_time))
+
+    return sorted(resp, key=lambda row: -row[2])[:num_funcs]
+
+
+def print_top_functions(stats_obj: pstats.Stats, num_funcs: int = 20):
+    """
+    Prints the functions with the most time spent in them.
+
+    :param stats_obj: The profile statistics.
+    :param num_funcs: The number of functions to print.
+    """
+    print(f'{"total (s)":>10} {"cum (s)":>10} {"calls":>10}  function')
+    for func_name, num_calls, total_time, cum_time in get_top_functions(stats_obj=stats_obj, num_funcs=num_funcs):
+        print(f'{total_time:>10.3f} {cum_time:>10.3f} {num_calls:>10}  {func_name}')
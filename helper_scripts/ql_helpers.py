@@ -26,42 +26,41 @@ class QLearningHelpers:
         self.iteration = 0
         self.learn_rate = None
 
-    def _init_q_tables(self):
-        for source in range(0, self.rl_props.num_nodes):
-            for destination in range(0, self.rl_props.num_nodes):
-                # A node cannot be attached to itself
-                if source == destination:
-                    continue
-
-                shortest_paths = nx.shortest_simple_paths(G=self.engine_props['topology'],
-                                                          source=str(source), target=str(destination), weight='length')
-                for k, curr_path in enumerate(shortest_paths):
-                    if k >= self.rl_props.k_paths:
-                        break
-
-                    for level_index in range(self.path_levels):
-                        self.props.routes_matrix[source, destination, k, level_index] = (curr_path, 0.0)
-
-                        for core_action in range(self.engine_props['cores_per_link']):
-                            core_tuple = (curr_path, core_action, 0.0)
-                            self.props.cores_matrix[source, destination, k, core_action, level_index] = core_tuple
+    def get_paths(self, source: int, destination: int):
+        """
+        Gets the k-shortest paths between two nodes. Paths are found the first time they are needed and kept in the
+        paths table shared by both q-tables.
+
+        :param source: The source node.
+        :param destination: The destination node.
+        :return: The k-shortest paths.
+        :rtype: list
+        """
+        path_ids_arr = self.props.path_ids_matrix[source, destination]
+        if path_ids_arr[0] < 0:
+            shortest_paths = nx.shortest_simple_paths(G=self.engine_props['topology'], source=str(source),
+                                                      target=str(destination), weight='length')
+            for k, curr_path in enumerate(shortest_paths):
+                if k >= self.rl_props.k_paths:
+                    break
+
+                path_ids_arr[k] = len(self.props.paths_list)
+                self.props.paths_list.append(curr_path)
+
+        return [self.props.paths_list[path_id] for path_id in path_ids_arr if path_id >= 0]
 
     def setup_env(self):
         """
         Sets up the q-learning environments.
         """
         self.props.epsilon = self.engine_props['epsilon_start']
-        route_types = [('path', 'O'), ('q_value', 'f8')]
-        core_types = [('path', 'O'), ('core_action', 'i8'), ('q_value', 'f8')]
-
-        self.props.routes_matrix = np.empty((self.rl_props.num_nodes, self.rl_props.num_nodes,
-                                             self.rl_props.k_paths, self.path_levels), dtype=route_types)
+        num_nodes, k_paths = self.rl_props.num_nodes, self.rl_props.k_paths
 
-        self.props.cores_matrix = np.empty((self.rl_props.num_nodes, self.rl_props.num_nodes,
-                                            self.rl_props.k_paths, self.engine_props['cores_per_link'],
-                                            self.path_levels), dtype=core_types)
-
-        self._init_q_tables()
+        self.props.routes_matrix = np.zeros((num_nodes, num_nodes, k_paths, self.path_levels), dtype=np.float32)
+        self.props.cores_matrix = np.zeros((num_nodes, num_nodes, k_paths, self.engine_props['cores_per_link'],
+                                            self.path_levels), dtype=np.float32)
+        self.props.path_ids_matrix = np.full((num_nodes, num_nodes, k_paths), -1, dtype=np.int32)
+        self.props.paths_list = list()
 
     def get_max_future_q(self, path_list: list, net_spec_dict: dict, matrix: list, flag: str, core_index: int = None):
         """
@@ -78,15 +77,15 @@ class QLearningHelpers:
         if flag == 'path':
             new_cong = find_path_cong(path_list=path_list, net_spec_dict=net_spec_dict)
             new_cong_index = classify_cong(curr_cong=new_cong)
-            max_future_q = matrix[self.rl_props.chosen_path_index][new_cong_index]['q_value']
+            max_future_q = matrix[self.rl_props.chosen_path_index, new_cong_index]
         elif flag == 'core':
             new_cong = find_core_cong(core_index=core_index, net_spec_dict=net_spec_dict, path_list=path_list)
             new_cong_index = classify_cong(curr_cong=new_cong)
-            max_future_q = matrix[core_index][new_cong_index]['q_value']
+            max_future_q = matrix[core_index, new_cong_index]
         else:
             raise NotImplementedError
 
-        return max_future_q
+        return float(max_future_q)
 
     def update_routes_matrix(self, reward: float, level_index: int, net_spec_dict: dict):
         """
@@ -96,11 +95,11 @@ class QLearningHelpers:
         :param level_index: Index to determine the current state.
         :param net_spec_dict: The network spectrum database.
         """
-        routes_matrix = self.props.routes_matrix[self.rl_props.source][self.rl_props.destination]
-        path_list = routes_matrix[self.rl_props.chosen_path_index][level_index]
-        current_q = path_list['q_value']
+        routes_matrix = self.props.routes_matrix[self.rl_props.source, self.rl_props.destination]
+        current_q = float(routes_matrix[self.rl_props.chosen_path_index, level_index])
 
-        max_future_q = self.get_max_future_q(path_list=routes_matrix[self.rl_props.chosen_path_index][0][0],
+        path_list = self.get_paths(source=self.rl_props.source, destination=self.rl_props.destination)
+        max_future_q = self.get_max_future_q(path_list=path_list[self.rl_props.chosen_path_index],
                                              net_spec_dict=net_spec_dict, matrix=routes_matrix, flag='path')
 
         delta = reward + self.engine_props['discount_factor'] * max_future_q
@@ -108,8 +107,7 @@ class QLearningHelpers:
         self.update_q_stats(reward=reward, stats_flag='routes_dict', td_error=td_error)
         new_q = ((1.0 - self.learn_rate) * current_q) + (self.learn_rate * delta)
 
-        routes_matrix = self.props.routes_matrix[self.rl_props.source][self.rl_props.destination]
-        routes_matrix[self.rl_props.chosen_path_index][level_index]['q_value'] = new_q
+        routes_matrix[self.rl_props.chosen_path_index, level_index] = new_q
 
     def update_cores_matrix(self, reward: float, core_index: int, level_index: int, net_spec_dict: dict):
         """
@@ -120,20 +118,21 @@ class QLearningHelpers:
         :param level_index: Index to determine the current state.
         :param net_spec_dict: The network spectrum database.
         """
-        cores_matrix = self.props.cores_matrix[self.rl_props.source][self.rl_props.destination]
-        cores_matrix = cores_matrix[self.rl_props.chosen_path_index]
-        cores_list = cores_matrix[self.rl_props.core_index][level_index]
-        current_q = cores_list['q_value']
+        cores_matrix = self.props.cores_matrix[self.rl_props.source, self.rl_props.destination,
+                                               self.rl_props.chosen_path_index]
+        current_q = float(cores_matrix[self.rl_props.core_index, level_index])
 
-        max_future_q = self.get_max_future_q(path_list=cores_list['path'], net_spec_dict=net_spec_dict,
-                                             matrix=cores_matrix, flag='core', core_index=core_index)
+        path_list = self.get_paths(source=self.rl_props.source, destination=self.rl_props.destination)
+        max_future_q = self.get_max_future_q(path_list=path_list[self.rl_props.chosen_path_index],
+                                             net_spec_dict=net_spec_dict, matrix=cores_matrix, flag='core',
+                                             core_index=core_index)
 
         delta = reward + self.engine_props['discount_factor'] * max_future_q
         td_error = current_q - (reward + self.engine_props['discount_factor'] * max_future_q)
         self.update_q_stats(reward=reward, stats_flag='cores_dict', td_error=td_error)
         new_q = ((1.0 - self.learn_rate) * current_q) + (self.learn_rate * delta)
 
-        cores_matrix[core_index][level_index]['q_value'] = new_q
+        cores_matrix[core_index, level_index] = new_q
 
     def get_max_curr_q(self, cong_list: list, matrix_flag: str):
         """
@@ -144,22 +143,20 @@ class QLearningHelpers:
         :return: The maximum q-value index (state) and an object
         :rtype: tuple
         """
-        q_values = list()
-        for obj_index, _, level_index in cong_list:
-            if matrix_flag == 'routes_matrix':
-                matrix = self.props.routes_matrix[self.rl_props.source][self.rl_props.destination]
-                sub_flag = 'paths_list'
-            elif matrix_flag == 'cores_matrix':
-                matrix = self.props.cores_matrix[self.rl_props.source][self.rl_props.destination]
-                matrix = matrix[self.rl_props.chosen_path_index]
-                sub_flag = 'cores_list'
-            else:
-                raise ValueError
+        if matrix_flag == 'routes_matrix':
+            matrix = self.props.routes_matrix[self.rl_props.source, self.rl_props.destination]
+            sub_flag = 'paths_list'
+        elif matrix_flag == 'cores_matrix':
+            matrix = self.props.cores_matrix[self.rl_props.source, self.rl_props.destination,
+                                             self.rl_props.chosen_path_index]
+            sub_flag = 'cores_list'
+        else:
+            raise ValueError
 
-            curr_q = matrix[obj_index][level_index]['q_value']
-            q_values.append(curr_q)
+        obj_indexes, _, level_indexes = zip(*cong_list)
+        q_values = matrix[list(obj_indexes), list(level_indexes)]
 
-        max_index = np.argmax(q_values)
+        max_index = int(np.argmax(q_values))
         if sub_flag == 'cores_list':
             max_obj = self.rl_props.cores_list[max_index]
         else:
@@ -249,15 +246,36 @@ class QLearningHelpers:
         cores_per_link = self.engine_props['cores_per_link']
 
         if path_algorithm == 'q_learning':
-            save_fp = f"e{erlang}_routes_c{cores_per_link}.npy"
+            save_fp = f"e{erlang}_routes_c{cores_per_link}.npz"
+            q_table = self.props.routes_matrix
         elif core_algorithm == 'q_learning':
-            save_fp = f"e{erlang}_cores_c{cores_per_link}.npy"
+            save_fp = f"e{erlang}_cores_c{cores_per_link}.npz"
+            q_table = self.props.cores_matrix
         else:
             raise NotImplementedError
 
         save_fp = os.path.join(os.getcwd(), save_dir, save_fp)
-        if save_fp.split('_')[1] == 'routes':
-            np.save(save_fp, self.props.routes_matrix)
-        else:
-            np.save(save_fp, self.props.cores_matrix)
+        # Paths are saved as padded node names, so no pickled objects are needed to load the model
+        max_len = max((len(path_list) for path_list in self.props.paths_list), default=0)
+        paths_arr = np.array([path_list + [''] * (max_len - len(path_list)) for path_list in self.props.paths_list],
+                             dtype=str).reshape(len(self.props.paths_list), max_len)
+        np.savez(save_fp, q_table=q_table, path_ids=self.props.path_ids_matrix, paths=paths_arr)
         self._save_params(save_dir=save_dir)
+
+    def load_model(self, model_fp: str, matrix_flag: str):
+        """
+        Loads a q-table saved by save_model, along with the paths found while training.
+
+        :param model_fp: The file path of the model.
+        :param matrix_flag: A flag to determine whether to load the path or core q-table.
+        """
+        with np.load(model_fp) as model_dict:
+            if matrix_flag == 'routes_matrix':
+                self.props.routes_matrix = model_dict['q_table']
+            elif matrix_flag == 'cores_matrix':
+                self.props.cores_matrix = model_dict['q_table']
+            else:
+                raise ValueError
+
+            self.props.path_ids_matrix = model_dict['path_ids']
+            self.props.paths_list = [[node for node in path_arr if node] for path_arr in model_dict['paths'].tolist()]
@@ -0,0 +1,227 @@
+import json
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+
+from helper_scripts.os_helpers import create_dir
+
+# Every job lives in exactly one of these directories, moving between them is an atomic rename
+QUEUE_STATE_LIST = ['pending', 'leased', 'done', 'failed']
+
+
+class JobQueue:
+    """
+    A lease-based job queue stored as files in a directory, any host that can see the directory may pull jobs.
+    """
+
+    def __init__(self, queue_dir: str, lease_time: float = 300.0):
+        self.queue_dir = queue_dir
+        # Seconds without a heartbeat before a leased job is given to another worker
+        self.lease_time = lease_time
+        self.worker_id = f'{socket.gethostname()}_{os.getpid()}'
+        # The owner token of every job this worker claimed, a new token for every claim
+        self.owner_dict = dict()
+
+        for state in QUEUE_STATE_LIST:
+            create_dir(os.path.join(self.queue_dir, state))
+
+    def _get_path(self, state: str, job_id: str):
+        return os.path.join(self.queue_dir, state, f'{job_id}.json')
+
+    def _list_jobs(self, state: str):
+        return sorted(file_name[:-len('.json')] for file_name in os.listdir(os.path.join(self.queue_dir, state))
+                      if file_name.endswith('.json'))
+
+    def _write_job(self, file_path: str, job_id: str, file_dict: dict):
+        tmp_fp = os.path.join(self.queue_dir, f'.{job_id}.{uuid.uuid4().hex[:8]}.tmp')
+        with open(tmp_fp, 'w', encoding='utf-8') as file_obj:
+            json.dump(file_dict, file_obj)
+        os.replace(tmp_fp, file_path)
+
+    def _get_owner(self, job_id: str):
+        try:
+            with open(self._get_path(state='leased', job_id=job_id), 'r', encoding='utf-8') as file_obj:
+                return json.load(file_obj)['owner']
+        # Requeued, or finished by another worker
+        except FileNotFoundError:
+            return None
+
+    def put(self, job_dict: dict):
+        """
+        Adds a job to the queue.
+
+        :param job_dict: Anything JSON serializable describing the unit of work.
+        :return: The job identifier.
+        :rtype: str
+        """
+        # Sorting by the time stamp keeps jobs roughly first in, first out
+        job_id = f'{time.time_ns()}_{uuid.uuid4().hex[:8]}'
+        self._write_job(file_path=self._get_path(state='pending', job_id=job_id), job_id=job_id,
+                        file_dict={'owner': None, 'job_dict': job_dict})
+
+        return job_id
+
+    def claim(self):
+        """
+        Leases the oldest pending job.
+
+        :return: The job identifier and job, or None if nothing is pending.
+        :rtype: tuple
+        """
+        for job_id in self._list_jobs(state='pending'):
+            pending_fp = self._get_path(state='pending', job_id=job_id)
+            leased_fp = self._get_path(state='leased', job_id=job_id)
+            try:
+                # The lease starts now, not when the job was queued
+                os.utime(pending_fp)
+                os.rename(pending_fp, leased_fp)
+            # Another worker claimed it first
+            except FileNotFoundError:
+                continue
+
+            with open(leased_fp, 'r', encoding='utf-8') as file_obj:
+                file_dict = json.load(file_obj)
+            # A worker whose lease expired can tell the job was leased again since
+            file_dict['owner'] = f'{self.worker_id}_{uuid.uuid4().hex[:8]}'
+            self._write_job(file_path=leased_fp, job_id=job_id, file_dict=file_dict)
+            self.owner_dict[job_id] = file_dict['owner']
+
+            return job_id, file_dict['job_dict']
+
+        return None
+
+    def heartbeat(self, job_id: str):
+        """
+        Renews the lease of a job, unless it expired and the job was requeued or leased by another worker.
+
+        :param job_id: The job identifier.
+        :return: If the lease was renewed.
+        :rtype: bool
+        """
+        if self._get_owner(job_id=job_id) != self.owner_dict.get(job_id):
+            print(f'Job {job_id} is no longer leased by worker {self.worker_id}, its lease is not renewed.')
+            return False
+
+        os.utime(self._get_path(state='leased', job_id=job_id))
+        return True
+
+    def complete(self, job_id: str, is_failed: bool = False, error_str: str = None):
+        """
+        Marks a leased job as finished.
+
+        :param job_id: The job identifier.
+        :param is_failed: Whether the job raised an error.
+        :param error_str: The error to save alongside a failed job.
+        """
+        state = 'failed' if is_failed else 'done'
+        owner = self.owner_dict.pop(job_id, None)
+        leased_owner = self._get_owner(job_id=job_id)
+        # The lease expired and another worker is running it again, the result is theirs to report
+        if leased_owner is not None and leased_owner != owner:
+            print(f'Job {job_id} finished on worker {self.worker_id} after its lease was given to {leased_owner}.')
+            return
+
+        try:
+            os.rename(self._get_path(state='leased', job_id=job_id), self._get_path(state=state, job_id=job_id))
+        # The lease expired and the job was requeued, take it back so it does not run twice
+        except FileNotFoundError:
+            try:
+                os.rename(self._get_path(state='pending', job_id=job_id), self._get_path(state=state, job_id=job_id))
+            # Another worker is already running it again
+            except FileNotFoundError:
+                return
+        if error_str is not None:
+            with open(os.path.join(self.queue_dir, state, f'{job_id}.err'), 'w', encoding='utf-8') as file_obj:
+                file_obj.write(error_str)
+
+    def requeue_expired(self):
+        """
+        Returns jobs whose lease expired (the worker died or hung) to the pending state.
+
+        :return: The requeued job identifiers.
+        :rtype: list
+        """
+        resp_list = list()
+        for job_id in self._list_jobs(state='leased'):
+            leased_fp = self._get_path(state='leased', job_id=job_id)
+            try:
+                if time.time() - os.path.getmtime(leased_fp) < self.lease_time:
+                    continue
+                os.rename(leased_fp, self._get_path(state='pending', job_id=job_id))
+            # Finished or requeued by someone else in the meantime
+            except FileNotFoundError:
+                continue
+            resp_list.append(job_id)
+
+        return resp_list
+
+    def is_finished(self):
+        """
+        Checks if every job is done or failed.
+
+        :return: True if nothing is pending or leased.
+        :rtype: bool
+        """
+        return not self._list_jobs(state='pending') and not self._list_jobs(state='leased')
+
+    @contextmanager
+    def lease(self, job_id: str):
+        """
+        Keeps renewing the lease of a job in a background thread while the caller works on it.
+
+        :param job_id: The job identifier.
+        """
+        stop_event = threading.Event()
+
+        def _beat():
+            while not stop_event.wait(self.lease_time / 3):
+                try:
+                    if not self.heartbeat(job_id=job_id):
+                        return
+                except FileNotFoundError:
+                    return
+
+        beat_thread = threading.Thread(target=_beat, daemon=True)
+        beat_thread.start()
+        try:
+            yield
+        finally:
+            stop_event.set()
+            beat_thread.join()
+
+
+def run_worker(queue_obj: JobQueue, job_func, poll_time: float = 5.0):
+    """
+    Pulls jobs until every job in the queue is finished.
+
+    :param queue_obj: The job queue.
+    :param job_func: Called with each job dictionary.
+    :param poll_time: Seconds to wait before checking again when other workers still hold leases.
+    :return: The number of jobs this worker completed.
+    :rtype: int
+    """
+    jobs_done = 0
+    while True:
+        queue_obj.requeue_expired()
+        resp = queue_obj.claim()
+        if resp is None:
+            if queue_obj.is_finished():
+                return jobs_done
+            time.sleep(poll_time)
+            continue
+
+        job_id, job_dict = resp
+        try:
+            with queue_obj.lease(job_id=job_id):
+                job_func(job_dict)
+        except Exception:  # pylint: disable=broad-exception-caught
+            print(f'Job {job_id} failed on worker {queue_obj.worker_id}.')
+            queue_obj.complete(job_id=job_id, is_failed=True, error_str=traceback.format_exc())
+            continue
+
+        queue_obj.complete(job_id=job_id)
+        jobs_done += 1
@@ -1,3 +1,5 @@
+import zlib
+
 import numpy as np
 
 
@@ -10,27 +12,89 @@ def set_seed(seed: int):
     np.random.seed(seed)
 
 
-def get_uniform_rv(scale_param: float = None):
+def _get_stream_key(key):
+    if isinstance(key, (int, np.integer)) and not isinstance(key, bool) and key >= 0:
+        return int(key)
+
+    # Names (e.g., 's1' or 'path_agent') and floats (e.g., Erlangs) need a stable integer, hash() is salted per process
+    return zlib.crc32(str(key).encode('utf-8'))
+
+
+def get_seed_sequence(seed: int, stream_key_list: list = None):
+    """
+    Creates the seed sequence of an independent random stream. The stream only depends on the seed and the keys, e.g.,
+    (simulation, Erlang, iteration, component), never on the process or thread it is created in.
+
+    :param seed: The root seed.
+    :param stream_key_list: Keys identifying the stream.
+    :return: The seed sequence, spawn from it for more independent streams.
+    :rtype: np.random.SeedSequence
+    """
+    if stream_key_list is None:
+        stream_key_list = list()
+
+    return np.random.SeedSequence(entropy=seed, spawn_key=tuple(_get_stream_key(key) for key in stream_key_list))
+
+
+def get_generator(seed: int, stream_key_list: list = None):
+    """
+    Creates a random generator for an independent stream.
+
+    :param seed: The root seed.
+    :param stream_key_list: Keys identifying the stream.
+    :return: The random generator.
+    :rtype: np.random.Generator
+    """
+    return np.random.Generator(np.random.PCG64(get_seed_sequence(seed=seed, stream_key_list=stream_key_list)))
+
+
+def get_uniform_rv(scale_param: float = None, rng: np.random.Generator = None, size: int = None):
     """
     Generates a value from a uniform distribution. Optional scale parameter.
 
     :param scale_param: A scale parameter
+    :param rng: The random generator to draw from, defaults to the global numpy state.
+    :param size: The number of values to draw at once, a single value if None.
     :return: A uniform random variable
     :rtype: int
     """
+    rng_obj = np.random if rng is None else rng
+    if size is not None:
+        rv_arr = rng_obj.uniform(0, 1, size=size)
+        if scale_param is None:
+            return rv_arr
+        return (rv_arr * scale_param).astype(int)
+
     if scale_param is None:
-        return np.random.uniform(0, 1)
+        return rng_obj.uniform(0, 1)
+
+    return int(rng_obj.uniform(0, 1) * scale_param)
+
+
+def get_random_int(high: int, rng: np.random.Generator = None):
+    """
+    Generates an integer in [0, high).
+
+    :param high: The exclusive upper bound.
+    :param rng: The random generator to draw from, defaults to the global numpy state.
+    :return: The random integer.
+    :rtype: int
+    """
+    if rng is None:
+        return np.random.randint(0, high)
 
-    return int(np.random.uniform(0, 1) * scale_param)
+    return int(rng.integers(0, high))
 
 
-def get_exponential_rv(scale_param: float):
+def get_exponential_rv(scale_param: float, rng: np.random.Generator = None, size: int = None):
     """
     Generates a value from an exponential distribution.
 
     :param scale_param: A scale parameter
+    :param rng: The random generator to draw from, defaults to the global numpy state.
+    :param size: The number of values to draw at once, a single value if None.
     :return: An exponential random variable
     :rtype: float
     """
     # np.log is the natural logarithm
-    return ((-1.0) / float(scale_param)) * np.log(get_uniform_rv())
+    return ((-1.0) / float(scale_param)) * np.log(get_uniform_rv(rng=rng, size=size))
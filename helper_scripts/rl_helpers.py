@@ -3,6 +3,7 @@ import numpy as np
 from src.spectrum_assignment import SpectrumAssignment
 from helper_scripts.sim_helpers import find_path_len, get_path_mod, get_hfrag
 from helper_scripts.sim_helpers import find_path_cong, classify_cong, find_core_cong
+from helper_scripts.feasibility_helpers import FeasibilityOracle
 from arg_scripts.sdn_args import SDNProps
 
 
@@ -24,6 +25,8 @@ class RLHelpers:
         self.super_channel_indexes = list()
         self.mod_format = None
         self._last_processed_index = 0
+        # Kept for the whole simulation so its answers are reused until the spectrum changes
+        self.oracle_obj = None
 
     def update_snapshots(self):
         """
@@ -78,7 +81,6 @@ class RLHelpers:
         :rtype: list
         """
         info_list = list()
-        paths_list = paths_list[:, 0]
         for path_index, curr_path in enumerate(paths_list):
             curr_cong = find_path_cong(path_list=curr_path, net_spec_dict=self.engine_obj.net_spec_dict)
             cong_index = classify_cong(curr_cong=curr_cong)
@@ -87,18 +89,18 @@ class RLHelpers:
 
         return info_list
 
-    def classify_cores(self, cores_list: list):
+    def classify_cores(self, cores_list: list, path_list: list):
         """
         Classify cores by their congestion level.
 
-        :param cores_list: A list of cores.
-        :return: The core index, the core itself, and the congestion level of that core for every core.
+        :param cores_list: The q-values of every core, one per congestion level.
+        :param path_list: The path the cores belong to.
+        :return: The core index, the q-value of that core, and the congestion level of that core for every core.
         :rtype: list
         """
         info_list = list()
 
         for core_index, curr_core in enumerate(cores_list):
-            path_list = curr_core['path'][0]
             curr_cong = find_core_cong(core_index=core_index, net_spec_dict=self.engine_obj.net_spec_dict,
                                        path_list=path_list)
             cong_index = classify_cong(curr_cong=curr_cong)
@@ -186,6 +188,40 @@ class RLHelpers:
 
         return True
 
+    def find_feasible_path(self, paths_matrix: list, mod_formats_matrix: list, sdn_props: object):
+        """
+        Finds the first path a request could be allocated on, without allocating it.
+
+        :param paths_matrix: The candidate paths.
+        :param mod_formats_matrix: The valid modulation formats of each path.
+        :param sdn_props: Properties of the SDN controller for the request.
+        :return: The index of the first feasible path, None if there is none.
+        :rtype: int
+        """
+        engine_props = self.engine_obj.engine_props
+        if self.oracle_obj is None:
+            self.oracle_obj = FeasibilityOracle(engine_props=engine_props)
+        # The engine may be rebuilt between episodes
+        self.oracle_obj.engine_props = engine_props
+
+        if self.oracle_obj.is_supported():
+            feasible_arr = self.oracle_obj.check_paths(net_spec_dict=self.engine_obj.net_spec_dict,
+                                                       version=self.engine_obj.sdn_obj.spectrum_version,
+                                                       paths_matrix=paths_matrix,
+                                                       mod_formats_matrix=mod_formats_matrix,
+                                                       mod_formats_dict=sdn_props.mod_formats_dict)
+            feasible_list = np.flatnonzero(feasible_arr)
+            return int(feasible_list[0]) if len(feasible_list) else None
+
+        for path_index, path_list in enumerate(paths_matrix):
+            was_allocated = self.mock_handle_arrival(engine_props=engine_props, sdn_props=sdn_props,
+                                                     path_list=path_list,
+                                                     mod_format_list=mod_formats_matrix[path_index])
+            if was_allocated:
+                return path_index
+
+        return None
+
     def update_mock_sdn(self, curr_req: dict):
         """
         Updates the mock sdn dictionary to find select routes.
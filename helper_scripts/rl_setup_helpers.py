@@ -1,8 +1,11 @@
 import os
+import copy
+import functools
 
 from stable_baselines3 import PPO
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
 
-from helper_scripts.sim_helpers import parse_yaml_file
+from helper_scripts.sim_helpers import parse_yaml_file, get_start_time
 from config_scripts.parse_args import parse_args
 from config_scripts.setup_config import read_config
 from arg_scripts.rl_args import VALID_PATH_ALGORITHMS, VALID_CORE_ALGORITHMS, VALID_SPECTRUM_ALGORITHMS
@@ -66,3 +69,45 @@ def setup_ppo(env: object, device: str):
                 policy_kwargs=kwargs_dict)
 
     return model
+
+
+def get_worker_props(worker_num: int = None):
+    """
+    Finds the simulation number and seed of an environment, workers of a vectorized environment come after the
+    environment that built them.
+
+    :param worker_num: The worker number, None for an environment that is not a worker.
+    :return: The simulation number and seed.
+    :rtype: tuple
+    """
+    if worker_num is None:
+        return 's1', 0
+
+    return f's{worker_num + 1}', worker_num
+
+
+def setup_vec_env(env_cls: type, sim_dict: dict, num_envs: int = None):
+    """
+    Builds a vectorized environment that steps one simulation per worker process. Workers share the start time of the
+    simulation in this process, so their input and output are kept with the model trained on them. Each saves them as
+    its own simulation number after this process's s1 and draws its own requests.
+
+    :param env_cls: The environment class, constructed in each worker.
+    :param sim_dict: Simulation dictionary (engine props).
+    :param num_envs: The number of workers, defaults to num_workers or the number of CPUs.
+    :return: The vectorized environment.
+    :rtype: object
+    """
+    if num_envs is None:
+        num_envs = sim_dict.get('num_workers') or os.cpu_count()
+
+    if not sim_dict.get('sim_start'):
+        get_start_time(sim_dict={'s1': sim_dict})
+    # Workers are started in new processes, the callback stays with the model in this process
+    worker_dict = copy.deepcopy({key: value for key, value in sim_dict.items() if key != 'callback'})
+    env_fn_list = [functools.partial(env_cls, render_mode=None, custom_callback=None, sim_dict={'s1': worker_dict},
+                                     worker_num=worker_num) for worker_num in range(1, num_envs + 1)]
+    if num_envs == 1:
+        return DummyVecEnv(env_fn_list)
+
+    return SubprocVecEnv(env_fn_list)
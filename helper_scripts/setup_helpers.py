@@ -1,11 +1,26 @@
+import copy
 import json
 import os
+import uuid
 
 from data_scripts.structure_data import create_network
 from data_scripts.generate_data import create_bw_info, create_pt
 from helper_scripts.os_helpers import create_dir
 
 
+# Networks already read by this process, keyed by every argument that changes the file contents
+_NETWORKS_DICT = dict()
+
+
+def _get_network(base_fp: str, const_weight: bool, net_name: str, is_only_core_node: bool):
+    network_key = (base_fp, const_weight, net_name, is_only_core_node)
+    if network_key not in _NETWORKS_DICT:
+        _NETWORKS_DICT[network_key] = create_network(base_fp=base_fp, const_weight=const_weight, net_name=net_name,
+                                                     is_only_core_node=is_only_core_node)
+
+    return copy.deepcopy(_NETWORKS_DICT[network_key])
+
+
 def create_input(base_fp: str, engine_props: dict):
     """
     Creates input data to run simulations.
@@ -14,20 +29,25 @@ def create_input(base_fp: str, engine_props: dict):
     :param engine_props: Input of properties to engine.
     :return: Engine props modified with network, physical topology, and bandwidth information.
     """
-    bw_info_dict = create_bw_info(
-        mod_assumption=engine_props['mod_assumption'],
-        mod_assumptions_path=engine_props['mod_assumption_path']
-    )
     bw_file = f"bw_info_{engine_props['thread_num']}.json"
-    save_input(base_fp=base_fp, properties=engine_props, file_name=bw_file, data_dict=bw_info_dict)
-
     save_path = os.path.join(base_fp, 'input', engine_props['network'], engine_props['date'],
                              engine_props['sim_start'], bw_file)
+    # Every job of a simulation shares this file, so it is written once and replaced whole for concurrent readers
+    if not os.path.exists(save_path):
+        bw_info_dict = create_bw_info(
+            mod_assumption=engine_props['mod_assumption'],
+            mod_assumptions_path=engine_props['mod_assumption_path']
+        )
+        tmp_file = f'.{bw_file}.{uuid.uuid4().hex}.tmp'
+        save_input(base_fp=base_fp, properties=engine_props, file_name=tmp_file, data_dict=bw_info_dict)
+        os.replace(os.path.join(os.path.dirname(save_path), tmp_file), save_path)
+
     with open(save_path, 'r', encoding='utf-8') as file_object:
         engine_props['mod_per_bw'] = json.load(file_object)
 
-    network_dict, core_nodes_list = create_network(base_fp=base_fp, const_weight=engine_props['const_link_weight'],
-                                  net_name=engine_props['network'], is_only_core_node = engine_props['is_only_core_node'])
+    network_dict, core_nodes_list = _get_network(base_fp=base_fp, const_weight=engine_props['const_link_weight'],
+                                                 net_name=engine_props['network'],
+                                                 is_only_core_node=engine_props['is_only_core_node'])
     engine_props['topology_info'] = create_pt(cores_per_link=engine_props['cores_per_link'],
                                               net_spec_dict=network_dict)
     engine_props['core_nodes'] = core_nodes_list
@@ -1,5 +1,6 @@
 import copy
 import os
+import concurrent.futures
 import json
 import pickle
 from datetime import datetime
@@ -107,15 +108,20 @@ def find_path_cong(path_list: list, net_spec_dict: dict, band: str = 'c'):
     for src, dest in zip(path_list, path_list[1:]):
         src_dest = (src, dest)
         cores_matrix = net_spec_dict[src_dest]['cores_matrix']
+        usage_dict = net_spec_dict[src_dest].get('usage_dict')
         cores_per_link = float(len(cores_matrix[band]))
 
         for curr_band in net_spec_dict[src_dest]['cores_matrix']:
             # Every core will have the same number of spectral slots
             total_slots = len(cores_matrix[curr_band][0])
-            slots_taken = 0
-            for curr_core in cores_matrix[curr_band]:
-                core_slots_taken = float(len(np.where(curr_core != 0.0)[0]))
-                slots_taken += core_slots_taken
+            # Links kept by the engine count their taken slots as requests come and go
+            if usage_dict is not None:
+                slots_taken = float(usage_dict['taken_matrix'][curr_band].sum())
+            else:
+                slots_taken = 0
+                for curr_core in cores_matrix[curr_band]:
+                    core_slots_taken = float(len(np.where(curr_core != 0.0)[0]))
+                    slots_taken += core_slots_taken
 
             links_cong_list.append(slots_taken / (total_slots * cores_per_link))
 
@@ -137,12 +143,16 @@ def find_core_cong(core_index: int, net_spec_dict: dict, path_list: list):
     for src, dest in zip(path_list, path_list[1:]):
         src_dest = (src, dest)
         cores_matrix = net_spec_dict[src_dest]['cores_matrix']
+        usage_dict = net_spec_dict[src_dest].get('usage_dict')
         total_slots = 0
         slots_taken = 0
         for band in cores_matrix:
             # Every core will have the same number of spectral slots
             total_slots += len(cores_matrix[band][0])
-            core_slots_taken = float(len(np.where(cores_matrix[band][core_index] != 0.0)[0]))
+            if usage_dict is not None:
+                core_slots_taken = float(usage_dict['taken_matrix'][band][core_index])
+            else:
+                core_slots_taken = float(len(np.where(cores_matrix[band][core_index] != 0.0)[0]))
             slots_taken += core_slots_taken
 
         links_cong_list.append(slots_taken / total_slots)
@@ -475,6 +485,32 @@ def min_max_scale(value: float, min_value: float, max_value: float):
     return (value - min_value) / (max_value - min_value)
 
 
+def _get_free_runs(input_arr: np.array):
+    free_arr = np.concatenate(([0], np.asarray(input_arr) == 0, [0])).astype(np.int8)
+    edge_arr = np.diff(free_arr)
+    start_arr = np.flatnonzero(edge_arr == 1)
+    length_arr = np.flatnonzero(edge_arr == -1) - start_arr
+
+    return start_arr, length_arr
+
+
+def _get_sc_starts(start_arr: np.array, length_arr: np.array, slots_needed: int):
+    # Plus one to account for the guard band, every run fits one super-channel per slot beyond the request
+    count_arr = np.maximum(length_arr - slots_needed, 0)
+    offset_arr = np.arange(count_arr.sum()) - np.repeat(np.cumsum(count_arr) - count_arr, count_arr)
+
+    return np.repeat(start_arr, count_arr) + offset_arr, np.repeat(length_arr, count_arr), offset_arr
+
+
+def _get_sc_index_mat(sc_start_arr: np.array, slots_needed: int):
+    if len(sc_start_arr) == 0:
+        return np.array([])
+    if slots_needed == 0:
+        return sc_start_arr[:, None]
+
+    return np.column_stack((sc_start_arr, sc_start_arr + slots_needed))
+
+
 def get_super_channels(input_arr: np.array, slots_needed: int):
     """
     Gets available super-channels w.r.t. the current request's needs.
@@ -484,25 +520,10 @@ def get_super_channels(input_arr: np.array, slots_needed: int):
     :return: A matrix of positions of available super-channels.
     :rtype: np.array
     """
-    potential_super_channels = []
-    consecutive_zeros = 0
+    start_arr, length_arr = _get_free_runs(input_arr=input_arr)
+    sc_start_arr, _, _ = _get_sc_starts(start_arr=start_arr, length_arr=length_arr, slots_needed=slots_needed)
 
-    for i in range(len(input_arr)):  # pylint: disable=consider-using-enumerate
-        if input_arr[i] == 0:
-            consecutive_zeros += 1
-            # Plus one to account for the guard band
-            if consecutive_zeros >= (slots_needed + 1):
-                start_position = i - slots_needed
-                end_position = i
-
-                if start_position == end_position:
-                    potential_super_channels.append([start_position])
-                else:
-                    potential_super_channels.append([start_position, end_position])
-        else:
-            consecutive_zeros = 0
-
-    return np.array(potential_super_channels)
+    return _get_sc_index_mat(sc_start_arr=sc_start_arr, slots_needed=slots_needed)
 
 
 # TODO: Add reference
@@ -519,7 +540,8 @@ def _get_hfrag_score(sc_index_mat: np.array, spectral_slots: int):
 
 def get_hfrag(path_list: list, core_num: int, band: str, slots_needed: int, spectral_slots: int, net_spec_dict: dict):
     """
-    Gets the shannon entropy fragmentation scores for allocating a request.
+    Gets the shannon entropy fragmentation scores for allocating a request. The super-channels left after taking each
+    candidate are counted from the free run it splits, so every score comes from one pass over the spectrum.
 
     :param path_list: The current path.
     :param core_num: The core number.
@@ -539,18 +561,22 @@ def get_hfrag(path_list: list, core_num: int, band: str, slots_needed: int, spec
         core_arr = net_spec_dict[(source, dest)]['cores_matrix'][band][core_num]
         path_alloc_arr = combine_and_one_hot(path_alloc_arr, core_arr)
 
-    sc_index_mat = get_super_channels(input_arr=path_alloc_arr, slots_needed=slots_needed)
+    start_arr, length_arr = _get_free_runs(input_arr=path_alloc_arr)
+    sc_start_arr, run_len_arr, offset_arr = _get_sc_starts(start_arr=start_arr, length_arr=length_arr,
+                                                           slots_needed=slots_needed)
+    sc_index_mat = _get_sc_index_mat(sc_start_arr=sc_start_arr, slots_needed=slots_needed)
     hfrag_before = _get_hfrag_score(sc_index_mat=sc_index_mat, spectral_slots=spectral_slots)
-    for super_channel in sc_index_mat:
-        mock_alloc_arr = copy.deepcopy(path_alloc_arr)
-        for index in super_channel:
-            mock_alloc_arr[index] = 1
-
-        tmp_sc_mat = get_super_channels(input_arr=mock_alloc_arr, slots_needed=slots_needed)
-        hfrag_after = _get_hfrag_score(sc_index_mat=tmp_sc_mat, spectral_slots=spectral_slots)
-        delta_hfrag = hfrag_before - hfrag_after
-        start_index = super_channel[0]
-        resp_frag_arr[start_index] = np.round(delta_hfrag, 3)
+    if len(sc_start_arr) > 0:
+        # Taking a super-channel marks its first and last slots, splitting its run into a left and a right run
+        left_arr = np.maximum(offset_arr - slots_needed, 0)
+        right_arr = np.maximum(run_len_arr - offset_arr - 2 * slots_needed - 1, 0)
+        num_after_arr = len(sc_start_arr) - (run_len_arr - slots_needed) + left_arr + right_arr
+
+        channel_len = sc_index_mat.shape[1]
+        hfrag_after_arr = np.where(num_after_arr == 0, np.inf,
+                                   num_after_arr * -1.0 * (channel_len / spectral_slots) * np.log(
+                                       (channel_len / spectral_slots)))
+        resp_frag_arr[sc_start_arr] = np.round(hfrag_before - hfrag_after_arr, 3)
 
     resp_frag_arr = np.where(resp_frag_arr == 1, np.inf, resp_frag_arr)
 
@@ -604,24 +630,55 @@ def get_arrival_rates(arrival_dict: dict):
     return list(range(start, stop + 1, step))
 
 
-def run_simulation_for_arrival_rates(env, arrival_list: list, run_func):
+def _run_arrival_rate(env_cls: type, sim_dict: dict, worker_num: int, arrival_rate: float, run_func):
+    env = env_cls(render_mode=None, custom_callback=sim_dict.get('callback'), sim_dict={'s1': sim_dict},
+                  worker_num=worker_num)
+    env.engine_obj.engine_props['erlang'] = arrival_rate / env.sim_dict['holding_time']
+    env.engine_obj.engine_props['arrival_rate'] = arrival_rate * env.sim_dict['cores_per_link']
+    run_func(env=env, sim_dict=env.sim_dict)
+    return np.sum(env.path_agent.reward_penalty_list)
+
+
+def run_simulation_for_arrival_rates(env, arrival_list: list, run_func, trial=None, num_workers: int = None):
     """
     Run the simulation for each arrival rate in the given list.
 
     :param env: The simulation environment instance.
     :param arrival_list: A list of arrival rates to simulate.
-    :param run_func: The function to run a simulation.
-    :return: The mean of total rewards from all simulations.
+    :param run_func: The function to run a simulation, defined at the module level when running in parallel.
+    :param trial: An optional Optuna trial, the mean reward so far is reported to it after every arrival rate.
+    :param num_workers: Run every arrival rate in its own process and environment, up to this many at a time. The
+                        environments share the start time of the simulation and each gets its own simulation number
+                        and seed after those of env.
+    :return: The mean of total rewards from all simulations, None if the trial should be pruned before the last one.
     :rtype: float
     """
+    if num_workers is not None and num_workers > 1:
+        # Rates are trained from scratch at the same time, so nothing is left to report before the last one finishes
+        worker_dict = copy.deepcopy(env.sim_dict)
+        # Every process steps a single environment, the pool already uses the available CPUs
+        worker_dict['num_workers'] = 1
+        with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures_list = [executor.submit(_run_arrival_rate, env_cls=type(env), sim_dict=worker_dict,
+                                            worker_num=worker_num, arrival_rate=arrival_rate, run_func=run_func)
+                            for worker_num, arrival_rate in enumerate(arrival_list, start=1)]
+            total_rewards = [future.result() for future in futures_list]
+
+        return np.mean(total_rewards)
+
     total_rewards = []
-    for arrival_rate in arrival_list:
+    for arrival_index, arrival_rate in enumerate(arrival_list):
         env.engine_obj.engine_props['erlang'] = arrival_rate / env.sim_dict['holding_time']
         env.engine_obj.engine_props['arrival_rate'] = arrival_rate * env.sim_dict['cores_per_link']
         run_func(env=env, sim_dict=env.sim_dict)
         sum_returns = np.sum(env.path_agent.reward_penalty_list)
         total_rewards.append(sum_returns)
 
+        if trial is not None and arrival_index < len(arrival_list) - 1:
+            trial.report(float(np.mean(total_rewards)), step=arrival_index)
+            if trial.should_prune():
+                return None
+
     return np.mean(total_rewards)
 
 
@@ -3,6 +3,7 @@ import copy
 import numpy as np
 
 from helper_scripts.sim_helpers import find_free_channels, find_free_slots, get_channel_overlaps
+from helper_scripts.occupancy_helpers import is_range_free
 
 
 class SpectrumHelpers:
@@ -20,7 +21,22 @@ class SpectrumHelpers:
         self.core_num = None
         self.curr_band = None
 
+    def _check_free_compact(self, link_tuple: tuple, rev_link_tuple: tuple):
+        if self.spectrum_props.slots_needed == 1 and self.engine_props['guard_slots'] == 0:
+            end_slot = self.start_index + 1
+        elif self.engine_props['guard_slots'] == 0:
+            end_slot = self.end_index + 1
+        else:
+            end_slot = self.end_index + self.engine_props['guard_slots']
+
+        occupied_list = [self.sdn_props.net_spec_dict[link_tuple]['occupied_matrix'][self.curr_band][self.core_num],
+                         self.sdn_props.net_spec_dict[rev_link_tuple]['occupied_matrix'][self.curr_band][self.core_num]]
+        return is_range_free(occupied_list=occupied_list, start_slot=self.start_index, end_slot=end_slot)
+
     def _check_free_spectrum(self, link_tuple: tuple, rev_link_tuple: tuple):
+        if self.engine_props.get('compact_spectrum'):
+            return self._check_free_compact(link_tuple=link_tuple, rev_link_tuple=rev_link_tuple)
+
         core_arr = self.sdn_props.net_spec_dict[link_tuple]['cores_matrix'][self.curr_band][self.core_num]
         rev_core_arr = self.sdn_props.net_spec_dict[rev_link_tuple]['cores_matrix'][self.curr_band][self.core_num]
         if self.spectrum_props.slots_needed == 1 and self.engine_props['guard_slots'] == 0:
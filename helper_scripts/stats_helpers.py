@@ -2,6 +2,7 @@ import json
 import os
 import math
 import copy
+import functools
 from statistics import mean, variance, stdev
 
 import numpy as np
@@ -11,6 +12,202 @@ from arg_scripts.stats_args import StatsProps
 from arg_scripts.stats_args import SNAP_KEYS_LIST
 from helper_scripts.sim_helpers import find_path_len, find_core_cong
 from helper_scripts.os_helpers import create_dir
+from helper_scripts.aggregate_helpers import RunningStats, Histogram
+from helper_scripts.writer_helpers import ResultsWriter
+from helper_scripts.catalog_helpers import update_catalog
+from helper_scripts.memory_helpers import MemoryTracker
+from helper_scripts.usage_helpers import get_network_usage
+
+# Training data rows held before they are written in bounded memory mode
+TRAIN_CHUNK_SIZE = 10000
+
+
+def _get_summary(data_arr: np.ndarray, decimals: int = None):
+    if len(data_arr) == 0:
+        return {'mean': None, 'std': None, 'min': None, 'max': None}
+
+    deviation = 0.0 if len(data_arr) == 1 else float(np.std(data_arr, ddof=1))
+    resp = {'mean': float(np.mean(data_arr)), 'std': deviation, 'min': float(np.min(data_arr)),
+            'max': float(np.max(data_arr))}
+    if decimals is not None:
+        resp = {key: round(value, decimals) for key, value in resp.items()}
+
+    return resp
+
+
+class ColumnarStats:
+    """
+    Records per-request statistics in preallocated numpy arrays instead of growing lists, modulations, bandwidths,
+    and bands are stored as integer codes.
+    """
+
+    def __init__(self, engine_props: dict):
+        self.engine_props = engine_props
+        self.codes_dict = {'modulation': dict(), 'bandwidth': dict(), 'band': dict()}
+        for bandwidth, mods_dict in engine_props['mod_per_bw'].items():
+            self._get_code(code_type='bandwidth', name=bandwidth)
+            for modulation in mods_dict:
+                self._get_code(code_type='modulation', name=modulation)
+        for band in engine_props['band_list']:
+            self._get_code(code_type='band', name=band)
+
+        num_reqs = engine_props['num_requests']
+        num_segments = num_reqs * max(1, engine_props['max_segments'])
+        self.reqs_dict = {
+            'hops': np.zeros(num_reqs, dtype=np.int16),
+            'lengths': np.zeros(num_reqs, dtype=np.float64),
+            'route_times': np.zeros(num_reqs, dtype=np.float64),
+            'weights': np.zeros(num_reqs, dtype=np.float64),
+            'bandwidth': np.zeros(num_reqs, dtype=np.int8),
+            'modulation': np.zeros(num_reqs, dtype=np.int8),
+        }
+        self.segments_dict = {
+            'modulation': np.zeros(num_segments, dtype=np.int8),
+            'bandwidth': np.zeros(num_segments, dtype=np.int8),
+            'band': np.zeros(num_segments, dtype=np.int8),
+            'weights': np.zeros(num_segments, dtype=np.float64),
+        }
+        # Only recorded when crosstalk is calculated, matching the list based statistics
+        self.slots_dict = {
+            'core': np.zeros(num_segments, dtype=np.int16),
+            'start_slot': np.zeros(num_segments, dtype=np.int32),
+            'end_slot': np.zeros(num_segments, dtype=np.int32),
+        }
+        self.num_reqs = 0
+        self.num_segments = 0
+        self.num_slots = 0
+
+    def _get_code(self, code_type: str, name: str):
+        codes_dict = self.codes_dict[code_type]
+        if name not in codes_dict:
+            codes_dict[name] = len(codes_dict)
+
+        return codes_dict[name]
+
+    @staticmethod
+    def _grow(arrays_dict: dict, size: int):
+        # Dynamic slicing may use more segments than max_segments, double the capacity
+        for key, data_arr in arrays_dict.items():
+            if size >= len(data_arr):
+                arrays_dict[key] = np.concatenate((data_arr, np.zeros(max(len(data_arr), 1), dtype=data_arr.dtype)))
+
+    def reset(self):
+        """
+        Clears the recorded requests for a new iteration, the arrays are reused.
+        """
+        self.num_reqs = 0
+        self.num_segments = 0
+        self.num_slots = 0
+
+    def record(self, sdn_data: object, path_len: float):
+        """
+        Records a routed request.
+
+        :param sdn_data: Hold the response data from the sdn controller.
+        :param path_len: The length of the path taken.
+        """
+        self._grow(arrays_dict=self.reqs_dict, size=self.num_reqs)
+        index = self.num_reqs
+        self.reqs_dict['hops'][index] = len(sdn_data.path_list) - 1
+        self.reqs_dict['lengths'][index] = round(float(path_len), 2)
+        self.reqs_dict['route_times'][index] = sdn_data.route_time
+        self.reqs_dict['weights'][index] = round(float(sdn_data.path_weight), 2)
+        self.reqs_dict['bandwidth'][index] = self._get_code(code_type='bandwidth', name=sdn_data.bandwidth)
+        self.reqs_dict['modulation'][index] = self._get_code(code_type='modulation',
+                                                             name=sdn_data.modulation_list[0])
+        self.num_reqs += 1
+
+        for seg_index, modulation in enumerate(sdn_data.modulation_list):
+            self._grow(arrays_dict=self.segments_dict, size=self.num_segments)
+            index = self.num_segments
+            self.segments_dict['modulation'][index] = self._get_code(code_type='modulation', name=modulation)
+            self.segments_dict['bandwidth'][index] = self._get_code(code_type='bandwidth',
+                                                                    name=sdn_data.bandwidth_list[seg_index])
+            self.segments_dict['band'][index] = self._get_code(code_type='band', name=sdn_data.band_list[seg_index])
+            self.segments_dict['weights'][index] = sdn_data.path_weight
+            self.num_segments += 1
+
+        # fixme: Mirrors _handle_iter_lists, which stops before cores and slots when crosstalk was not calculated
+        if sdn_data.xt_list == [None]:
+            return
+        for core, start_slot, end_slot in zip(sdn_data.core_list, sdn_data.start_slot_list, sdn_data.end_slot_list):
+            self._grow(arrays_dict=self.slots_dict, size=self.num_slots)
+            self.slots_dict['core'][self.num_slots] = core
+            self.slots_dict['start_slot'][self.num_slots] = start_slot
+            self.slots_dict['end_slot'][self.num_slots] = end_slot
+            self.num_slots += 1
+
+    def _get_groups(self, codes_arr: np.ndarray, values_arr: np.ndarray):
+        # Sorts once and yields the values of every code that was recorded
+        order_arr = np.argsort(codes_arr, kind='stable')
+        sorted_codes = codes_arr[order_arr]
+        sorted_values = values_arr[order_arr]
+        unique_arr, start_arr = np.unique(sorted_codes, return_index=True)
+        end_arr = np.append(start_arr[1:], len(sorted_codes))
+        for code, start, end in zip(unique_arr.tolist(), start_arr.tolist(), end_arr.tolist()):
+            yield code, sorted_values[start:end]
+
+    def summarize(self, stats_props: object):
+        """
+        Writes the iteration's statistics in the same structure as the list based statistics.
+
+        :param stats_props: The statistics properties to update.
+        """
+        num_mods = len(self.codes_dict['modulation'])
+        num_bands = len(self.codes_dict['band'])
+        mod_names = list(self.codes_dict['modulation'])
+        bw_names = list(self.codes_dict['bandwidth'])
+        band_names = list(self.codes_dict['band'])
+
+        # Copies, the arrays are overwritten in the next iteration
+        stats_props.hops_list = self.reqs_dict['hops'][:self.num_reqs].copy()
+        stats_props.lengths_list = self.reqs_dict['lengths'][:self.num_reqs].copy()
+        stats_props.route_times_list = self.reqs_dict['route_times'][:self.num_reqs].copy()
+
+        core_counts = np.bincount(self.slots_dict['core'][:self.num_slots],
+                                  minlength=self.engine_props['cores_per_link'])
+        for core, count in enumerate(core_counts.tolist()):
+            stats_props.cores_dict[core] += count
+        if self.engine_props['save_start_end_slots']:
+            stats_props.start_slot_list = self.slots_dict['start_slot'][:self.num_slots].tolist()
+            stats_props.end_slot_list = self.slots_dict['end_slot'][:self.num_slots].tolist()
+
+        seg_mods = self.segments_dict['modulation'][:self.num_segments].astype(np.int64)
+        seg_bws = self.segments_dict['bandwidth'][:self.num_segments].astype(np.int64)
+        seg_bands = self.segments_dict['band'][:self.num_segments].astype(np.int64)
+        seg_weights = self.segments_dict['weights'][:self.num_segments]
+        bw_mod_counts = np.bincount(seg_bws * num_mods + seg_mods, minlength=len(bw_names) * num_mods)
+        for code in np.nonzero(bw_mod_counts)[0].tolist():
+            stats_props.mods_used_dict[bw_names[code // num_mods]][mod_names[code % num_mods]] += \
+                int(bw_mod_counts[code])
+        mod_band_counts = np.bincount(seg_mods * num_bands + seg_bands, minlength=num_mods * num_bands)
+        for code in np.nonzero(mod_band_counts)[0].tolist():
+            stats_props.mods_used_dict[mod_names[code // num_bands]][band_names[code % num_bands]] += \
+                int(mod_band_counts[code])
+
+        for modulation in mod_names:
+            if modulation not in stats_props.mods_used_dict:
+                continue
+            lengths_dict = stats_props.mods_used_dict[modulation]['length']
+            for band in lengths_dict:
+                lengths_dict[band] = _get_summary(data_arr=np.array([]), decimals=2)
+        for mod_code, weights_arr in self._get_groups(codes_arr=seg_mods, values_arr=seg_weights):
+            lengths_dict = stats_props.mods_used_dict[mod_names[mod_code]]['length']
+            lengths_dict['overall'] = _get_summary(data_arr=weights_arr, decimals=2)
+        for code, weights_arr in self._get_groups(codes_arr=seg_mods * num_bands + seg_bands,
+                                                  values_arr=seg_weights):
+            lengths_dict = stats_props.mods_used_dict[mod_names[code // num_bands]]['length']
+            lengths_dict[band_names[code % num_bands]] = _get_summary(data_arr=weights_arr, decimals=2)
+
+        for mod_obj in stats_props.weights_dict.values():
+            for modulation in mod_obj:
+                mod_obj[modulation] = _get_summary(data_arr=np.array([]))
+        req_codes = (self.reqs_dict['bandwidth'][:self.num_reqs].astype(np.int64) * num_mods +
+                     self.reqs_dict['modulation'][:self.num_reqs].astype(np.int64))
+        for code, weights_arr in self._get_groups(codes_arr=req_codes,
+                                                  values_arr=self.reqs_dict['weights'][:self.num_reqs]):
+            stats_props.weights_dict[bw_names[code // num_mods]][mod_names[code % num_mods]] = \
+                _get_summary(data_arr=weights_arr)
 
 
 # TODO: Note that many of these dictionaries were converted to objects, this will affect saving/calculating
@@ -50,6 +247,18 @@ class SimStats:
         self.iteration = None
 
         self.train_data_list = list()
+        # Only used when statistics are recorded in arrays
+        self.columnar_obj = None
+        # Only used when results are saved in the background
+        self.writer_obj = None
+        # Set by the engine when phase timing is enabled
+        self.timer_obj = None
+        # The latest memory report, only set when memory reports are enabled
+        self.memory_dict = None
+        # Training data rows already written, only used in bounded memory mode
+        self.train_rows_saved = 0
+        # Bounded memory implies streaming, kept here so the caller's properties are left as they were
+        self.stream_stats = bool(engine_props.get('stream_stats') or engine_props.get('bounded_memory'))
 
     @staticmethod
     def _get_snapshot_info(net_spec_dict: dict, path_list: list):
@@ -57,10 +266,14 @@ class SimStats:
         Retrieves relative information for simulation snapshots.
 
         :param net_spec_dict: The current network spectrum database.
-        :param path_list: A path to find snapshot info, if empty, does this for the entire network.
+        :param path_list: The links to find snapshot info on, if empty, does this for the entire network.
         :return: The occupied slots, number of guard bands, and active requests.
         :rtype: tuple
         """
+        # The engine counts them as requests come and go, a path still needs its cores to be scanned
+        if path_list is None and all('usage_dict' in link_data for link_data in net_spec_dict.values()):
+            return get_network_usage(net_spec_dict=net_spec_dict)
+
         active_reqs_set = set()
         occupied_slots = 0
         guard_slots = 0
@@ -68,8 +281,12 @@ class SimStats:
         for link in list(net_spec_dict.keys())[::2]:
             if path_list is not None and link not in path_list:
                 continue
-            link_data = net_spec_dict[link]
-            for core in link_data['cores_matrix']:
+            cores_matrix = net_spec_dict[link]['cores_matrix']
+            if isinstance(cores_matrix, dict):
+                cores_list = [core for cores_arr in cores_matrix.values() for core in cores_arr]
+            else:
+                cores_list = cores_matrix
+            for core in cores_list:
                 requests_set = set(core[core > 0])
                 for curr_req in requests_set:
                     active_reqs_set.add(curr_req)
@@ -102,6 +319,8 @@ class SimStats:
             'num_segments': self.curr_trans,
         }
         self.train_data_list.append(tmp_info_dict)
+        if self.engine_props.get('bounded_memory') and len(self.train_data_list) >= TRAIN_CHUNK_SIZE:
+            self._flush_train_data(base_fp='data')
 
     def update_snapshot(self, net_spec_dict: dict, req_num: int, path_list: list = None):
         """
@@ -130,21 +349,28 @@ class SimStats:
             for key in SNAP_KEYS_LIST:
                 self.stats_props.snapshots_dict[req_num][key] = list()
 
+    def _get_data_list(self):
+        # Streaming aggregates keep memory independent of the number of requests
+        if self.stream_stats:
+            return RunningStats()
+
+        return list()
+
     def _init_mods_weights_bws(self):
         for bandwidth, obj in self.engine_props['mod_per_bw'].items():
             self.stats_props.mods_used_dict[bandwidth] = dict()
             self.stats_props.weights_dict[bandwidth] = dict()
             for modulation in obj.keys():
-                self.stats_props.weights_dict[bandwidth][modulation] = list()
+                self.stats_props.weights_dict[bandwidth][modulation] = self._get_data_list()
                 self.stats_props.mods_used_dict[bandwidth][modulation] = 0
                 if modulation not in self.stats_props.mods_used_dict or isinstance(
                         self.stats_props.mods_used_dict[modulation]['length']['overall'], dict):
                     self.stats_props.mods_used_dict[modulation] = dict()
                     self.stats_props.mods_used_dict[modulation]['length'] = dict()
-                    self.stats_props.mods_used_dict[modulation]['length']['overall'] = list()
+                    self.stats_props.mods_used_dict[modulation]['length']['overall'] = self._get_data_list()
                     for band in self.engine_props['band_list']:
                         self.stats_props.mods_used_dict[modulation][band] = 0
-                        self.stats_props.mods_used_dict[modulation]['length'][band] = list()
+                        self.stats_props.mods_used_dict[modulation]['length'][band] = self._get_data_list()
 
             self.stats_props.block_bw_dict[bandwidth] = 0
 
@@ -173,6 +399,12 @@ class SimStats:
                     continue
                 setattr(self.stats_props, stat_key, list())
 
+        if self.stream_stats:
+            # Hops are small integers, one bin per hop
+            self.stats_props.hops_list = RunningStats(histogram_obj=Histogram(lower=0, upper=64, num_bins=64))
+            self.stats_props.lengths_list = RunningStats()
+            self.stats_props.route_times_list = RunningStats()
+
     def init_iter_stats(self):
         """
         Initializes data structures used in other methods of this class.
@@ -181,6 +413,11 @@ class SimStats:
         """
         self._init_stat_dicts()
         self._init_stat_lists()
+        if self.engine_props.get('columnar_stats') and not self.stream_stats:
+            if self.columnar_obj is None:
+                self.columnar_obj = ColumnarStats(engine_props=self.engine_props)
+            else:
+                self.columnar_obj.reset()
 
         self.blocked_reqs = 0
         self.bit_rate_blocked = 0
@@ -221,6 +458,8 @@ class SimStats:
                     self.stats_props.mods_used_dict[data][band] += 1
                     self.stats_props.mods_used_dict[data]['length'][band].append(sdn_data.path_weight)
                     self.stats_props.mods_used_dict[data]['length']['overall'].append(sdn_data.path_weight)
+                elif stat_key in ('start_slot_list', 'end_slot_list') and not self._keep_slots():
+                    continue
                 elif stat_key == 'start_slot_list':
                     self.stats_props.start_slot_list.append(int(data))
                 elif stat_key == 'end_slot_list':
@@ -245,6 +484,11 @@ class SimStats:
             self.bit_rate_request += int(sdn_data.bandwidth)
             self.stats_props.block_reasons_dict[sdn_data.block_reason] += 1
             self.stats_props.block_bw_dict[req_data['bandwidth']] += 1
+        elif self.columnar_obj is not None:
+            path_len = find_path_len(path_list=sdn_data.path_list, topology=self.topology)
+            self.columnar_obj.record(sdn_data=sdn_data, path_len=path_len)
+            self.total_trans += sdn_data.num_trans
+            self.bit_rate_request += int(sdn_data.bandwidth)
         else:
             num_hops = len(sdn_data.path_list) - 1
             self.stats_props.hops_list.append(num_hops)
@@ -271,8 +515,13 @@ class SimStats:
 
         for _, mod_obj in self.stats_props.weights_dict.items():
             for modulation, data_list in mod_obj.items():
+                # Already summarized by the columnar statistics
+                if isinstance(data_list, dict):
+                    pass
+                elif isinstance(data_list, RunningStats):
+                    mod_obj[modulation] = data_list.get_summary()
                 # Modulation was never used
-                if len(data_list) == 0:
+                elif len(data_list) == 0:
                     mod_obj[modulation] = {'mean': None, 'std': None, 'min': None, 'max': None}
                 else:
                     if len(data_list) == 1:
@@ -282,6 +531,9 @@ class SimStats:
                     mod_obj[modulation] = {'mean': mean(data_list), 'std': deviation,
                                            'min': min(data_list), 'max': max(data_list)}
                 for key, value in self.stats_props.mods_used_dict[modulation]['length'].items():
+                    if isinstance(value, RunningStats):
+                        self.stats_props.mods_used_dict[modulation]['length'][key] = value.get_summary(decimals=2)
+                        continue
                     if not isinstance(value, list):
                         continue
                     if len(value) == 0:
@@ -313,6 +565,8 @@ class SimStats:
             for block_type, num_times in self.stats_props.block_reasons_dict.items():
                 self.stats_props.block_reasons_dict[block_type] = num_times / float(self.blocked_reqs)
 
+        if self.columnar_obj is not None:
+            self.columnar_obj.summarize(stats_props=self.stats_props)
         self._get_iter_means()
 
     def get_conf_inter(self):
@@ -357,6 +611,24 @@ class SimStats:
 
         return False
 
+    def _keep_slots(self):
+        # Slots grow with the number of requests and are only needed when saved
+        return not self.engine_props.get('bounded_memory') or self.engine_props['save_start_end_slots']
+
+    def _flush_train_data(self, base_fp: str):
+        # Rows are appended so the file matches the one saved all at once
+        if self.train_rows_saved and not self.train_data_list:
+            return
+
+        save_dir = os.path.join(base_fp, 'output', self.sim_info)
+        create_dir(save_dir)
+        save_df = pd.DataFrame(self.train_data_list)
+        is_first = self.train_rows_saved == 0
+        save_df.to_csv(f"{save_dir}/{self.engine_props['erlang']}_train_data.csv", index=False,
+                       mode='w' if is_first else 'a', header=is_first)
+        self.train_rows_saved += len(self.train_data_list)
+        self.train_data_list.clear()
+
     def save_train_data(self, base_fp: str):
         """
         Saves training data file.
@@ -364,10 +636,21 @@ class SimStats:
         :param base_fp: Base file path.
         """
         if self.iteration == (self.engine_props['max_iters'] - 1):
+            if self.engine_props.get('bounded_memory'):
+                self._flush_train_data(base_fp=base_fp)
+                return
             save_df = pd.DataFrame(self.train_data_list)
             save_df.to_csv(f"{base_fp}/output/{self.sim_info}/{self.engine_props['erlang']}_train_data.csv",
                            index=False)
 
+    def _copy_stat(self, stat_key: str):
+        stat_obj = getattr(self.stats_props, stat_key)
+        # Saved in the background while the next iteration runs, lists only hold numbers and a shallow copy suffices
+        if self.engine_props.get('async_writer') and isinstance(stat_obj, list):
+            return list(stat_obj)
+
+        return copy.deepcopy(stat_obj)
+
     def save_stats(self, base_fp: str):
         """
         Saves simulations stats as either a json or csv file.
@@ -387,7 +670,7 @@ class SimStats:
         self.save_dict['ci_rate_bit_rate_block'] = self.bit_rate_block_ci
         self.save_dict['ci_percent_bit_rate_block'] = self.bit_rate_block_ci_percent
 
-        self.save_dict['iter_stats'][self.iteration] = dict()
+        iter_dict = dict()
         for stat_key in vars(self.stats_props).keys():
             if stat_key in ('trans_list', 'hops_list', 'lengths_list', 'route_times_list', 'xt_list'):
                 save_key = f"{stat_key.split('list')[0]}"
@@ -398,23 +681,64 @@ class SimStats:
 
                 # Every request was blocked
                 if len(stat_array) == 0:
-                    self.save_dict['iter_stats'][self.iteration][f'{save_key}mean'] = None
-                    self.save_dict['iter_stats'][self.iteration][f'{save_key}min'] = None
-                    self.save_dict['iter_stats'][self.iteration][f'{save_key}max'] = None
+                    iter_dict[f'{save_key}mean'] = None
+                    iter_dict[f'{save_key}min'] = None
+                    iter_dict[f'{save_key}max'] = None
+                elif isinstance(stat_array, RunningStats):
+                    iter_dict[f'{save_key}mean'] = round(stat_array.mean, 2)
+                    iter_dict[f'{save_key}min'] = round(stat_array.min, 2)
+                    iter_dict[f'{save_key}max'] = round(stat_array.max, 2)
+                    iter_dict[f'{save_key}quantiles'] = stat_array.get_quantiles()
+                    # The full state so replications can be merged later with merge_stats
+                    iter_dict[f'{save_key}aggregate'] = stat_array.to_dict()
+                elif isinstance(stat_array, np.ndarray):
+                    iter_dict[f'{save_key}mean'] = round(float(stat_array.mean()), 2)
+                    iter_dict[f'{save_key}min'] = round(float(stat_array.min()), 2)
+                    iter_dict[f'{save_key}max'] = round(float(stat_array.max()), 2)
                 else:
-                    self.save_dict['iter_stats'][self.iteration][f'{save_key}mean'] = round(float(mean(stat_array)), 2)
-                    self.save_dict['iter_stats'][self.iteration][f'{save_key}min'] = round(float(min(stat_array)), 2)
-                    self.save_dict['iter_stats'][self.iteration][f'{save_key}max'] = round(float(max(stat_array)), 2)
+                    iter_dict[f'{save_key}mean'] = round(float(mean(stat_array)), 2)
+                    iter_dict[f'{save_key}min'] = round(float(min(stat_array)), 2)
+                    iter_dict[f'{save_key}max'] = round(float(max(stat_array)), 2)
             else:
                 if stat_key in ['start_slot_list', 'end_slot_list'] and not self.engine_props['save_start_end_slots']:
-                    self.save_dict['iter_stats'][self.iteration][stat_key] = []
+                    iter_dict[stat_key] = []
                     continue
-                self.save_dict['iter_stats'][self.iteration][stat_key] = copy.deepcopy(getattr(self.stats_props,
-                                                                                               stat_key))
+                iter_dict[stat_key] = self._copy_stat(stat_key=stat_key)
+        if self.timer_obj is not None:
+            iter_dict['phase_times_dict'] = self.timer_obj.get_stats()
+        if self.memory_dict is not None:
+            iter_dict['memory_dict'] = self.memory_dict
 
         if base_fp is None:
             base_fp = 'data'
         save_fp = os.path.join(base_fp, 'output', self.sim_info, self.engine_props['thread_num'])
+        if self.engine_props.get('async_writer'):
+            if self.writer_obj is None:
+                callback = None
+                if self.engine_props.get('use_catalog'):
+                    callback = functools.partial(self._update_catalog, base_fp=base_fp)
+                self.writer_obj = ResultsWriter(save_fp=save_fp, erlang=self.engine_props['erlang'], callback=callback)
+            header_dict = {key: value for key, value in self.save_dict.items() if key != 'iter_stats'}
+            self.writer_obj.put(iteration=self.iteration, header_dict=header_dict, iter_dict=iter_dict)
+            # The last save, e.g., reinforcement learning drives iterations without the engine's run method
+            if self.iteration + 1 == self.engine_props['max_iters']:
+                self.close_writer()
+        else:
+            self.save_dict['iter_stats'][self.iteration] = iter_dict
+            self._write_json(save_fp=save_fp)
+            if self.engine_props.get('use_catalog'):
+                header_dict = {key: value for key, value in self.save_dict.items() if key != 'iter_stats'}
+                self._update_catalog(record_dict={'iteration': self.iteration, 'header_dict': header_dict,
+                                                  'iter_stats': iter_dict}, base_fp=base_fp)
+
+        if self.engine_props['output_train_data']:
+            self.save_train_data(base_fp=base_fp)
+
+    def _update_catalog(self, record_dict: dict, base_fp: str):
+        update_catalog(engine_props=self.engine_props, iteration=record_dict['iteration'],
+                       header_dict=record_dict['header_dict'], iter_dict=record_dict['iter_stats'], base_fp=base_fp)
+
+    def _write_json(self, save_fp: str):
         create_dir(save_fp)
         if self.engine_props['file_type'] == 'json':
             with open(f"{save_fp}/{self.engine_props['erlang']}_erlang.json", 'w', encoding='utf-8') as file_path:
@@ -422,8 +746,15 @@ class SimStats:
         else:
             raise NotImplementedError
 
-        if self.engine_props['output_train_data']:
-            self.save_train_data(base_fp=base_fp)
+    def close_writer(self):
+        """
+        Waits for results saved in the background and writes the results JSON.
+
+        :return: None
+        """
+        if self.writer_obj is not None:
+            self.writer_obj.close()
+            self.writer_obj = None
 
     def print_iter_stats(self, max_iters: int, print_flag: bool):
         """
@@ -437,3 +768,9 @@ class SimStats:
             print(f"Iteration {self.iteration + 1} out of {max_iters} completed for "
                   f"Erlang: {self.engine_props['erlang']}")
             print(f"Mean of blocking: {round(mean(self.stats_props.sim_block_list), 4)}")
+            if self.timer_obj is not None:
+                for summary_str in self.timer_obj.get_summary_list():
+                    print(f"    {summary_str}")
+            if self.memory_dict is not None:
+                for summary_str in MemoryTracker.get_summary_list(report_dict=self.memory_dict):
+                    print(f"    {summary_str}")
@@ -0,0 +1,97 @@
+import time
+
+# One histogram bucket per power of two nanoseconds
+NUM_BUCKETS = 64
+# Phases of the request pipeline in the order they are printed
+PHASE_LIST = ['request_generation', 'routing', 'spectrum', 'snr', 'allocate', 'release', 'stats']
+
+
+class PhaseTimer:
+    """
+    Accumulates the wall-clock time spent in each phase of the request pipeline, attributed by algorithm.
+    """
+
+    def __init__(self):
+        # (phase, algorithm) -> [count, total ns, min ns, max ns, histogram]
+        self.phases_dict = dict()
+
+    @staticmethod
+    def start():
+        """
+        Gets the time stamp a phase starts at.
+
+        :return: The time in nanoseconds.
+        :rtype: int
+        """
+        return time.perf_counter_ns()
+
+    def add(self, phase: str, algorithm: str, start_ns: int):
+        """
+        Records a phase that started at start_ns and ends now.
+
+        :param phase: The phase, e.g., routing.
+        :param algorithm: The algorithm used in the phase, e.g., k_shortest_path.
+        :param start_ns: The time stamp from start.
+        """
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        phase_list = self.phases_dict.get((phase, algorithm))
+        if phase_list is None:
+            phase_list = [0, 0, elapsed_ns, elapsed_ns, [0] * NUM_BUCKETS]
+            self.phases_dict[(phase, algorithm)] = phase_list
+
+        phase_list[0] += 1
+        phase_list[1] += elapsed_ns
+        if elapsed_ns < phase_list[2]:
+            phase_list[2] = elapsed_ns
+        if elapsed_ns > phase_list[3]:
+            phase_list[3] = elapsed_ns
+        phase_list[4][min(elapsed_ns.bit_length(), NUM_BUCKETS - 1)] += 1
+
+    def reset(self):
+        """
+        Clears every phase, e.g., at the start of an iteration.
+        """
+        self.phases_dict = dict()
+
+    def _get_sorted_keys(self):
+        order_dict = {phase: index for index, phase in enumerate(PHASE_LIST)}
+        return sorted(self.phases_dict, key=lambda key: (order_dict.get(key[0], len(PHASE_LIST)), key[0], str(key[1])))
+
+    def get_stats(self):
+        """
+        Summarizes every phase in a JSON serializable format.
+
+        :return: The count, total, mean, minimum, and maximum time plus a histogram for each phase and algorithm, the
+            histogram maps the exclusive upper bound in nanoseconds to the number of calls below it.
+        :rtype: dict
+        """
+        resp = dict()
+        for phase, algorithm in self._get_sorted_keys():
+            count, total_ns, min_ns, max_ns, hist_list = self.phases_dict[(phase, algorithm)]
+            resp.setdefault(phase, dict())[str(algorithm)] = {
+                'count': count,
+                'total_ms': total_ns / 1e6,
+                'mean_us': total_ns / count / 1e3,
+                'min_us': min_ns / 1e3,
+                'max_us': max_ns / 1e3,
+                'hist_dict': {str(2 ** bucket): num_calls for bucket, num_calls in enumerate(hist_list) if num_calls},
+            }
+
+        return resp
+
+    def get_summary_list(self):
+        """
+        Gets one readable line per phase and algorithm, the most expensive first.
+
+        :return: The summary lines.
+        :rtype: list
+        """
+        total_ns = sum(phase_list[1] for phase_list in self.phases_dict.values())
+        resp = list()
+        for key in sorted(self.phases_dict, key=lambda curr_key: -self.phases_dict[curr_key][1]):
+            count, phase_ns = self.phases_dict[key][:2]
+            percent = 100 * phase_ns / total_ns if total_ns else 0.0
+            resp.append(f'{key[0]} ({key[1]}): {count} calls, {phase_ns / 1e6:.2f} ms total, '
+                        f'{phase_ns / count / 1e3:.2f} us mean, {percent:.1f}%')
+
+        return resp
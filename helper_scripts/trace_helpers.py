@@ -0,0 +1,184 @@
+import hashlib
+import heapq
+import json
+import os
+
+import numpy as np
+
+from src.request_generator import get_requests
+from helper_scripts.os_helpers import create_dir
+
+# One row per request, nodes and bandwidths are stored as indexes into the lists used to generate them
+TRACE_DTYPE = np.dtype([
+    ('req_id', np.int32),
+    ('source', np.int32),
+    ('destination', np.int32),
+    ('arrive', np.float64),
+    ('depart', np.float64),
+    ('bandwidth', np.int8),
+])
+# Files whose contents change the generated traffic
+TRACE_CODE_LIST = [os.path.join('src', 'request_generator.py'), os.path.join('helper_scripts', 'random_helpers.py')]
+
+
+def _get_nodes_list(engine_props: dict):
+    if engine_props['is_only_core_node']:
+        return list(engine_props['topology_info']['nodes'].keys())
+
+    return list(engine_props['core_nodes'])
+
+
+def get_trace_key(seed: int, engine_props: dict):
+    """
+    Finds the identifier of a request trace, every simulation with the same nodes, arrival rate, holding time, and
+    bandwidth distribution shares the trace of a seed regardless of its routing or allocation policies.
+
+    :param seed: The seed used to generate the requests.
+    :param engine_props: Properties from the engine class.
+    :return: The trace key.
+    :rtype: str
+    """
+    key_dict = {
+        'seed': seed,
+        'nodes_list': _get_nodes_list(engine_props=engine_props),
+        'bandwidth_list': list(engine_props['mod_per_bw'].keys()),
+        'request_distribution': engine_props['request_distribution'],
+        'num_requests': engine_props['num_requests'],
+        'arrival_rate': float(engine_props['arrival_rate']),
+        'holding_time': float(engine_props['holding_time']),
+        'rng_streams': bool(engine_props.get('rng_streams')),
+    }
+    hash_obj = hashlib.sha256(json.dumps(key_dict, sort_keys=True).encode('utf-8'))
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for file_path in TRACE_CODE_LIST:
+        with open(os.path.join(base_dir, file_path), 'rb') as file_obj:
+            hash_obj.update(file_obj.read())
+
+    return hash_obj.hexdigest()
+
+
+def requests_to_trace(reqs_dict: dict, engine_props: dict):
+    """
+    Converts generated requests to a compact structured array.
+
+    :param reqs_dict: The requests from the request generator.
+    :param engine_props: Properties from the engine class.
+    :return: One row per request.
+    :rtype: np.ndarray
+    """
+    node_index_dict = {node: index for index, node in enumerate(_get_nodes_list(engine_props=engine_props))}
+    bw_index_dict = {bandwidth: index for index, bandwidth in enumerate(engine_props['mod_per_bw'])}
+
+    arrival_list = [req_dict for req_dict in reqs_dict.values() if req_dict['request_type'] == 'arrival']
+    trace_arr = np.empty(len(arrival_list), dtype=TRACE_DTYPE)
+    for index, req_dict in enumerate(arrival_list):
+        trace_arr[index] = (req_dict['req_id'], node_index_dict[req_dict['source']],
+                            node_index_dict[req_dict['destination']], req_dict['arrive'], req_dict['depart'],
+                            bw_index_dict[req_dict['bandwidth']])
+
+    return trace_arr
+
+
+def trace_to_requests(trace_arr: np.ndarray, engine_props: dict):
+    """
+    Rebuilds the time-sorted requests dictionary the engine expects from a trace.
+
+    :param trace_arr: One row per request.
+    :param engine_props: Properties from the engine class.
+    :return: Arrivals and releases keyed by time.
+    :rtype: dict
+    """
+    nodes_list = _get_nodes_list(engine_props=engine_props)
+    bw_names_list = list(engine_props['mod_per_bw'].keys())
+
+    req_id_list = trace_arr['req_id'].tolist()
+    source_list = [nodes_list[index] for index in trace_arr['source'].tolist()]
+    dest_list = [nodes_list[index] for index in trace_arr['destination'].tolist()]
+    arrive_list = trace_arr['arrive'].tolist()
+    depart_list = trace_arr['depart'].tolist()
+    bandwidth_list = [bw_names_list[index] for index in trace_arr['bandwidth'].tolist()]
+
+    times_arr = np.concatenate((trace_arr['arrive'], trace_arr['depart']))
+    num_reqs = len(trace_arr)
+    reqs_dict = dict()
+    for index in np.argsort(times_arr, kind='stable').tolist():
+        row = index % num_reqs
+        request_type = 'arrival' if index < num_reqs else 'release'
+        curr_time = arrive_list[row] if index < num_reqs else depart_list[row]
+        reqs_dict[curr_time] = {
+            "req_id": req_id_list[row],
+            "source": source_list[row],
+            "destination": dest_list[row],
+            "arrive": arrive_list[row],
+            "depart": depart_list[row],
+            "request_type": request_type,
+            "bandwidth": bandwidth_list[row],
+            "mod_formats": engine_props['mod_per_bw'][bandwidth_list[row]],
+        }
+
+    return reqs_dict
+
+
+def iter_trace_requests(trace_arr: np.ndarray, engine_props: dict, chunk_size: int = 65536):
+    """
+    Rebuilds the requests of a trace one at a time in the order of trace_to_requests, reading the trace in chunks so
+    only the releases of arrived requests are held in memory.
+
+    :param trace_arr: One row per request, sorted by arrival time.
+    :param engine_props: Properties from the engine class.
+    :param chunk_size: The number of rows read at once.
+    :return: The time and information of every arrival and release.
+    :rtype: generator
+    """
+    nodes_list = _get_nodes_list(engine_props=engine_props)
+    bw_names_list = list(engine_props['mod_per_bw'].keys())
+    # Releases that have not happened yet, ordered by time
+    releases_list = list()
+    for start_index in range(0, len(trace_arr), chunk_size):
+        chunk_arr = trace_arr[start_index:start_index + chunk_size]
+        for req_id, source, dest, arrive, depart, bandwidth in zip(*(chunk_arr[name].tolist()
+                                                                     for name in TRACE_DTYPE.names)):
+            while releases_list and releases_list[0][0] < arrive:
+                release_time, _, release_dict = heapq.heappop(releases_list)
+                yield release_time, release_dict
+
+            req_dict = {
+                "req_id": req_id,
+                "source": nodes_list[source],
+                "destination": nodes_list[dest],
+                "arrive": arrive,
+                "depart": depart,
+                "request_type": 'arrival',
+                "bandwidth": bw_names_list[bandwidth],
+                "mod_formats": engine_props['mod_per_bw'][bw_names_list[bandwidth]],
+            }
+            yield arrive, req_dict
+            heapq.heappush(releases_list, (depart, req_id, dict(req_dict, request_type='release')))
+
+    while releases_list:
+        release_time, _, release_dict = heapq.heappop(releases_list)
+        yield release_time, release_dict
+
+
+def get_trace(seed: int, engine_props: dict, base_fp: str = 'data'):
+    """
+    Loads the request trace of a seed as a memory map, generating and saving it first if no simulation has yet.
+
+    :param seed: The seed used to generate the requests.
+    :param engine_props: Properties from the engine class.
+    :param base_fp: The base file path, traces are saved in the traces directory.
+    :return: One row per request.
+    :rtype: np.ndarray
+    """
+    trace_dir = os.path.join(base_fp, 'traces')
+    trace_fp = os.path.join(trace_dir, f'{get_trace_key(seed=seed, engine_props=engine_props)}.npy')
+    if not os.path.isfile(trace_fp):
+        reqs_dict = get_requests(seed=seed, engine_props=engine_props)
+        create_dir(trace_dir)
+        # Parallel workers may generate the same trace, write it under a temporary name and move it in one step
+        tmp_fp = os.path.join(trace_dir, f'.{os.getpid()}_{os.path.basename(trace_fp)}')
+        np.save(tmp_fp, requests_to_trace(reqs_dict=reqs_dict, engine_props=engine_props))
+        os.replace(tmp_fp, trace_fp)
+
+    return np.load(trace_fp, mmap_mode='r')
@@ -0,0 +1,59 @@
+import numpy as np
+
+# Every counter kept for each core of a band
+USAGE_KEY_LIST = ['taken_matrix', 'guard_matrix', 'active_matrix']
+
+
+def create_usage(cores_matrix: dict):
+    """
+    Creates the usage counters of a link, they start at zero like a free spectrum. For every core of every band, they
+    count the taken slots (guard bands included), the guard slots, and the requests using the core. The number of
+    requests whose path starts on the link is counted once for the whole link.
+
+    :param cores_matrix: The cores of every band of a link.
+    :return: The usage counters of the link.
+    :rtype: dict
+    """
+    usage_dict = dict()
+    for usage_key in USAGE_KEY_LIST:
+        usage_dict[usage_key] = {band: np.zeros(len(cores_arr), dtype=np.int64)
+                                 for band, cores_arr in cores_matrix.items()}
+    usage_dict['num_reqs'] = 0
+    return usage_dict
+
+
+def reset_usage(usage_dict: dict):
+    """
+    Sets every usage counter of a link back to zero, in place.
+
+    :param usage_dict: The usage counters of the link.
+    """
+    for usage_key in USAGE_KEY_LIST:
+        for usage_arr in usage_dict[usage_key].values():
+            usage_arr.fill(0)
+    usage_dict['num_reqs'] = 0
+
+
+def get_network_usage(net_spec_dict: dict):
+    """
+    Adds up the usage counters of every link, each link is counted once even though both directions are in the
+    network spectrum database.
+
+    :param net_spec_dict: The network spectrum database, every link must have usage counters.
+    :return: The taken slots, guard slots, and active requests in the network.
+    :rtype: tuple
+    """
+    taken_slots, guard_slots, active_reqs = 0, 0, 0
+    seen_set = set()
+    for link_dict in net_spec_dict.values():
+        usage_dict = link_dict['usage_dict']
+        if id(usage_dict) in seen_set:
+            continue
+        seen_set.add(id(usage_dict))
+
+        for band, taken_arr in usage_dict['taken_matrix'].items():
+            taken_slots += int(taken_arr.sum())
+            guard_slots += int(usage_dict['guard_matrix'][band].sum())
+        active_reqs += usage_dict['num_reqs']
+
+    return taken_slots, guard_slots, active_reqs
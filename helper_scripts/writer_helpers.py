@@ -0,0 +1,140 @@
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+
+from helper_scripts.os_helpers import create_dir
+
+# Lists at least this long are saved in binary instead of JSON text, e.g., start and end slots
+ARRAY_MIN_LEN = 64
+# Marks a statistic that was moved to the arrays file of its iteration
+ARRAY_KEY = '__array__'
+
+
+def _is_array(value: object):
+    if not isinstance(value, list) or len(value) < ARRAY_MIN_LEN:
+        return False
+
+    # Mixed types would not survive the round trip, e.g., integers would come back as floats
+    first_type = type(value[0])
+    # pylint: disable-next=unidiomatic-typecheck
+    return first_type in (int, float) and all(type(data) is first_type for data in value)
+
+
+class ResultsWriter:
+    """
+    Saves simulation results on a background thread. Every save appends one record per iteration to a JSON Lines
+    file, long numeric lists go to a compressed numpy file, and closing the writer consolidates the records into the
+    usual results JSON.
+    """
+
+    def __init__(self, save_fp: str, erlang: float, max_queue: int = 4, callback=None):
+        self.save_fp = save_fp
+        # Called on the writer thread with every record after it was written, e.g., to update the results catalog
+        self.callback = callback
+        self.file_name = f'{erlang}_erlang'
+        self.records_fp = os.path.join(save_fp, f'{self.file_name}.jsonl')
+        self.arrays_dir = os.path.join(save_fp, f'{self.file_name}_arrays')
+        # Bounded, the simulation only waits if the writer falls this many saves behind
+        self.queue_obj = queue.Queue(maxsize=max_queue)
+        self.error = None
+
+        create_dir(save_fp)
+        self.thread_obj = threading.Thread(target=self._run, daemon=True)
+        self.thread_obj.start()
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise RuntimeError(f'Saving results to {self.save_fp} failed.') from self.error
+
+    def put(self, iteration: int, header_dict: dict, iter_dict: dict):
+        """
+        Queues the results of an iteration, the dictionaries must not be modified afterward.
+
+        :param iteration: The iteration number.
+        :param header_dict: The overall statistics, e.g., the blocking mean and confidence interval.
+        :param iter_dict: The statistics of this iteration.
+        """
+        self._raise_error()
+        self.queue_obj.put({'iteration': iteration, 'header_dict': header_dict, 'iter_stats': iter_dict})
+
+    def _run(self):
+        while True:
+            record_dict = self.queue_obj.get()
+            if record_dict is None:
+                return
+            # Keep draining so the simulation never blocks on a full queue, the error is raised on its thread
+            if self.error is not None:
+                continue
+            try:
+                self._write(record_dict=record_dict)
+                if self.callback is not None:
+                    self.callback(record_dict)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.error = error
+
+    def _write(self, record_dict: dict):
+        iteration = record_dict['iteration']
+        arrays_dict = dict()
+        iter_dict = dict()
+        for stat_key, value in record_dict['iter_stats'].items():
+            if _is_array(value=value):
+                arrays_dict[stat_key] = np.asarray(value)
+                iter_dict[stat_key] = {ARRAY_KEY: stat_key}
+            else:
+                iter_dict[stat_key] = value
+
+        # Arrays first, a record never points to a file that does not exist yet
+        if arrays_dict:
+            create_dir(self.arrays_dir)
+            np.savez_compressed(os.path.join(self.arrays_dir, f'{iteration}.npz'), **arrays_dict)
+        record_dict = dict(record_dict, iter_stats=iter_dict)
+        with open(self.records_fp, 'a', encoding='utf-8') as file_obj:
+            file_obj.write(json.dumps(record_dict) + '\n')
+
+    def _load_arrays(self, iteration: int, iter_dict: dict):
+        arrays_fp = os.path.join(self.arrays_dir, f'{iteration}.npz')
+        array_keys_list = [stat_key for stat_key, value in iter_dict.items()
+                           if isinstance(value, dict) and ARRAY_KEY in value]
+        if not array_keys_list:
+            return
+
+        with np.load(arrays_fp) as arrays_obj:
+            for stat_key in array_keys_list:
+                iter_dict[stat_key] = arrays_obj[iter_dict[stat_key][ARRAY_KEY]].tolist()
+
+    def consolidate(self):
+        """
+        Writes every saved record to the results JSON in the format of a synchronous save.
+
+        :return: The consolidated results.
+        :rtype: dict
+        """
+        save_dict = {'iter_stats': dict()}
+        if os.path.isfile(self.records_fp):
+            with open(self.records_fp, 'r', encoding='utf-8') as file_obj:
+                for line in file_obj:
+                    record_dict = json.loads(line)
+                    self._load_arrays(iteration=record_dict['iteration'], iter_dict=record_dict['iter_stats'])
+                    # Later records of the same iteration replace earlier ones, the overall statistics are the latest
+                    save_dict['iter_stats'][record_dict['iteration']] = record_dict['iter_stats']
+                    save_dict.update(record_dict['header_dict'])
+
+        tmp_fp = os.path.join(self.save_fp, f'.{self.file_name}.json.tmp')
+        with open(tmp_fp, 'w', encoding='utf-8') as file_obj:
+            json.dump(save_dict, file_obj, indent=4)
+        os.replace(tmp_fp, os.path.join(self.save_fp, f'{self.file_name}.json'))
+
+        return save_dict
+
+    def close(self):
+        """
+        Waits for every queued save to be written, then consolidates the results.
+        """
+        if self.thread_obj.is_alive():
+            self.queue_obj.put(None)
+            self.thread_obj.join()
+        self._raise_error()
+        self.consolidate()
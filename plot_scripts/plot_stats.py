@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 
 from arg_scripts.plot_args import PlotProps
 from helper_scripts.os_helpers import create_dir
-from helper_scripts.plot_helpers import PlotHelpers, find_times
+from helper_scripts.plot_helpers import PlotHelpers, find_sims
 
 
 class PlotStats:
@@ -196,7 +196,10 @@ def main():
         ]
     }
 
-    sims_info_dict = find_times(dates_dict={'0624': 'NSFNet', '0625': 'NSFNet'}, filter_dict=filter_dict)
+    dates_dict = {'0624': 'NSFNet', '0625': 'NSFNet'}
+    catalog_fp = PlotProps().catalog_fp
+    # Query the results catalog, and the input files of simulations saved without it
+    sims_info_dict = find_sims(dates_dict=dates_dict, filter_dict=filter_dict, catalog_fp=catalog_fp)
     plot_obj = PlotStats(sims_info_dict=sims_info_dict)
 
     plot_obj.plot_blocking(art_int=True)
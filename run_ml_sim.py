@@ -1,5 +1,6 @@
 import os
 import glob
+import concurrent.futures
 
 import pandas as pd
 from sklearn.neighbors import KNeighborsClassifier
@@ -23,9 +24,9 @@ def _train_test_knn(df_processed: pd.DataFrame, sim_dict: dict, erlang: str):
     knn.fit(x_train, y_train)
 
     y_pred = knn.predict(x_test)
-    plot_confusion(sim_dict=sim_dict, y_test=y_test, y_pred=y_pred, erlang=erlang, algorithm='KNN')
+    metrics_dict = plot_confusion(sim_dict=sim_dict, y_test=y_test, y_pred=y_pred, erlang=erlang, algorithm='KNN')
 
-    save_model(sim_dict=sim_dict, model=knn, algorithm='knn', erlang=erlang)
+    return knn, metrics_dict
 
 
 def _train_test_dt(df_processed: pd.DataFrame, sim_dict: dict, erlang: str):
@@ -37,9 +38,10 @@ def _train_test_dt(df_processed: pd.DataFrame, sim_dict: dict, erlang: str):
     dt_obj = DecisionTreeClassifier(random_state=0)
     dt_obj.fit(x_train, y_train)
     y_pred = dt_obj.predict(x_test)
-    plot_confusion(sim_dict=sim_dict, y_test=y_test, y_pred=y_pred, erlang=erlang, algorithm='Decision Tree')
+    metrics_dict = plot_confusion(sim_dict=sim_dict, y_test=y_test, y_pred=y_pred, erlang=erlang,
+                                  algorithm='Decision Tree')
 
-    save_model(sim_dict=sim_dict, model=dt_obj, algorithm='decision_tree', erlang=erlang)
+    return dt_obj, metrics_dict
 
 
 def _train_test_lr(df_processed: pd.DataFrame, sim_dict: dict, erlang: str):
@@ -51,10 +53,10 @@ def _train_test_lr(df_processed: pd.DataFrame, sim_dict: dict, erlang: str):
     lr_obj = LogisticRegression(random_state=0, n_jobs=-1)
     lr_obj.fit(x_train, y_train)
     y_pred = lr_obj.predict(x_test)
-    plot_confusion(sim_dict=sim_dict, y_test=y_test, y_pred=y_pred, erlang=erlang,
-                   algorithm='Logistic Regression')
+    metrics_dict = plot_confusion(sim_dict=sim_dict, y_test=y_test, y_pred=y_pred, erlang=erlang,
+                                  algorithm='Logistic Regression')
 
-    save_model(sim_dict=sim_dict, model=lr_obj, algorithm='logistic_regression', erlang=erlang)
+    return lr_obj, metrics_dict
 
 
 def extract_value(path: str):
@@ -80,20 +82,24 @@ def _handle_training(sim_dict: dict, file_path: str):
     erlang = extract_value(path=file_path)
     df_processed = process_data(sim_dict=sim_dict, input_df=data_frame, erlang=erlang)
     if sim_dict['ml_model'] == 'knn':
-        _train_test_knn(df_processed=df_processed, sim_dict=sim_dict, erlang=erlang)
+        model, metrics_dict = _train_test_knn(df_processed=df_processed, sim_dict=sim_dict, erlang=erlang)
     elif sim_dict['ml_model'] == 'logistic_regression':
-        _train_test_lr(df_processed=df_processed, sim_dict=sim_dict, erlang=erlang)
+        model, metrics_dict = _train_test_lr(df_processed=df_processed, sim_dict=sim_dict, erlang=erlang)
     elif sim_dict['ml_model'] == 'decision_tree':
-        _train_test_dt(df_processed=df_processed, sim_dict=sim_dict, erlang=erlang)
+        model, metrics_dict = _train_test_dt(df_processed=df_processed, sim_dict=sim_dict, erlang=erlang)
     else:
         raise NotImplementedError
 
+    return erlang, model, metrics_dict
+
 
 def _run(sim_dict: dict):
     """
-    Controls the simulation of the machine learning model.
+    Controls the simulation of the machine learning model. Every Erlang is trained in its own worker process, models
+    are saved here once they are all trained.
 
-    :return: None
+    :return: The metrics of every Erlang's model.
+    :rtype: dict
     """
     # TODO: Only support for running one process (s1)
     sim_dict = sim_dict['s1']
@@ -102,8 +108,16 @@ def _run(sim_dict: dict):
     train_dir = os.path.join(base_fp, sim_dict['train_file_path'])
     train_files = glob.glob(os.path.join(train_dir, "*.csv"))
 
-    for train_fp in train_files:
-        _handle_training(sim_dict=sim_dict, file_path=train_fp)
+    metrics_dict = dict()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=sim_dict.get('num_workers')) as executor:
+        futures_list = [executor.submit(_handle_training, sim_dict=sim_dict, file_path=train_fp)
+                        for train_fp in train_files]
+        for future in concurrent.futures.as_completed(futures_list):
+            erlang, model, metrics_dict[erlang] = future.result()
+            save_model(sim_dict=sim_dict, model=model, algorithm=sim_dict['ml_model'], erlang=erlang)
+            print(f"Trained the {sim_dict['ml_model']} model for Erlang {erlang}: {metrics_dict[erlang]}")
+
+    return metrics_dict
 
 
 def _setup_ml_sim():
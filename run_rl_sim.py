@@ -10,13 +10,16 @@ from stable_baselines3 import PPO
 
 from src.engine import Engine
 from src.routing import Routing
-from helper_scripts.rl_setup_helpers import setup_rl_sim, print_info, setup_ppo
+from helper_scripts.rl_setup_helpers import setup_rl_sim, print_info, setup_ppo, setup_vec_env, get_worker_props
 from helper_scripts.setup_helpers import create_input, save_input
 from helper_scripts.rl_helpers import RLHelpers
 from helper_scripts.callback_helpers import GetModelParams
 from helper_scripts.sim_helpers import get_start_time, find_path_len, get_path_mod, modify_multiple_json_values
+from helper_scripts.sim_helpers import parse_yaml_file
 from helper_scripts.sim_helpers import get_arrival_rates, run_simulation_for_arrival_rates, save_study_results
 from helper_scripts.multi_agent_helpers import PathAgent, CoreAgent, SpectrumAgent
+from helper_scripts.random_helpers import get_generator
+from helper_scripts.optuna_helpers import get_storage, get_pruner, run_study, is_multi_process
 from arg_scripts.rl_args import RLProps, LOCAL_RL_COMMANDS_LIST, VALID_PATH_ALGORITHMS, VALID_CORE_ALGORITHMS
 from arg_scripts.rl_args import VALID_SPECTRUM_ALGORITHMS, get_optuna_hyperparams
 
@@ -31,8 +34,10 @@ class SimEnv(gym.Env):  # pylint: disable=abstract-method
     metadata = dict()
 
     def __init__(self, render_mode: str = None, custom_callback: object = None, sim_dict: dict = None,
-                 **kwargs):  # pylint: disable=unused-argument
+                 worker_num: int = None, **kwargs):  # pylint: disable=unused-argument
         super().__init__()
+        # Only set for workers of a vectorized environment
+        self.worker_num = worker_num
 
         self.rl_props = RLProps()
 
@@ -166,19 +171,15 @@ class SimEnv(gym.Env):  # pylint: disable=abstract-method
         # Default to first fit if all paths fail
         self.rl_props.chosen_path = [self.route_obj.route_props.paths_matrix[0]]
         self.rl_props.chosen_path_index = 0
-        for path_index, path_list in enumerate(self.route_obj.route_props.paths_matrix):
-            mod_format_list = self.route_obj.route_props.mod_formats_matrix[path_index]
-
-            was_allocated = self.rl_help_obj.mock_handle_arrival(engine_props=self.engine_obj.engine_props,
-                                                                 sdn_props=self.rl_props.mock_sdn_dict,
-                                                                 mod_format_list=mod_format_list, path_list=path_list)
-
-            if was_allocated:
-                self.rl_props.chosen_path_list = [path_list]
-                self.rl_props.chosen_path_index = path_index
-                self.core_agent.no_penalty = False
-                break
-
+        route_props = self.route_obj.route_props
+        path_index = self.rl_help_obj.find_feasible_path(paths_matrix=route_props.paths_matrix,
+                                                         mod_formats_matrix=route_props.mod_formats_matrix,
+                                                         sdn_props=self.rl_props.mock_sdn_dict)
+        if path_index is not None:
+            self.rl_props.chosen_path_list = [route_props.paths_matrix[path_index]]
+            self.rl_props.chosen_path_index = path_index
+            self.core_agent.no_penalty = False
+        else:
             self.core_agent.no_penalty = True
 
     def _handle_core_train(self):
@@ -283,12 +284,17 @@ class SimEnv(gym.Env):  # pylint: disable=abstract-method
 
     def _create_input(self):
         base_fp = os.path.join('data')
-        self.sim_dict['thread_num'] = 's1'
-        # fixme
-        # Added only for structure consistency
-        # time.sleep(20)
-        get_start_time(sim_dict={'s1': self.sim_dict})
-        file_name = "sim_input_s1.json"
+        if self.worker_num is None or not self.sim_dict.get('sim_start'):
+            # fixme
+            # Added only for structure consistency
+            # time.sleep(20)
+            get_start_time(sim_dict={'s1': self.sim_dict})
+            # Trials of a study may start at the same time, each one keeps its own directories
+            if self.sim_dict.get('trial_num') is not None:
+                self.sim_dict['sim_start'] = f"{self.sim_dict['sim_start']}_t{self.sim_dict['trial_num']}"
+        # Workers share the start time and save their input and output under their own simulation number
+        self.sim_dict['thread_num'], _ = get_worker_props(worker_num=self.worker_num)
+        file_name = f"sim_input_{self.sim_dict['thread_num']}.json"
 
         self.engine_obj = Engine(engine_props=self.sim_dict)
         self.route_obj = Routing(engine_props=self.engine_obj.engine_props,
@@ -330,7 +336,9 @@ class SimEnv(gym.Env):  # pylint: disable=abstract-method
         # TODO: Only support for 'c' band...Maybe add multi-band
         self.rl_props.spectral_slots = self.sim_dict['c_band']
 
-        self._create_input()
+        # The inputs, engine, and routing are kept in memory after the first setup
+        if self.engine_obj is None or not self.sim_dict['fast_reset']:
+            self._create_input()
 
         self.sim_dict['arrival_dict'] = {
             'start': self.sim_dict['arrival_start'],
@@ -343,8 +351,13 @@ class SimEnv(gym.Env):  # pylint: disable=abstract-method
 
     def _init_props_envs(self):
         self.rl_props.arrival_count = 0
-        self.engine_obj.init_iter(iteration=self.iteration)
-        self.engine_obj.create_topology()
+        if self.sim_dict['fast_reset'] and self.engine_obj.net_spec_dict:
+            # Requests are generated once by reset, only the spectrum is freed
+            self.engine_obj.init_iter(iteration=self.iteration, gen_reqs=False)
+            self.engine_obj.reset_spectrum()
+        else:
+            self.engine_obj.init_iter(iteration=self.iteration)
+            self.engine_obj.create_topology()
         self.rl_help_obj.topology = self.engine_obj.topology
         self.rl_props.num_nodes = len(self.engine_obj.topology.nodes)
 
@@ -355,6 +368,14 @@ class SimEnv(gym.Env):  # pylint: disable=abstract-method
         self.rl_help_obj.engine_obj = self.engine_obj
         self.rl_help_obj.route_obj = self.route_obj
 
+    def _set_rng_streams(self, seed: int):
+        # Every agent draws from its own stream for this simulation, Erlang, and iteration
+        key_list = [self.sim_dict['thread_num'], self.sim_dict['erlang'], self.iteration]
+        for agent_name, agent_obj in (('path_agent', self.path_agent), ('core_agent', self.core_agent)):
+            agent_obj.rng = get_generator(seed=seed, stream_key_list=key_list + [agent_name])
+            if agent_obj.agent_obj is not None:
+                agent_obj.agent_obj.rng = get_generator(seed=seed, stream_key_list=key_list + [agent_name, 'agent'])
+
     def reset(self, seed: int = None, options: dict = None):  # pylint: disable=arguments-differ
         """
         Resets necessary variables after each iteration of the simulation.
@@ -379,8 +400,11 @@ class SimEnv(gym.Env):  # pylint: disable=abstract-method
         if seed is None:
             # fixme
             # seed = self.iteration + 1
-            seed = 0
+            # Workers see different traffic
+            _, seed = get_worker_props(worker_num=self.worker_num)
 
+        if self.sim_dict['rng_streams']:
+            self._set_rng_streams(seed=seed)
         self.rl_help_obj.reset_reqs_dict(seed=seed)
         obs = self._get_obs()
         info = self._get_info()
@@ -409,8 +433,8 @@ def _run_iters(env: object, sim_dict: dict, is_training: bool, model=None):
 
 def _get_model(algorithm: str, device: str, env: object):
     model = None
-    yaml_dict = None
-    env_name = None
+    yaml_dict = parse_yaml_file(os.path.join('sb3_scripts', 'yml', f'{algorithm}.yml'))
+    env_name = list(yaml_dict.keys())[0]
 
     if algorithm == 'dqn':
         model = None
@@ -456,10 +480,17 @@ def _run_spectrum(sim_dict: dict, env: object):
     if sim_dict['optimize_hyperparameters']:
         _run_rl_zoo(sim_dict=sim_dict)
     else:
+        # Steps one simulation per worker while the policy trains
+        if sim_dict.get('num_workers') and sim_dict['num_workers'] > 1:
+            train_env = setup_vec_env(env_cls=type(env), sim_dict=sim_dict, num_envs=sim_dict['num_workers'])
+        else:
+            train_env = env
         model, yaml_dict = _get_model(algorithm=sim_dict['spectrum_algorithm'], device=sim_dict['device'],
-                                      env=env)
+                                      env=train_env)
         model.learn(total_timesteps=yaml_dict['n_timesteps'], log_interval=sim_dict['print_step'],
                     callback=sim_dict['callback'])
+        if train_env is not env:
+            train_env.close()
 
         save_fp = os.path.join('logs', 'ppo', env.modified_props['network'], env.modified_props['date'],
                                env.modified_props['sim_start'], 'ppo_model.zip')
@@ -479,55 +510,85 @@ def _run(env: object, sim_dict: dict):
         _run_testing(sim_dict=sim_dict, env=env)
 
 
-# fixme: Saves extra input directory
-# fixme: Saves to second traffic volume file (400 to 500)
-def run_rl_sim():
-    """
-    The main function that controls reinforcement learning simulations, including hyperparameter optimization.
+def _get_arrival_workers(sim_dict: dict):
+    # Every arrival rate then trains in its own process, starting from a fresh environment
+    if not sim_dict.get('parallel_arrivals'):
+        return None
+
+    num_workers = sim_dict.get('num_workers') or os.cpu_count()
+    # Every process running trials opens its own pool, together they use no more processes than one pool would
+    if sim_dict['optimize'] and is_multi_process(n_jobs=sim_dict.get('n_jobs'),
+                                                 storage_type=sim_dict.get('optuna_storage')):
+        num_workers = max(1, num_workers // sim_dict['n_jobs'])
+
+    return num_workers
+
+
+def _objective(trial: optuna.Trial):
     """
+    Objective function for Optuna, used to optimize hyperparameters during simulations.
 
-    def objective(trial: optuna.Trial):
-        """
-        Objective function for Optuna, used to optimize hyperparameters during simulations.
+    :param trial: The Optuna trial object used to suggest hyperparameters.
+    :return: The mean of total rewards from all simulations.
+    :rtype: float
+    """
+    callback = GetModelParams()
+    sim_dict = setup_rl_sim()
+    sim_dict['s1']['trial_num'] = trial.number
+    env = SimEnv(render_mode=None, custom_callback=callback, sim_dict=sim_dict)
+    env.sim_dict['callback'] = callback
 
-        :param trial: The Optuna trial object used to suggest hyperparameters.
-        :return: The mean of total rewards from all simulations.
-        :rtype: float
-        """
-        callback = GetModelParams()
-        env = SimEnv(render_mode=None, custom_callback=callback, sim_dict=setup_rl_sim())
-        env.sim_dict['callback'] = callback
+    hyperparam_dict = get_optuna_hyperparams(sim_dict=env.sim_dict, trial=trial)
+    update_list = list()
+    for param, value in hyperparam_dict.items():
+        if param not in env.sim_dict:
+            raise NotImplementedError(f'Param: {param} does not exist in simulation dictionary.')
+        env.sim_dict[param] = value
+        update_list.append((param, value))
 
-        hyperparam_dict = get_optuna_hyperparams(sim_dict=env.sim_dict, trial=trial)
-        update_list = list()
-        for param, value in hyperparam_dict.items():
-            if param not in env.sim_dict:
-                raise NotImplementedError(f'Param: {param} does not exist in simulation dictionary.')
-            env.sim_dict[param] = value
-            update_list.append((param, value))
+    # Overrides the previous input file
+    file_path = os.path.join('data', 'input', env.sim_dict['network'], env.sim_dict['date'],
+                             env.sim_dict['sim_start'], 'sim_input_s1.json')
+    modify_multiple_json_values(file_path=file_path, update_list=update_list)
 
-        # Overrides the previous input file
-        file_path = os.path.join('data', 'input', env.sim_dict['network'], env.sim_dict['date'],
-                                 env.sim_dict['sim_start'], 'sim_input_s1.json')
-        modify_multiple_json_values(file_path=file_path, update_list=update_list)
+    arrival_list = get_arrival_rates(arrival_dict=env.sim_dict['arrival_dict'])
+    trial.set_user_attr("sim_start_time", env.sim_dict['sim_start'])
+    mean_reward = run_simulation_for_arrival_rates(env=env, arrival_list=arrival_list, run_func=_run, trial=trial,
+                                                   num_workers=_get_arrival_workers(sim_dict=env.sim_dict))
+    if mean_reward is None:
+        raise optuna.TrialPruned()
 
-        arrival_list = get_arrival_rates(arrival_dict=env.sim_dict['arrival_dict'])
-        mean_reward = run_simulation_for_arrival_rates(env=env, arrival_list=arrival_list, run_func=_run)
-        trial.set_user_attr("sim_start_time", env.sim_dict['sim_start'])
+    return mean_reward
 
-        return mean_reward
 
+# fixme: Saves extra input directory
+# fixme: Saves to second traffic volume file (400 to 500)
+def run_rl_sim():
+    """
+    The main function that controls reinforcement learning simulations, including hyperparameter optimization.
+    """
     callback = GetModelParams()
     env = SimEnv(render_mode=None, custom_callback=callback, sim_dict=setup_rl_sim())
     env.sim_dict['callback'] = callback
 
     if not env.sim_dict['optimize']:
-        _run(env=env, sim_dict=env.sim_dict)
+        if env.sim_dict.get('parallel_arrivals'):
+            arrival_list = get_arrival_rates(arrival_dict=env.sim_dict['arrival_dict'])
+            run_simulation_for_arrival_rates(env=env, arrival_list=arrival_list, run_func=_run,
+                                             num_workers=_get_arrival_workers(sim_dict=env.sim_dict))
+        else:
+            _run(env=env, sim_dict=env.sim_dict)
     else:
         study_name = "hyperparam_study.pkl"
-        study = optuna.create_study(direction='maximize', study_name=study_name)
+        save_dir = os.path.join('logs', env.sim_dict['path_algorithm'], env.sim_dict['network'],
+                                env.sim_dict['date'], env.sim_dict['sim_start'])
+        storage_type = env.sim_dict.get('optuna_storage')
+        study = optuna.create_study(direction='maximize', study_name=study_name,
+                                    storage=get_storage(storage_type=storage_type, save_dir=save_dir),
+                                    pruner=get_pruner(pruner_type=env.sim_dict.get('optuna_pruner')))
         n_trials = env.sim_dict['n_trials']
-        study.optimize(objective, n_trials=n_trials)
+        run_study(study=study, objective=_objective, n_trials=n_trials, n_jobs=env.sim_dict.get('n_jobs'),
+                  storage_type=storage_type, save_dir=save_dir)
 
         best_trial = study.best_trial
         best_reward = best_trial.value
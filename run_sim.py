@@ -1,6 +1,7 @@
 # Standard library imports
-import time
+import os
 import copy
+import functools
 from datetime import datetime
 
 # Third-party library imports
@@ -8,6 +9,9 @@ import concurrent.futures
 
 # Local application imports
 from helper_scripts.setup_helpers import create_input, save_input
+from helper_scripts.cache_helpers import load_cached_result, save_cached_result
+from helper_scripts.queue_helpers import JobQueue, run_worker
+from helper_scripts.profile_helpers import get_profile_dir, run_profiled, merge_profiles, print_top_functions
 from src.engine import Engine
 from config_scripts.setup_config import read_config
 from config_scripts.parse_args import parse_args
@@ -24,51 +28,67 @@ class NetworkSimulator:
         """
         # Contains all the desired network simulator parameters for every simulation
         self.properties = None
+        # Each Erlang is profiled and saved here when set
+        self.profile_dir = None
+
+    def setup_input(self):
+        """
+        Creates the input data shared by every Erlang of this simulation, so worker processes never rebuild it.
+        """
+        self.properties = create_input(base_fp='data', engine_props=self.properties)
+
+    def get_erlang_list(self):
+        """
+        Finds every traffic volume to simulate.
+
+        :return: The Erlang values.
+        :rtype: list
+        """
+        erlang_dict = self.properties['erlangs']
+        start, stop, step = erlang_dict['start'], erlang_dict['stop'], erlang_dict['step']
+        return [float(erlang) for erlang in range(start, stop, step)]
 
     def _run_generic_sim(self, erlang: float, first_erlang: bool):
         engine_props = copy.deepcopy(self.properties)
         engine_props['arrival_rate'] = (engine_props['cores_per_link'] * erlang) / engine_props['holding_time']
         engine_props['erlang'] = erlang
         engine_props['band_list'] = list()
-        local_props = create_input(base_fp='data', engine_props=engine_props)
+        # Input was already created by setup_input
+        if engine_props.get('topology_info') is None:
+            engine_props = create_input(base_fp='data', engine_props=engine_props)
 
         if first_erlang:
-            save_input(base_fp='data', properties=engine_props, file_name=f"sim_input_{local_props['thread_num']}.json",
-                       data_dict=local_props)
+            save_input(base_fp='data', properties=engine_props,
+                       file_name=f"sim_input_{engine_props['thread_num']}.json", data_dict=engine_props)
+
+        if engine_props['use_cache'] and load_cached_result(engine_props=engine_props, base_fp='data'):
+            print(f"Erlang: {erlang} found in the cache for simulation number: {engine_props['thread_num']}.")
+            return
 
         engine = Engine(engine_props=engine_props)
         engine.run()
 
-    def run_generic_sim(self):
+        if engine_props['use_cache']:
+            save_cached_result(engine_props=engine_props, base_fp='data')
+
+    def run_erlangs(self, erlang_list: list):
         """
-        Runs a generic simulation. Using Arash's assumptions c.
-        Reference: https://doi.org/10.1016/j.comnet.2020.107755.
-        Other assumptions include Yue's. Reference: Wang, Yue. Dynamic Traffic Scheduling
-        Frameworks with Spectral and Spatial Flexibility in Sdm-Eons. Diss. University of Massachusetts Lowell, 2022.
+        Runs the given traffic volumes one after another.
+
+        :param erlang_list: The Erlang values to simulate.
         """
-        erlang_dict = self.properties['erlangs']
-        start, stop, step = erlang_dict['start'], erlang_dict['stop'], erlang_dict['step']
-        erlang_list = [float(erlang) for erlang in range(start, stop, step)]
-
-        if self.properties['thread_erlangs']:
-            with concurrent.futures.ProcessPoolExecutor() as executor:
-                futures_list = []
-                for erlang in erlang_list:
-                    first_erlang = erlang == erlang_list[0]
-                    time.sleep(1.0)
-                    future = executor.submit(self._run_generic_sim, erlang=erlang, first_erlang=first_erlang)
-                    futures_list.append(future)
-
-                for future in concurrent.futures.as_completed(futures_list):
-                    future.result()
-        else:
-            for erlang in erlang_list:
-                first_erlang = erlang == erlang_list[0]
+        for erlang in erlang_list:
+            first_erlang = erlang == self.get_erlang_list()[0]
+            if self.profile_dir is None:
                 self._run_generic_sim(erlang=erlang, first_erlang=first_erlang)
+            else:
+                profile_fp = os.path.join(self.profile_dir, f"{self.properties['thread_num']}_{erlang}.prof")
+                run_profiled(func=self._run_generic_sim, profile_fp=profile_fp, erlang=erlang,
+                             first_erlang=first_erlang)
 
-    def run_sim(self, **kwargs):
+    def setup_sim(self, **kwargs):
         """
-        Runs all simulations.
+        Sets the properties of a single simulation.
         """
         self.properties = kwargs['thread_params']
         # The date and current time derived from the simulation start
@@ -81,35 +101,114 @@ class NetworkSimulator:
         # To keep track of each thread run and save results
         self.properties['thread_num'] = kwargs['thread_num']
 
-        self.run_generic_sim()
 
+def _get_num_workers(sims_dict: dict):
+    for thread_params in sims_dict.values():
+        if thread_params.get('num_workers'):
+            return thread_params['num_workers']
+
+    return None
+
+
+def _get_units(curr_sim: NetworkSimulator):
+    erlang_list = curr_sim.get_erlang_list()
+    if curr_sim.properties['thread_erlangs']:
+        return [[erlang] for erlang in erlang_list]
 
-def run(sims_dict: dict):
+    return [erlang_list]
+
+
+def _report_profiles(profile_dir: str):
+    stats_obj = merge_profiles(profile_dir=profile_dir)
+    if stats_obj is None:
+        print(f'No profiles found in: {profile_dir}')
+        return
+
+    print(f'Profiles merged in: {profile_dir}')
+    print_top_functions(stats_obj=stats_obj)
+
+
+def run(sims_dict: dict, profile: bool = False):
     """
-    Runs multiple simulations concurrently or a single simulation.
+    Runs every simulation in one long-lived pool of worker processes. Each Erlang is a separate unit of work unless
+    the simulation disabled threading its Erlangs.
 
     :param sims_dict: Contains the parameters for each simulation.
+    :param profile: Profile every simulation and Erlang inside its worker and merge the profiles at the end.
     """
-    with concurrent.futures.ProcessPoolExecutor() as executor:
+    sim_start = datetime.now().strftime("%m%d_%H_%M_%S_%f")
+    profile_dir = get_profile_dir(sim_start=sim_start) if profile else None
+    with concurrent.futures.ProcessPoolExecutor(max_workers=_get_num_workers(sims_dict=sims_dict)) as executor:
         futures_list = []
-
-        sim_start = datetime.now().strftime("%m%d_%H_%M_%S_%f")
         for thread_num, thread_params in sims_dict.items():
             curr_sim = NetworkSimulator()
-            class_inst = curr_sim.run_sim
-
-            time.sleep(1.0)
-            future = executor.submit(class_inst, thread_num=thread_num, thread_params=thread_params,
-                                     sim_start=sim_start)
+            curr_sim.setup_sim(thread_num=thread_num, thread_params=thread_params, sim_start=sim_start)
+            curr_sim.setup_input()
+            curr_sim.profile_dir = profile_dir
 
-            futures_list.append(future)
+            for unit_list in _get_units(curr_sim=curr_sim):
+                future = executor.submit(curr_sim.run_erlangs, erlang_list=unit_list)
+                futures_list.append(future)
 
         for future in concurrent.futures.as_completed(futures_list):
             future.result()
 
+    if profile:
+        _report_profiles(profile_dir=profile_dir)
+
+
+def enqueue(sims_dict: dict, queue_dir: str):
+    """
+    Adds every unit of work to a shared job queue, to be run by any number of workers on any host.
+
+    :param sims_dict: Contains the parameters for each simulation.
+    :param queue_dir: The queue directory on a shared file system.
+    """
+    queue_obj = JobQueue(queue_dir=queue_dir)
+    sim_start = datetime.now().strftime("%m%d_%H_%M_%S_%f")
+    for thread_num, thread_params in sims_dict.items():
+        curr_sim = NetworkSimulator()
+        curr_sim.setup_sim(thread_num=thread_num, thread_params=copy.deepcopy(thread_params), sim_start=sim_start)
+        # Jobs only read the input created here, or by the first of them on hosts without this file system
+        curr_sim.setup_input()
+        for unit_list in _get_units(curr_sim=curr_sim):
+            queue_obj.put(job_dict={'thread_num': thread_num, 'thread_params': thread_params, 'sim_start': sim_start,
+                                    'erlang_list': unit_list})
+
+
+def run_job(job_dict: dict, profile_set: set = None):
+    """
+    Runs a single unit of work taken from the job queue.
+
+    :param job_dict: The simulation parameters, start time, and Erlang values of the unit.
+    :param profile_set: If given, each Erlang is profiled and the profile directory is added to the set.
+    """
+    curr_sim = NetworkSimulator()
+    curr_sim.setup_sim(thread_num=job_dict['thread_num'], thread_params=job_dict['thread_params'],
+                       sim_start=job_dict['sim_start'])
+    curr_sim.setup_input()
+    if profile_set is not None:
+        curr_sim.profile_dir = get_profile_dir(sim_start=job_dict['sim_start'])
+        profile_set.add(curr_sim.profile_dir)
+    curr_sim.run_erlangs(erlang_list=job_dict['erlang_list'])
+
 
 if __name__ == '__main__':
     args_dict = parse_args()
-    # TODO: Update config path in other AI scripts
-    all_sims_dict = read_config(args_dict=args_dict, config_path=args_dict['config_path'])
-    run(sims_dict=all_sims_dict)
+    if args_dict['worker']:
+        if args_dict['queue_dir'] is None:
+            raise ValueError('--worker requires --queue_dir, the queue directory the jobs were added to.')
+        lease_time = args_dict['lease_time'] if args_dict['lease_time'] is not None else 300.0
+        profile_dir_set = set() if args_dict['profile'] else None
+        run_worker(queue_obj=JobQueue(queue_dir=args_dict['queue_dir'], lease_time=lease_time),
+                   job_func=functools.partial(run_job, profile_set=profile_dir_set))
+        # Merges the profiles of every worker that finished, the last worker to finish sees all of them
+        for curr_dir in sorted(profile_dir_set or set()):
+            _report_profiles(profile_dir=curr_dir)
+    else:
+        # TODO: Update config path in other AI scripts
+        all_sims_dict = read_config(args_dict=args_dict, config_path=args_dict['config_path'])
+        if args_dict['queue_dir'] is not None:
+            enqueue(sims_dict=all_sims_dict, queue_dir=args_dict['queue_dir'])
+        else:
+            run(sims_dict=all_sims_dict, profile=args_dict['profile'])
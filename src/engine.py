@@ -8,10 +8,15 @@ import networkx as nx
 import numpy as np
 
 # Local application imports
-from src.request_generator import get_requests
+from src.request_generator import get_requests, iter_requests
 from src.sdn_controller import SDNController
 from helper_scripts.stats_helpers import SimStats
 from helper_scripts.ml_helpers import load_model
+from helper_scripts.trace_helpers import get_trace, trace_to_requests, iter_trace_requests
+from helper_scripts.timer_helpers import PhaseTimer
+from helper_scripts.memory_helpers import MemoryTracker
+from helper_scripts.occupancy_helpers import COMPACT_DTYPE, create_occupancy
+from helper_scripts.usage_helpers import create_usage, reset_usage
 
 
 class Engine:
@@ -24,6 +29,11 @@ class Engine:
         self.net_spec_dict = dict()
         self.reqs_dict = None
         self.reqs_status_dict = dict()
+        # Only used in bounded memory mode, requests are generated as the simulation reaches them
+        self.reqs_iter = None
+        # Per request statistics are aggregated as they arrive in bounded memory mode, the flag is kept here so the
+        # properties hashed into the cache key are the same before and after the run
+        self.stream_stats = bool(self.engine_props.get('stream_stats') or self.engine_props.get('bounded_memory'))
 
         self.iteration = 0
         self.topology = nx.Graph()
@@ -35,6 +45,21 @@ class Engine:
 
         self.ml_model = None
 
+        # Shared by every component so one timer holds the phases of the whole pipeline
+        self.timer_obj = PhaseTimer() if self.engine_props.get('phase_timing') else None
+        self.sdn_obj.timer_obj = self.timer_obj
+        self.sdn_obj.spectrum_obj.timer_obj = self.timer_obj
+        self.stats_obj.timer_obj = self.timer_obj
+        self.memory_obj = MemoryTracker() if self.engine_props.get('memory_report') else None
+
+    def _get_stats_method(self):
+        if self.stream_stats:
+            return 'stream_stats'
+        if self.engine_props.get('columnar_stats'):
+            return 'columnar_stats'
+
+        return 'list_stats'
+
     def update_arrival_params(self, curr_time: float):
         """
         Updates parameters for a request after attempted allocation.
@@ -42,7 +67,11 @@ class Engine:
         :param curr_time: The current simulated time.
         """
         sdn_props = self.sdn_obj.sdn_props
+        if self.timer_obj is not None:
+            start_ns = self.timer_obj.start()
         self.stats_obj.iter_update(req_data=self.reqs_dict[curr_time], sdn_data=sdn_props)
+        if self.timer_obj is not None:
+            self.timer_obj.add(phase='stats', algorithm=self._get_stats_method(), start_ns=start_ns)
         if sdn_props.was_routed:
             self.stats_obj.curr_trans = sdn_props.num_trans
 
@@ -100,6 +129,9 @@ class Engine:
             self.sdn_obj.sdn_props.path_list = self.reqs_status_dict[self.reqs_dict[curr_time]['req_id']]['path']
             self.sdn_obj.handle_event(req_dict=self.reqs_dict[curr_time], request_type='release')
             self.net_spec_dict = self.sdn_obj.sdn_props.net_spec_dict
+            # The request will never be seen again
+            if self.reqs_iter is not None:
+                del self.reqs_status_dict[self.reqs_dict[curr_time]['req_id']]
         # Request was blocked, nothing to release
         else:
             pass
@@ -128,10 +160,22 @@ class Engine:
             for band in self.engine_props['band_list']:
                 # TODO: This variable name for bands changes and is not consistent
                 band_slots = self.engine_props[f'{band}_band']
-                cores_matrix[band] = np.zeros((link_data['fiber']['num_cores'], band_slots))
-
-            self.net_spec_dict[(source, dest)] = {'cores_matrix': cores_matrix, 'link_num': int(link_num)}
-            self.net_spec_dict[(dest, source)] = {'cores_matrix': cores_matrix, 'link_num': int(link_num)}
+                if self.engine_props.get('compact_spectrum'):
+                    cores_matrix[band] = np.zeros((link_data['fiber']['num_cores'], band_slots), dtype=COMPACT_DTYPE)
+                else:
+                    cores_matrix[band] = np.zeros((link_data['fiber']['num_cores'], band_slots))
+
+            # Both directions share their spectrum and its usage counters
+            usage_dict = create_usage(cores_matrix=cores_matrix)
+            self.net_spec_dict[(source, dest)] = {'cores_matrix': cores_matrix, 'link_num': int(link_num),
+                                                  'usage_dict': usage_dict}
+            self.net_spec_dict[(dest, source)] = {'cores_matrix': cores_matrix, 'link_num': int(link_num),
+                                                  'usage_dict': usage_dict}
+            if self.engine_props.get('compact_spectrum'):
+                # Shared by both directions, like the cores
+                occupied_matrix = create_occupancy(cores_matrix=cores_matrix)
+                self.net_spec_dict[(source, dest)]['occupied_matrix'] = occupied_matrix
+                self.net_spec_dict[(dest, source)]['occupied_matrix'] = occupied_matrix
             self.topology.add_edge(source, dest, length=link_data['length'], nli_cost=None)
 
         self.engine_props['topology'] = self.topology
@@ -139,6 +183,26 @@ class Engine:
         self.sdn_obj.sdn_props.net_spec_dict = self.net_spec_dict
         self.sdn_obj.sdn_props.topology = self.topology
 
+    def reset_spectrum(self):
+        """
+        Frees the whole spectrum in place, keeping the topology, so a simulation can start over without rebuilding it.
+        """
+        freed_set = set()
+        for link_dict in self.net_spec_dict.values():
+            # Both directions of a link share their spectrum
+            if id(link_dict['cores_matrix']) in freed_set:
+                continue
+            freed_set.add(id(link_dict['cores_matrix']))
+            for cores_arr in link_dict['cores_matrix'].values():
+                cores_arr.fill(0)
+            for occupied_arr in link_dict.get('occupied_matrix', dict()).values():
+                occupied_arr.fill(0)
+            if 'usage_dict' in link_dict:
+                reset_usage(usage_dict=link_dict['usage_dict'])
+        # Nothing is allocated anymore
+        self.reqs_status_dict = dict()
+        self.sdn_obj.spectrum_version += 1
+
     def generate_requests(self, seed: int):
         """
         Calls the request generator to generate requests.
@@ -146,8 +210,24 @@ class Engine:
         :param seed: The seed to use for the random generation.
         """
         # TODO: Add a flag for AI simulations which want to have a constant seed
-        self.reqs_dict = get_requests(seed=seed, engine_props=self.engine_props)
-        self.reqs_dict = dict(sorted(self.reqs_dict.items()))
+        if self.timer_obj is not None:
+            start_ns = self.timer_obj.start()
+        if self.engine_props.get('bounded_memory'):
+            if self.engine_props.get('use_traces'):
+                trace_arr = get_trace(seed=seed, engine_props=self.engine_props)
+                self.reqs_iter = iter_trace_requests(trace_arr=trace_arr, engine_props=self.engine_props)
+            else:
+                self.reqs_iter = iter_requests(seed=seed, engine_props=self.engine_props)
+            self.reqs_dict = dict()
+        elif self.engine_props.get('use_traces'):
+            trace_arr = get_trace(seed=seed, engine_props=self.engine_props)
+            self.reqs_dict = trace_to_requests(trace_arr=trace_arr, engine_props=self.engine_props)
+        else:
+            self.reqs_dict = get_requests(seed=seed, engine_props=self.engine_props)
+            self.reqs_dict = dict(sorted(self.reqs_dict.items()))
+        if self.timer_obj is not None:
+            algorithm = 'trace' if self.engine_props.get('use_traces') else 'generator'
+            self.timer_obj.add(phase='request_generation', algorithm=algorithm, start_ns=start_ns)
 
     def handle_request(self, curr_time: float, req_num: int):
         """
@@ -178,6 +258,30 @@ class Engine:
             raise NotImplementedError(f'Request type unrecognized. Expected arrival or release, '
                                       f'got: {req_type}')
 
+    def _get_request_times(self):
+        if self.reqs_iter is None:
+            yield from self.reqs_dict
+            return
+
+        for curr_time, req_dict in self.reqs_iter:
+            # Only the current request is held, releases not yet reached are held by the generator
+            self.reqs_dict = {curr_time: req_dict}
+            yield curr_time
+        self.reqs_iter = None
+
+    def get_memory_counts(self):
+        """
+        Counts the entries of the containers that grow with the number of requests.
+
+        :return: The number of entries of each container.
+        :rtype: dict
+        """
+        return {
+            'reqs_dict': len(self.reqs_dict) if self.reqs_dict is not None else 0,
+            'reqs_status_dict': len(self.reqs_status_dict),
+            'train_data_list': len(self.stats_obj.train_data_list),
+        }
+
     def end_iter(self, iteration: int, print_flag: bool = True, base_fp: str = None):
         """
         Updates iteration statistics.
@@ -194,6 +298,8 @@ class Engine:
         else:
             resp = False
         if (iteration + 1) % self.engine_props['print_step'] == 0 or iteration == 0:
+            if self.memory_obj is not None:
+                self.stats_obj.memory_dict = self.memory_obj.get_report(counts_dict=self.get_memory_counts())
             self.stats_obj.print_iter_stats(max_iters=self.engine_props['max_iters'], print_flag=print_flag)
 
         if (iteration + 1) % self.engine_props['save_step'] == 0 or iteration == 0 or (iteration + 1) == \
@@ -202,13 +308,16 @@ class Engine:
 
         return resp
 
-    def init_iter(self, iteration: int):
+    def init_iter(self, iteration: int, gen_reqs: bool = True):
         """
         Initializes an iteration.
 
         :param iteration: The current iteration number.
+        :param gen_reqs: Whether to generate the requests, e.g., not when the caller generates them itself.
         """
         self.iteration = iteration
+        if self.timer_obj is not None:
+            self.timer_obj.reset()
 
         self.stats_obj.iteration = iteration
         self.stats_obj.init_iter_stats()
@@ -227,8 +336,9 @@ class Engine:
             if self.engine_props['deploy_model']:
                 self.ml_model = load_model(engine_props=self.engine_props)
 
-        seed = self.engine_props["seeds"][iteration] if self.engine_props["seeds"] else iteration + 1
-        self.generate_requests(seed)
+        if gen_reqs:
+            seed = self.engine_props["seeds"][iteration] if self.engine_props["seeds"] else iteration + 1
+            self.generate_requests(seed)
 
     def run(self):
         """
@@ -238,7 +348,7 @@ class Engine:
         for iteration in range(self.engine_props["max_iters"]):
             self.init_iter(iteration=iteration)
             req_num = 1
-            for curr_time in self.reqs_dict:
+            for curr_time in self._get_request_times():
                 self.handle_request(curr_time=curr_time, req_num=req_num)
 
                 if self.reqs_dict[curr_time]['request_type'] == 'arrival':
@@ -247,6 +357,10 @@ class Engine:
             end_iter = self.end_iter(iteration=iteration)
             if end_iter:
                 break
+        # Results may still be saving in the background
+        self.stats_obj.close_writer()
+        if self.memory_obj is not None:
+            self.memory_obj.stop()
 
         print(f"Erlang: {self.engine_props['erlang']} finished for "
               f"simulation number: {self.engine_props['thread_num']}.")
@@ -1,16 +1,32 @@
-from helper_scripts.random_helpers import set_seed, get_uniform_rv, get_exponential_rv
+import heapq
 
+from helper_scripts.random_helpers import set_seed, get_uniform_rv, get_exponential_rv, get_generator
 
-def get_requests(seed: int, engine_props: dict):
+
+def _get_request_dict(request_id: int, source: str, dest: str, arrive: float, depart: float, request_type: str,
+                      bandwidth: str, engine_props: dict):
+    return {
+        "req_id": request_id,
+        "source": source,
+        "destination": dest,
+        "arrive": arrive,
+        "depart": depart,
+        "request_type": request_type,
+        "bandwidth": bandwidth,
+        "mod_formats": engine_props['mod_per_bw'][bandwidth],
+    }
+
+
+def iter_requests(seed: int, engine_props: dict):
     """
-    Generates requests for a single simulation.
+    Generates the requests of a single simulation one at a time, sorted by time. Only the releases of requests that
+    have arrived are held in memory, so memory depends on the number of active requests rather than on all requests.
 
     :param seed: Seed for random generation.
     :param engine_props: Properties from the engine class.
-    :return: The generated requests and request information.
-    :rtype: dict
+    :return: The time and information of every arrival and release.
+    :rtype: generator
     """
-    requests_dict = {}
     current_time = 0
     request_id = 1
     # Means ALL nodes are core nodes
@@ -19,7 +35,12 @@ def get_requests(seed: int, engine_props: dict):
     # Means some nodes are nodes
     else:
         nodes_list = engine_props['core_nodes']
-    set_seed(seed=seed)
+    # Traffic is keyed only on the seed so every simulation and algorithm sees the same requests
+    if engine_props.get('rng_streams'):
+        rng = get_generator(seed=seed, stream_key_list=['requests'])
+    else:
+        set_seed(seed=seed)
+        rng = None
 
     bw_counts_dict = {bandwidth: int(engine_props['request_distribution'][bandwidth] * engine_props['num_requests'])
                       for bandwidth in engine_props['mod_per_bw']}
@@ -32,48 +53,62 @@ def get_requests(seed: int, engine_props: dict):
                          'either change the number of requests, or change the percentages for the bandwidth values'
                          'selected.')
 
-    # Generate requests, multiply the number of requests by two since we have arrival and departure types
-    while len(requests_dict) < (engine_props['num_requests'] * 2):
-        current_time += get_exponential_rv(scale_param=engine_props['arrival_rate'])
+    # Releases that have not happened yet, ordered by time, and their times
+    releases_list = list()
+    release_times_set = set()
+    # Earlier arrivals and releases happen before the current time, only these can share a time with a new request
+    last_arrive = None
+    while request_id <= engine_props['num_requests']:
+        current_time += get_exponential_rv(scale_param=engine_props['arrival_rate'], rng=rng)
 
-        depart_time = current_time + get_exponential_rv(scale_param=1 / engine_props['holding_time'])
+        depart_time = current_time + get_exponential_rv(scale_param=1 / engine_props['holding_time'], rng=rng)
 
-        source = nodes_list[get_uniform_rv(scale_param=len(nodes_list))]
-        dest = nodes_list[get_uniform_rv(scale_param=len(nodes_list))]
+        source = nodes_list[get_uniform_rv(scale_param=len(nodes_list), rng=rng)]
+        dest = nodes_list[get_uniform_rv(scale_param=len(nodes_list), rng=rng)]
 
         while dest == source:
-            dest = nodes_list[get_uniform_rv(scale_param=len(nodes_list))]
+            dest = nodes_list[get_uniform_rv(scale_param=len(nodes_list), rng=rng)]
 
         while True:
-            chosen_bandwidth = bandwidth_list[get_uniform_rv(scale_param=len(bandwidth_list))]
+            chosen_bandwidth = bandwidth_list[get_uniform_rv(scale_param=len(bandwidth_list), rng=rng)]
             if bw_counts_dict[chosen_bandwidth] > 0:
                 bw_counts_dict[chosen_bandwidth] -= 1
                 break
 
-        if current_time not in requests_dict and depart_time not in requests_dict:
-            requests_dict.update({current_time: {
-                "req_id": request_id,
-                "source": source,
-                "destination": dest,
-                "arrive": current_time,
-                "depart": depart_time,
-                "request_type": "arrival",
-                "bandwidth": chosen_bandwidth,
-                "mod_formats": engine_props['mod_per_bw'][chosen_bandwidth],
-            }})
-            requests_dict.update({depart_time: {
-                "req_id": request_id,
-                "source": source,
-                "destination": dest,
-                "arrive": current_time,
-                "depart": depart_time,
-                "request_type": "release",
-                "bandwidth": chosen_bandwidth,
-                "mod_formats": engine_props['mod_per_bw'][chosen_bandwidth],
-            }})
+        if current_time != last_arrive and current_time not in release_times_set and depart_time != last_arrive \
+                and depart_time not in release_times_set:
+            while releases_list and releases_list[0][0] < current_time:
+                release_time, _, release_dict = heapq.heappop(releases_list)
+                release_times_set.discard(release_time)
+                yield release_time, release_dict
+
+            yield current_time, _get_request_dict(request_id=request_id, source=source, dest=dest,
+                                                  arrive=current_time, depart=depart_time, request_type='arrival',
+                                                  bandwidth=chosen_bandwidth, engine_props=engine_props)
+            release_dict = _get_request_dict(request_id=request_id, source=source, dest=dest, arrive=current_time,
+                                             depart=depart_time, request_type='release', bandwidth=chosen_bandwidth,
+                                             engine_props=engine_props)
+            # The request number breaks ties so dictionaries are never compared
+            heapq.heappush(releases_list, (depart_time, request_id, release_dict))
+            release_times_set.add(depart_time)
+            last_arrive = current_time
             request_id += 1
         # Bandwidth was not chosen due to either arrival or depart time already existing, add back to distribution
         else:
             bw_counts_dict[chosen_bandwidth] += 1
 
-    return requests_dict
+    while releases_list:
+        release_time, _, release_dict = heapq.heappop(releases_list)
+        yield release_time, release_dict
+
+
+def get_requests(seed: int, engine_props: dict):
+    """
+    Generates requests for a single simulation.
+
+    :param seed: Seed for random generation.
+    :param engine_props: Properties from the engine class.
+    :return: The generated requests and request information, sorted by time.
+    :rtype: dict
+    """
+    return dict(iter_requests(seed=seed, engine_props=engine_props))
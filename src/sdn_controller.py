@@ -3,7 +3,8 @@ import time
 import numpy as np
 
 from helper_scripts.sim_helpers import sort_dict_keys, get_path_mod, find_path_len
-from helper_scripts.ml_helpers import get_ml_obs
+from helper_scripts.ml_helpers import FeatureEncoder
+from helper_scripts.occupancy_helpers import update_occupancy, is_range_free
 from arg_scripts.sdn_args import SDNProps
 from src.routing import Routing
 from src.spectrum_assignment import SpectrumAssignment
@@ -22,17 +23,36 @@ class SDNController:
         self.route_obj = Routing(engine_props=self.engine_props, sdn_props=self.sdn_props)
         self.spectrum_obj = SpectrumAssignment(engine_props=self.engine_props, sdn_props=self.sdn_props,
                                                route_props=self.route_obj.route_props)
+        # Set by the engine when phase timing is enabled
+        self.timer_obj = None
+        # Increased whenever the spectrum changes, e.g., so cached feasibility answers are dropped
+        self.spectrum_version = 0
+        # The (link, band, core) usage counters already holding the request being allocated, it may take many slices
+        self._usage_req_id = None
+        self._usage_set = set()
+        # Only used when a machine learning model is deployed
+        self.ml_encoder = None
 
     def release(self):
         """
         Removes a previously allocated request from the network.
         """
-        for source, dest in zip(self.sdn_props.path_list, self.sdn_props.path_list[1:]):
+        self.spectrum_version += 1
+        self._usage_req_id = None
+        self._usage_set = set()
+        for link_index, (source, dest) in enumerate(zip(self.sdn_props.path_list, self.sdn_props.path_list[1:])):
+            usage_dict = self.sdn_props.net_spec_dict[(source, dest)].get('usage_dict')
+            was_found = False
             for band in self.engine_props['band_list']:
                 for core_num in range(self.engine_props['cores_per_link']):
                     core_arr = self.sdn_props.net_spec_dict[(source, dest)]['cores_matrix'][band][core_num]
                     req_id_arr = np.where(core_arr == self.sdn_props.req_id)
                     gb_arr = np.where(core_arr == (self.sdn_props.req_id * -1))
+                    if usage_dict is not None and (req_id_arr[0].size or gb_arr[0].size):
+                        was_found = True
+                        usage_dict['taken_matrix'][band][core_num] -= req_id_arr[0].size + gb_arr[0].size
+                        usage_dict['guard_matrix'][band][core_num] -= gb_arr[0].size
+                        usage_dict['active_matrix'][band][core_num] -= 1
 
                     for req_index in req_id_arr:
                         self.sdn_props.net_spec_dict[(source, dest)]['cores_matrix'][band][core_num][req_index] = 0
@@ -41,6 +61,48 @@ class SDNController:
                         self.sdn_props.net_spec_dict[(source, dest)]['cores_matrix'][band][core_num][gb_index] = 0
                         self.sdn_props.net_spec_dict[(dest, source)]['cores_matrix'][band][core_num][gb_index] = 0
 
+                    if self.engine_props.get('compact_spectrum') and (req_id_arr[0].size or gb_arr[0].size):
+                        self._update_occupancy(link_tuple=(source, dest), band=band, core_num=core_num)
+
+            # Requests are counted on the first link of their path
+            if link_index == 0 and was_found:
+                usage_dict['num_reqs'] -= 1
+
+    def _update_occupancy(self, link_tuple: tuple, band: str, core_num: int):
+        link_dict = self.sdn_props.net_spec_dict[link_tuple]
+        rev_link_dict = self.sdn_props.net_spec_dict[(link_tuple[1], link_tuple[0])]
+        update_occupancy(link_dict=link_dict, band=band, core_num=core_num)
+        # Both directions usually share their spectrum
+        if rev_link_dict['occupied_matrix'] is not link_dict['occupied_matrix']:
+            update_occupancy(link_dict=rev_link_dict, band=band, core_num=core_num)
+
+    def _add_usage(self, usage_dict: dict, link_tuple: tuple, band: str, core_num: int, num_slots: int):
+        if self._usage_req_id != self.sdn_props.req_id:
+            self._usage_req_id = self.sdn_props.req_id
+            self._usage_set = set()
+        # Nothing counted yet means this is the first link of the request's path
+        if not self._usage_set:
+            usage_dict['num_reqs'] += 1
+        if (link_tuple, band, core_num) not in self._usage_set:
+            self._usage_set.add((link_tuple, band, core_num))
+            usage_dict['active_matrix'][band][core_num] += 1
+
+        if self.engine_props['guard_slots']:
+            usage_dict['taken_matrix'][band][core_num] += num_slots + 1
+            usage_dict['guard_matrix'][band][core_num] += 1
+        else:
+            usage_dict['taken_matrix'][band][core_num] += num_slots
+
+    def _check_compact(self, link_tuple: tuple, band: str, core_num: int, start_slot: int, end_slot: int):
+        # The request's slots and guard band are checked in one pass over the packed occupancy
+        if self.engine_props['guard_slots']:
+            end_slot += 1
+        net_spec_dict = self.sdn_props.net_spec_dict
+        occupied_list = [net_spec_dict[link_tuple]['occupied_matrix'][band][core_num],
+                         net_spec_dict[(link_tuple[1], link_tuple[0])]['occupied_matrix'][band][core_num]]
+        if not is_range_free(occupied_list=occupied_list, start_slot=start_slot, end_slot=end_slot):
+            raise BufferError("Attempted to allocate a taken spectrum.")
+
     def _allocate_gb(self, band: str, core_matrix: list, rev_core_matrix: list, core_num: int, end_slot: int):
         if core_matrix[band][core_num][end_slot] != 0.0 or rev_core_matrix[band][core_num][end_slot] != 0.0:
             raise BufferError("Attempted to allocate a taken spectrum.")
@@ -52,6 +114,9 @@ class SDNController:
         """
         Allocates a network request.
         """
+        if self.timer_obj is not None:
+            start_ns = self.timer_obj.start()
+        self.spectrum_version += 1
         start_slot = self.spectrum_obj.spectrum_props.start_slot
         end_slot = self.spectrum_obj.spectrum_props.end_slot
         core_num = self.spectrum_obj.spectrum_props.core_num
@@ -67,14 +132,18 @@ class SDNController:
             link_dict = self.sdn_props.net_spec_dict[(link_tuple[0], link_tuple[1])]
             rev_link_dict = self.sdn_props.net_spec_dict[(link_tuple[1], link_tuple[0])]
 
-            tmp_set = set(link_dict['cores_matrix'][band][core_num][start_slot:end_slot])
-            rev_tmp_set = set(rev_link_dict['cores_matrix'][band][core_num][start_slot:end_slot])
+            if self.engine_props.get('compact_spectrum'):
+                self._check_compact(link_tuple=link_tuple, band=band, core_num=core_num, start_slot=start_slot,
+                                    end_slot=end_slot)
+            else:
+                tmp_set = set(link_dict['cores_matrix'][band][core_num][start_slot:end_slot])
+                rev_tmp_set = set(rev_link_dict['cores_matrix'][band][core_num][start_slot:end_slot])
 
-            if tmp_set == {} or rev_tmp_set == {}:
-                raise ValueError('Nothing detected on the spectrum when allocating.')
+                if tmp_set == {} or rev_tmp_set == {}:
+                    raise ValueError('Nothing detected on the spectrum when allocating.')
 
-            if tmp_set != {0.0} or rev_tmp_set != {0.0}:
-                raise BufferError("Attempted to allocate a taken spectrum.")
+                if tmp_set != {0.0} or rev_tmp_set != {0.0}:
+                    raise BufferError("Attempted to allocate a taken spectrum.")
 
             core_matrix = link_dict['cores_matrix']
             rev_core_matrix = rev_link_dict['cores_matrix']
@@ -85,6 +154,16 @@ class SDNController:
                 self._allocate_gb(core_matrix=core_matrix, rev_core_matrix=rev_core_matrix, end_slot=end_slot,
                                   core_num=core_num, band=band)
 
+            if self.engine_props.get('compact_spectrum'):
+                self._update_occupancy(link_tuple=link_tuple, band=band, core_num=core_num)
+            # Both directions share their usage counters
+            if 'usage_dict' in link_dict:
+                self._add_usage(usage_dict=link_dict['usage_dict'], link_tuple=link_tuple, band=band,
+                                core_num=core_num, num_slots=end_slot - start_slot)
+
+        if self.timer_obj is not None:
+            self.timer_obj.add(phase='allocate', algorithm=self.engine_props['allocation_method'], start_ns=start_ns)
+
     # TODO: No support for multi-band
     def _update_req_stats(self, bandwidth: str):
         self.sdn_props.bandwidth_list.append(bandwidth)
@@ -223,12 +302,21 @@ class SDNController:
         self.sdn_props.num_trans = 1
 
         if request_type == "release":
+            if self.timer_obj is not None:
+                start_ns = self.timer_obj.start()
             self.release()
+            if self.timer_obj is not None:
+                self.timer_obj.add(phase='release', algorithm=self.engine_props['allocation_method'],
+                                   start_ns=start_ns)
             return
 
         start_time = time.time()
         if force_route_matrix is None:
+            if self.timer_obj is not None:
+                start_ns = self.timer_obj.start()
             self.route_obj.get_route()
+            if self.timer_obj is not None:
+                self.timer_obj.add(phase='routing', algorithm=self.engine_props['route_method'], start_ns=start_ns)
             route_matrix = self.route_obj.route_props.paths_matrix
         else:
             route_matrix = force_route_matrix
@@ -238,6 +326,14 @@ class SDNController:
             self.route_obj.route_props.weights_list = [0]
         route_time = time.time() - start_time
 
+        segments_list = None
+        if ml_model is not None:
+            if self.ml_encoder is None:
+                self.ml_encoder = FeatureEncoder(engine_props=self.engine_props)
+            # Every path is scored at once, the spectrum is back as it was whenever a path is given up on
+            segments_list = self.ml_encoder.predict(model=ml_model, req_dict=req_dict, paths_matrix=route_matrix,
+                                                    net_spec_dict=self.sdn_props.net_spec_dict)
+
         segment_slicing = False
         # TODO: Improve SDN controller's structure
         while True:  # pylint: disable=too-many-nested-blocks
@@ -248,9 +344,7 @@ class SDNController:
                     mod_format_list = self.route_obj.route_props.mod_formats_matrix[path_index]
 
                     if ml_model is not None:
-                        input_df = get_ml_obs(req_dict=req_dict, engine_props=self.engine_props,
-                                              sdn_props=self.sdn_props)
-                        forced_segments = ml_model.predict(input_df)[0]
+                        forced_segments = segments_list[path_index]
                     else:
                         forced_segments = -1.0
 
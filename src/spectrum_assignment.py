@@ -23,6 +23,8 @@ class SpectrumAssignment:
                                        spectrum_props=self.spectrum_props, route_props=self.route_props)
         self.spec_help_obj = SpectrumHelpers(engine_props=self.engine_props, sdn_props=self.sdn_props,
                                              spectrum_props=self.spectrum_props)
+        # Set by the engine when phase timing is enabled
+        self.timer_obj = None
 
     # TODO: No longer supported and needs a test
     def _allocate_best_fit(self, channels_list: list):
@@ -278,12 +280,21 @@ class SpectrumAssignment:
             if self.spectrum_props.slots_needed is None:
                 raise ValueError('Slots needed cannot be none.')
 
+            if self.timer_obj is not None:
+                start_ns = self.timer_obj.start()
             self._get_spectrum()
+            if self.timer_obj is not None:
+                self.timer_obj.add(phase='spectrum', algorithm=self.engine_props['allocation_method'],
+                                   start_ns=start_ns)
 
             if self.spectrum_props.is_free:
                 self.spectrum_props.modulation = modulation
                 if self.engine_props['snr_type'] != 'None' and self.engine_props['snr_type'] is not None:
+                    if self.timer_obj is not None:
+                        start_ns = self.timer_obj.start()
                     snr_check, xt_cost = self.snr_obj.handle_snr(self.sdn_props.path_index)
+                    if self.timer_obj is not None:
+                        self.timer_obj.add(phase='snr', algorithm=self.engine_props['snr_type'], start_ns=start_ns)
                     self.spectrum_props.xt_cost = xt_cost
                     if not snr_check:
                         self.spectrum_props.is_free = False
@@ -0,0 +1,90 @@
+import json
+import unittest
+from statistics import mean, stdev
+
+import numpy as np
+
+from helper_scripts.aggregate_helpers import Histogram, QuantileSketch, RunningStats, merge_stats
+
+
+class TestAggregateHelpers(unittest.TestCase):
+    """
+    Tests aggregate_helpers.py
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(seed=7)
+        self.values_list = rng.exponential(scale=100.0, size=2000).tolist()
+
+    def test_running_stats(self):
+        """Test the running mean, standard deviation, minimum, and maximum against the statistics module."""
+        stats_obj = RunningStats()
+        for value in self.values_list:
+            stats_obj.append(value)
+
+        summary_dict = stats_obj.get_summary()
+        self.assertEqual(len(stats_obj), len(self.values_list))
+        self.assertAlmostEqual(summary_dict['mean'], mean(self.values_list), places=9)
+        self.assertAlmostEqual(summary_dict['std'], stdev(self.values_list), places=9)
+        self.assertEqual(summary_dict['min'], min(self.values_list))
+        self.assertEqual(summary_dict['max'], max(self.values_list))
+
+    def test_empty_and_single(self):
+        """Test the summaries of no values and a single value."""
+        stats_obj = RunningStats()
+        self.assertEqual(stats_obj.get_summary(), {'mean': None, 'std': None, 'min': None, 'max': None})
+
+        stats_obj.append(3)
+        self.assertEqual(stats_obj.get_summary(), {'mean': 3.0, 'std': 0.0, 'min': 3.0, 'max': 3.0})
+
+    def test_merge(self):
+        """Test that merging saved replications equals aggregating every value at once."""
+        state_list = list()
+        for start in range(0, len(self.values_list), 500):
+            stats_obj = RunningStats(histogram_obj=Histogram(lower=0, upper=500, num_bins=50))
+            for value in self.values_list[start:start + 500]:
+                stats_obj.append(value)
+            # Replications are saved as JSON
+            state_list.append(json.loads(json.dumps(stats_obj.to_dict())))
+
+        merged_obj = merge_stats(state_list=state_list)
+        whole_obj = RunningStats(histogram_obj=Histogram(lower=0, upper=500, num_bins=50))
+        for value in self.values_list:
+            whole_obj.append(value)
+
+        self.assertEqual(merged_obj.count, whole_obj.count)
+        for key, value in whole_obj.get_summary().items():
+            self.assertAlmostEqual(merged_obj.get_summary()[key], value, places=9)
+        self.assertEqual(merged_obj.get_quantiles(), whole_obj.get_quantiles())
+        self.assertEqual(merged_obj.histogram_obj.counts_arr.tolist(), whole_obj.histogram_obj.counts_arr.tolist())
+
+    def test_quantile_sketch(self):
+        """Test that sketch quantiles are within the relative error."""
+        sketch_obj = QuantileSketch(rel_error=0.01)
+        for value in self.values_list:
+            sketch_obj.append(value)
+
+        sorted_list = sorted(self.values_list)
+        for quantile in (0.1, 0.5, 0.9, 0.99):
+            expected = sorted_list[int(quantile * (len(sorted_list) - 1))]
+            self.assertLessEqual(abs(sketch_obj.get_quantile(quantile) - expected), 0.01 * expected + 1e-9)
+
+        zero_obj = QuantileSketch()
+        for value in (0, 0, 5):
+            zero_obj.append(value)
+        self.assertEqual(zero_obj.get_quantile(0.5), 0.0)
+        self.assertIsNone(QuantileSketch().get_quantile(0.5))
+
+    def test_histogram(self):
+        """Test that values outside the range fall into the underflow and overflow bins."""
+        histogram_obj = Histogram(lower=0, upper=4, num_bins=4)
+        for value in (-1, 0, 1, 1.5, 3.9, 4, 10):
+            histogram_obj.append(value)
+
+        self.assertEqual(histogram_obj.counts_arr.tolist(), [1, 1, 2, 0, 1, 2])
+        with self.assertRaises(ValueError):
+            histogram_obj.merge(Histogram(lower=0, upper=8, num_bins=4))
+
+
+if __name__ == '__main__':
+    unittest.main()
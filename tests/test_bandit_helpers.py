@@ -33,18 +33,24 @@ class TestBanditHelpers(unittest.TestCase):
         self.assertEqual(_get_base_fp(True, 10.0, 2), "e10.0_routes_c2.npy")
         self.assertEqual(_get_base_fp(False, 10.0, 2), "e10.0_cores_c2.npy")
 
-    @patch('json.dump')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_save_model(self, mock_file, mock_json_dump):
+    def test_load_model_binary(self):
         """
-        Test saving a model to a JSON file.
+        Test loading a model saved as a NumPy array, without pickling.
         """
-        state_values_dict = {('a', 'b'): np.array([1, 2, 3]), ('c', 'd'): np.array([4, 5, 6])}
-        expected_output = {"('a', 'b')": [1, 2, 3], "('c', 'd')": [4, 5, 6]}
-        _save_model(state_values_dict, 10.0, 2, 'save_dir', True)
-        mock_file.assert_called_once_with(os.path.join(os.getcwd(), 'save_dir', 'state_vals_e10.0_routes_c2.json'), 'w',
-                                          encoding='utf-8')
-        mock_json_dump.assert_called_once_with(expected_output, mock_file())
+        with patch('numpy.load', return_value=np.ones((2, 2, 3))) as mock_load:
+            result = load_model('model.npy')
+        mock_load.assert_called_once_with(os.path.join('logs', 'model.npy'))
+        self.assertEqual(result.shape, (2, 2, 3))
+
+    @patch('numpy.save')
+    def test_save_model(self, mock_np_save):
+        """
+        Test saving a model as a NumPy array.
+        """
+        state_values_arr = np.array([[[1, 2, 3], [4, 5, 6]]])
+        _save_model(state_values_arr, 10.0, 2, 'save_dir', True)
+        mock_np_save.assert_called_once_with(os.path.join(os.getcwd(), 'save_dir', 'state_vals_e10.0_routes_c2.npy'),
+                                             state_values_arr)
 
     @patch('helper_scripts.bandit_helpers.create_dir')
     @patch('numpy.save')
@@ -68,14 +74,16 @@ class TestBanditHelpers(unittest.TestCase):
         }
         props = MagicMock()
 
-        rewards_matrix = [[1] * num_requests for _ in range(iteration + 1)]
-        props.rewards_matrix = rewards_matrix
+        props.rewards_arr = np.ones(num_requests)
+        props.num_rewards = num_requests
+        props.rewards_sum_arr = np.full(num_requests, 3.0)
+        props.num_episodes = iteration
 
         self_obj = MagicMock()
         self_obj.engine_props = engine_props
         self_obj.props = props
         self_obj.is_path = True
-        self_obj.values = {('a', 'b'): np.array([1, 2, 3]), ('c', 'd'): np.array([4, 5, 6])}
+        self_obj.values = np.array([[[1, 2, 3], [4, 5, 6]]])
 
         save_model(iteration, 'alg', self_obj)
 
@@ -85,21 +93,13 @@ class TestBanditHelpers(unittest.TestCase):
         rewards_fp = os.path.join(save_dir, 'rewards_e10.0_routes_c2.npy')
         abs_rewards_fp = os.path.join(os.getcwd(), rewards_fp)
         args, _ = mock_np_save.call_args
-        np.testing.assert_array_equal(args[1], np.mean(props.rewards_matrix, axis=0))
+        np.testing.assert_array_equal(args[1], np.full(num_requests, 4.0 / max_iters))
         self.assertEqual(args[0], abs_rewards_fp)
 
-        # Print actual call arguments for debugging
-        print("Actual call arguments for _save_model:", mock_save_model.call_args)
-
         actual_call = mock_save_model.call_args
-        expected_state_values_dict = {('a', 'b'): np.array([1, 2, 3]), ('c', 'd'): np.array([4, 5, 6])}
-        actual_state_values_dict = actual_call[1]['state_values_dict']
-
-        for key in expected_state_values_dict:  # pylint: disable=consider-using-dict-items
-            np.testing.assert_array_equal(expected_state_values_dict[key], actual_state_values_dict[key])
+        np.testing.assert_array_equal(actual_call[1]['state_values_arr'], self_obj.values)
 
         expected_call_kwargs = {
-            'state_values_dict': expected_state_values_dict,
             'erlang': 10.0,
             'cores_per_link': 2,
             'save_dir': save_dir,
@@ -240,8 +240,30 @@ class TestUCBBandit(unittest.TestCase):
         iteration = 5
 
         bandit.update(arm=arm, reward=reward, iteration=iteration)
-        mock_update_bandit.assert_called_once_with(iteration=iteration, arm=arm, reward=reward, self=bandit,
-                                                   algorithm='ucb_bandit')
+        mock_update_bandit.assert_called_once_with(arm=arm, reward=reward, self=bandit)
+        self.assertEqual(bandit.iteration, iteration)
+
+    def test_update_rewards(self):
+        """
+        Test that values are updated in place and rewards kept in the preallocated buffer until the episode ends.
+        """
+        self.engine_props.update({'max_iters': 10, 'num_requests': 2})
+        bandit = UCBBandit(self.rl_props, self.engine_props, is_path=True)
+        bandit.select_path_arm(source=0, dest=1)
+        bandit.update(arm=1, reward=1.0, iteration=0)
+        bandit.update(arm=1, reward=0.0, iteration=0)
+        bandit.update(arm=1, reward=3.0, iteration=0)
+
+        self.assertEqual(bandit.counts.shape, (3, 3, 3))
+        self.assertEqual(bandit.counts[0, 1].tolist(), [0, 3, 0])
+        self.assertAlmostEqual(bandit.values[0, 1, 1], 4.0 / 3.0)
+        self.assertEqual(bandit.props.num_rewards, 3)
+        self.assertEqual(bandit.props.rewards_arr[:3].tolist(), [1.0, 0.0, 3.0])
+
+        bandit.end_iter()
+        self.assertEqual(bandit.props.num_rewards, 0)
+        self.assertEqual(bandit.props.num_episodes, 1)
+        self.assertEqual(bandit.props.rewards_sum_arr[:3].tolist(), [1.0, 0.0, 3.0])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,86 @@
+import os
+import shutil
+import unittest
+
+from helper_scripts.benchmark_helpers import get_cases, get_case_props, compare_results, save_results, load_results
+from helper_scripts.benchmark_helpers import BASE_CASE_DICT, TOPOLOGY_LIST, CORES_LIST, ROUTE_LIST, MAX_REQUESTS_DICT
+
+
+class TestBenchmarkHelpers(unittest.TestCase):
+    """
+    Tests benchmark_helpers.py
+    """
+
+    def setUp(self):
+        self.save_dir = os.path.join('tests', 'benchmark_test_data')
+        self.base_props = {'erlangs': {'start': 300, 'stop': 350, 'step': 50}, 'holding_time': 5,
+                           'num_requests': 100, 'network': 'USNet', 'c_band': 256, 'l_band': None}
+        self.results_dict = {
+            'case_a': {'requests_per_s': 1000.0, 'peak_rss_mb': 100.0},
+            'case_b': {'requests_per_s': 1000.0, 'peak_rss_mb': 100.0},
+            'case_c': {'error': 'NotImplementedError: unsupported'},
+        }
+
+    def tearDown(self):
+        if os.path.exists(self.save_dir):
+            shutil.rmtree(self.save_dir)
+
+    def test_get_cases(self):
+        """Test that every setting is varied once from the base case."""
+        quick_dict = get_cases(suite='quick')
+        self.assertEqual(len(quick_dict), len(TOPOLOGY_LIST))
+        self.assertIn(BASE_CASE_DICT, quick_dict.values())
+
+        full_dict = get_cases(suite='full')
+        self.assertEqual(len(full_dict), len(set(full_dict)))
+        cores_list = sorted({case_dict['cores_per_link'] for case_dict in full_dict.values()})
+        self.assertEqual(cores_list, CORES_LIST)
+        route_list = [case_dict['route_method'] for case_dict in full_dict.values()]
+        self.assertTrue(set(ROUTE_LIST) <= set(route_list))
+        for case_dict in full_dict.values():
+            num_changed = sum(case_dict[key] != value for key, value in BASE_CASE_DICT.items())
+            self.assertLessEqual(num_changed, 1)
+
+        with self.assertRaises(ValueError):
+            get_cases(suite='slow')
+
+    def test_get_case_props(self):
+        """Test that the case settings replace the base properties."""
+        case_dict = dict(BASE_CASE_DICT, bands='multi_band', cores_per_link=13)
+        resp = get_case_props(case_dict=case_dict, base_props=self.base_props, sim_start='10_00_00_000000_0')
+
+        self.assertEqual(resp['network'], 'NSFNet')
+        self.assertEqual((resp['c_band'], resp['l_band'], resp['s_band']), (128, 128, None))
+        self.assertNotIn('bands', resp)
+        self.assertEqual(resp['arrival_rate'], 13 * 300 / 5)
+        self.assertTrue(resp['phase_timing'])
+        self.assertEqual(self.base_props['network'], 'USNet')
+        self.assertEqual(resp['num_requests'], 100)
+
+        case_dict = dict(BASE_CASE_DICT, allocation_method='xt_aware')
+        resp = get_case_props(case_dict=case_dict, base_props=self.base_props, sim_start='10_00_00_000000_0')
+        self.assertEqual(resp['num_requests'], MAX_REQUESTS_DICT[('allocation_method', 'xt_aware')])
+
+    def test_compare_results(self):
+        """Test that only changes beyond the threshold in the wrong direction are regressions."""
+        baseline_dict = {
+            'case_a': {'requests_per_s': 1200.0, 'peak_rss_mb': 100.0},
+            'case_b': {'requests_per_s': 900.0, 'peak_rss_mb': 80.0},
+            'case_c': {'requests_per_s': 10.0, 'peak_rss_mb': 1.0},
+        }
+        resp = compare_results(results_dict=self.results_dict, baseline_dict=baseline_dict, threshold=0.1)
+
+        self.assertEqual([row[:2] for row in resp], [('case_a', 'requests_per_s'), ('case_b', 'peak_rss_mb')])
+        self.assertAlmostEqual(resp[1][4], 0.25)
+        self.assertEqual(compare_results(results_dict=self.results_dict, baseline_dict=baseline_dict, threshold=0.3),
+                         list())
+
+    def test_save_and_load(self):
+        """Test that results survive a save and load."""
+        save_fp = os.path.join(self.save_dir, 'baseline.json')
+        save_results(results_dict=self.results_dict, save_fp=save_fp)
+        self.assertEqual(load_results(load_fp=save_fp), self.results_dict)
+
+
+if __name__ == '__main__':
+    unittest.main()
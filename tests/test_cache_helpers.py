@@ -0,0 +1,95 @@
+import os
+import json
+import shutil
+import unittest
+
+from helper_scripts.cache_helpers import get_cache_key, load_cached_result, save_cached_result
+
+
+class TestCacheHelpers(unittest.TestCase):
+    """
+    Tests cache_helpers.py
+    """
+
+    def setUp(self):
+        self.base_fp = os.path.join('tests', 'cache_test_data')
+        self.engine_props = {
+            'network': 'NSFNet', 'date': '0101', 'sim_start': '10_00_00_000000', 'thread_num': 's1',
+            'erlang': 250.0, 'seeds': None, 'cores_per_link': 4, 'allocation_method': 'first_fit',
+            'topology_info': {'links': {'1': {'source': '0', 'destination': '1', 'length': 100}}},
+            'mod_per_bw': {'50': {'QPSK': {'slots_needed': 4}}}, 'output_train_data': False, 'use_cache': True,
+        }
+
+    def tearDown(self):
+        if os.path.exists(self.base_fp):
+            shutil.rmtree(self.base_fp)
+
+    def _write_output(self, engine_props: dict, data_dict: dict):
+        save_fp = os.path.join(self.base_fp, 'output', engine_props['network'], engine_props['date'],
+                               engine_props['sim_start'], engine_props['thread_num'])
+        os.makedirs(save_fp, exist_ok=True)
+        file_path = os.path.join(save_fp, f"{engine_props['erlang']}_erlang.json")
+        with open(file_path, 'w', encoding='utf-8') as file_obj:
+            json.dump(data_dict, file_obj)
+
+        return file_path
+
+    def test_key_ignores_run_identity(self):
+        """
+        Test that the key does not depend on when or where a simulation was run.
+        """
+        new_props = dict(self.engine_props)
+        new_props.update({'date': '0202', 'sim_start': '11_11_11_111111', 'thread_num': 's3', 'erlang': 250})
+        self.assertEqual(get_cache_key(self.engine_props), get_cache_key(new_props))
+
+    def test_key_changes_with_props(self):
+        """
+        Test that the key changes with algorithm flags, topology contents, and the Erlang.
+        """
+        base_key = get_cache_key(self.engine_props)
+        for key, value in [('allocation_method', 'last_fit'), ('erlang', 300.0), ('seeds', [1, 2]),
+                           ('topology_info', {'links': {'1': {'source': '0', 'destination': '1', 'length': 200}}})]:
+            new_props = dict(self.engine_props)
+            new_props[key] = value
+            self.assertNotEqual(base_key, get_cache_key(new_props))
+
+    def test_key_ignores_sweep_shape(self):
+        """
+        Test that a point cached by a smaller sweep is found by a larger one run with other workers.
+        """
+        sweep_props = dict(self.engine_props)
+        sweep_props.update({'erlangs': {'start': 250, 'stop': 400, 'step': 50}, 'thread_erlangs': False,
+                            'num_workers': 2, 'arrival_rate': 4.0})
+        self._write_output(engine_props=sweep_props, data_dict={'blocking_mean': 0.1})
+        save_cached_result(engine_props=sweep_props, base_fp=self.base_fp)
+
+        new_props = dict(sweep_props)
+        new_props.update({'erlangs': {'start': 250, 'stop': 450, 'step': 50}, 'thread_erlangs': True,
+                          'num_workers': 4, 'queue_dir': 'queue', 'lease_time': 60.0, 'async_writer': True,
+                          'use_catalog': True, 'phase_timing': True, 'memory_report': True, 'sim_start': '12_00'})
+        self.assertEqual(get_cache_key(sweep_props), get_cache_key(new_props))
+        self.assertTrue(load_cached_result(engine_props=new_props, base_fp=self.base_fp))
+
+        new_props['arrival_rate'] = 5.0
+        self.assertNotEqual(get_cache_key(sweep_props), get_cache_key(new_props))
+
+    def test_miss_then_hit(self):
+        """
+        Test that a saved result is linked into the output tree of a later run.
+        """
+        self.assertFalse(load_cached_result(engine_props=self.engine_props, base_fp=self.base_fp))
+        self._write_output(engine_props=self.engine_props, data_dict={'blocking_mean': 0.1})
+        save_cached_result(engine_props=self.engine_props, base_fp=self.base_fp)
+
+        new_props = dict(self.engine_props)
+        new_props.update({'sim_start': '12_00_00_000000', 'thread_num': 's2'})
+        self.assertTrue(load_cached_result(engine_props=new_props, base_fp=self.base_fp))
+
+        file_path = os.path.join(self.base_fp, 'output', 'NSFNet', '0101', '12_00_00_000000', 's2',
+                                 '250.0_erlang.json')
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            self.assertEqual(json.load(file_obj), {'blocking_mean': 0.1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import shutil
+import unittest
+
+import networkx as nx
+
+from helper_scripts.catalog_helpers import update_catalog, load_result, list_results, find_runs, get_catalog_fp
+
+
+class TestCatalogHelpers(unittest.TestCase):
+    """
+    Tests catalog_helpers.py
+    """
+
+    def setUp(self):
+        self.base_fp = os.path.join('tests', 'catalog_test_data')
+        self.catalog_fp = get_catalog_fp(base_fp=self.base_fp)
+        self.engine_props = {
+            'network': 'NSFNet',
+            'date': '1019',
+            'sim_start': '10_00_00_000000',
+            'thread_num': 's1',
+            'erlang': 300.0,
+            'max_segments': 1,
+            'route_method': 'k_shortest_path',
+            'mod_per_bw': {'50': {'QPSK': {'slots_needed': 4}}},
+            'topology': nx.Graph(),
+        }
+        self.header_dict = {'blocking_mean': 0.05, 'blocking_variance': None}
+
+    def tearDown(self):
+        if os.path.exists(self.base_fp):
+            shutil.rmtree(self.base_fp)
+
+    def _save(self, engine_props: dict, num_iters: int = 2):
+        for iteration in range(num_iters):
+            iter_dict = {'sim_block_list': [0.05] * (iteration + 1), 'hops_mean': 2.5, 'start_slot_list': [1, 2],
+                         'cores_dict': {'0': iteration}}
+            update_catalog(engine_props=engine_props, iteration=iteration, header_dict=self.header_dict,
+                           iter_dict=iter_dict, base_fp=self.base_fp)
+
+    def test_load_result(self):
+        """Test that the catalog rebuilds the input and results JSON."""
+        self._save(engine_props=self.engine_props)
+        key_dict = {'network': 'NSFNet', 'date': '1019', 'sim_start': '10_00_00_000000', 'thread_num': 's1',
+                    'erlang': '300.0'}
+        input_dict, output_dict = load_result(key_dict=key_dict, catalog_fp=self.catalog_fp)
+
+        self.assertEqual(input_dict['route_method'], 'k_shortest_path')
+        self.assertNotIn('topology', input_dict)
+        self.assertEqual(list(output_dict['iter_stats']), ['0', '1'])
+        self.assertEqual(output_dict['iter_stats']['1'], {'sim_block_list': [0.05, 0.05], 'hops_mean': 2.5,
+                                                          'cores_dict': {'0': 1}})
+        self.assertEqual(output_dict['blocking_mean'], 0.05)
+
+        key_dict['erlang'] = 400.0
+        self.assertEqual(load_result(key_dict=key_dict, catalog_fp=self.catalog_fp), (None, None))
+
+    def test_list_and_find(self):
+        """Test listing the results of a run and filtering runs by their configuration."""
+        self._save(engine_props=self.engine_props)
+        self._save(engine_props=dict(self.engine_props, erlang=400.0))
+        self._save(engine_props=dict(self.engine_props, thread_num='s2', max_segments=4, route_method='xt_aware'))
+
+        resp = list_results(network='NSFNet', date='1019', sim_start='10_00_00_000000', catalog_fp=self.catalog_fp)
+        self.assertEqual(resp, {'s1': ['300.0', '400.0'], 's2': ['300.0']})
+
+        filter_dict = {'and_filter_list': [['max_segments', 4]], 'or_filter_list': [], 'not_filter_list': []}
+        resp = find_runs(dates_dict={'1019': 'NSFNet'}, filter_dict=filter_dict, catalog_fp=self.catalog_fp)
+        self.assertEqual(resp['sims_matrix'], [['s2']])
+        self.assertEqual(resp['times_matrix'], [['10_00_00_000000']])
+
+        filter_dict = {'and_filter_list': [], 'or_filter_list': [['route_method', 'xt_aware'], ['erlang', 400]],
+                       'not_filter_list': [['thread_num', 's2']]}
+        resp = find_runs(dates_dict={'1019': 'NSFNet'}, filter_dict=filter_dict, catalog_fp=self.catalog_fp)
+        self.assertEqual(resp['sims_matrix'], [['s1']])
+
+        filter_dict = {'and_filter_list': [['not_a_column', 1]], 'or_filter_list': [], 'not_filter_list': []}
+        resp = find_runs(dates_dict={'1019': 'NSFNet'}, filter_dict=filter_dict, catalog_fp=self.catalog_fp)
+        self.assertEqual(resp['times_matrix'], [])
+
+    def test_missing_catalog(self):
+        """Test that a missing catalog finds nothing instead of creating one."""
+        self.assertEqual(list_results(network='NSFNet', date='1019', sim_start='10', catalog_fp=self.catalog_fp),
+                         dict())
+        self.assertFalse(os.path.exists(self.catalog_fp))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -91,6 +91,9 @@ class TestEngine(unittest.TestCase):
                 self.assertTrue(
                     np.array_equal(link_data['cores_matrix'][band], expected_net_spec[link]['cores_matrix'][band]))
             self.assertEqual(link_data['link_num'], expected_net_spec[link]['link_num'])
+        # Both directions share their usage counters
+        self.assertIs(self.engine.net_spec_dict[('A', 'B')]['usage_dict'],
+                      self.engine.net_spec_dict[('B', 'A')]['usage_dict'])
 
         self.assertEqual(self.engine.engine_props['topology'], self.engine.topology)
         self.assertEqual(self.engine.stats_obj.topology, self.engine.topology)
@@ -129,6 +132,30 @@ class TestEngine(unittest.TestCase):
         )
         self.assertEqual(self.engine.net_spec_dict, self.engine.sdn_obj.sdn_props.net_spec_dict)
 
+    def test_handle_release_bounded_memory(self):
+        """
+        Test that a released request is forgotten in bounded memory mode.
+        """
+        curr_time = 1.0
+        req_id = self.engine.reqs_dict[curr_time]['req_id']
+        self.engine.reqs_status_dict[req_id] = {'path': ['A', 'B', 'C']}
+        self.engine.reqs_iter = iter([])
+        self.engine.handle_release(curr_time=curr_time)
+
+        self.assertNotIn(req_id, self.engine.reqs_status_dict)
+
+    def test_run_requests_bounded_memory(self):
+        """
+        Test that only the current request is held while requests are streamed.
+        """
+        self.engine.reqs_iter = iter([(1.0, {'req_id': 1}), (2.0, {'req_id': 2})])
+        held_list = list()
+        for _ in self.engine._get_request_times():  # pylint: disable=protected-access
+            held_list.append(dict(self.engine.reqs_dict))
+
+        self.assertEqual(held_list, [{1.0: {'req_id': 1}}, {2.0: {'req_id': 2}}])
+        self.assertIsNone(self.engine.reqs_iter)
+
     def test_init_iter(self):
         """
         Tests the init_iter method.
@@ -153,6 +180,32 @@ class TestEngine(unittest.TestCase):
             else:
                 mock_load_model.assert_not_called()
 
+    def test_init_iter_without_requests(self):
+        """
+        Tests that requests are left to the caller when asked.
+        """
+        with patch.object(self.engine, 'generate_requests') as mock_generate:
+            self.engine.init_iter(iteration=0, gen_reqs=False)
+            mock_generate.assert_not_called()
+            self.engine.stats_obj.init_iter_stats.assert_called_once()
+
+    def test_reset_spectrum(self):
+        """
+        Tests that the spectrum is freed in place and every request forgotten.
+        """
+        self.engine.create_topology()
+        cores_arr = self.engine.net_spec_dict[('A', 'B')]['cores_matrix']['c']
+        cores_arr[0][:4] = 3
+        cores_arr[0][4] = -3
+        self.engine.net_spec_dict[('A', 'B')]['usage_dict']['taken_matrix']['c'][0] = 5
+        self.engine.reqs_status_dict[3] = {'path': ['A', 'B']}
+        self.engine.reset_spectrum()
+
+        self.assertIs(self.engine.net_spec_dict[('A', 'B')]['cores_matrix']['c'], cores_arr)
+        self.assertFalse(np.any(cores_arr))
+        self.assertFalse(np.any(self.engine.net_spec_dict[('A', 'B')]['usage_dict']['taken_matrix']['c']))
+        self.assertEqual(self.engine.reqs_status_dict, {})
+
     def test_end_iter_non_training_conf_inter(self):
         """
         Test end_iter during non-training with confidence interval check.
@@ -0,0 +1,119 @@
+import unittest
+
+import numpy as np
+
+from arg_scripts.sdn_args import SDNProps
+from helper_scripts.feasibility_helpers import FeasibilityOracle
+from helper_scripts.rl_helpers import RLHelpers
+
+
+class TestFeasibilityOracle(unittest.TestCase):
+    """
+    Tests feasibility_helpers.py
+    """
+
+    def setUp(self):
+        self.engine_props = {
+            'allocation_method': 'first_fit', 'snr_type': None, 'cores_per_link': 7, 'guard_slots': 1,
+            'fixed_grid': False, 'band_list': ['c'], 'spectrum_priority': None,
+        }
+        self.node_list = ['A', 'B', 'C', 'D', 'E']
+        self.net_spec_dict = dict()
+        for source, dest in zip(self.node_list, self.node_list[1:]):
+            cores_matrix = {'c': np.zeros((7, 16))}
+            self.net_spec_dict[(source, dest)] = {'cores_matrix': cores_matrix}
+            self.net_spec_dict[(dest, source)] = {'cores_matrix': cores_matrix}
+        self.mod_formats_dict = {'QPSK': {'slots_needed': 4}, '16-QAM': {'slots_needed': 2}}
+        self.oracle_obj = FeasibilityOracle(engine_props=self.engine_props)
+
+    def _get_sdn_props(self):
+        sdn_props = SDNProps()
+        sdn_props.net_spec_dict = self.net_spec_dict
+        sdn_props.mod_formats_dict = self.mod_formats_dict
+        sdn_props.path_index = 0
+        return sdn_props
+
+    def test_is_supported(self):
+        """
+        Test that only first-fit methods without SNR checks are supported.
+        """
+        self.assertTrue(self.oracle_obj.is_supported())
+        self.engine_props['allocation_method'] = 'best_fit'
+        self.assertFalse(self.oracle_obj.is_supported())
+        self.engine_props['allocation_method'] = 'priority_first'
+        self.engine_props['snr_type'] = 'xt_calculation'
+        self.assertFalse(self.oracle_obj.is_supported())
+
+    def test_check_paths(self):
+        """
+        Test a full core, a modulation format out of reach, and a core outside the allowed cores.
+        """
+        for cores_arr in self.net_spec_dict[('B', 'C')]['cores_matrix'].values():
+            cores_arr[:, 2:] = 1
+        paths_matrix = [['A', 'B', 'C'], ['C', 'D', 'E'], ['A', 'B']]
+        mod_formats_matrix = [['QPSK'], [False], ['QPSK']]
+
+        resp = self.oracle_obj.check_paths(net_spec_dict=self.net_spec_dict, version=0, paths_matrix=paths_matrix,
+                                           mod_formats_matrix=mod_formats_matrix,
+                                           mod_formats_dict=self.mod_formats_dict)
+        self.assertEqual(resp.tolist(), [False, False, True])
+
+        self.net_spec_dict[('B', 'C')]['cores_matrix']['c'][3][:] = 0
+        resp = self.oracle_obj.check_paths(net_spec_dict=self.net_spec_dict, version=1, paths_matrix=paths_matrix,
+                                           mod_formats_matrix=mod_formats_matrix,
+                                           mod_formats_dict=self.mod_formats_dict, core_num=2)
+        self.assertEqual(resp.tolist(), [False, False, True])
+
+    def test_check_paths_cached(self):
+        """
+        Test that answers are reused until the spectrum version changes.
+        """
+        paths_matrix = [['A', 'B', 'C']]
+        mod_formats_matrix = [['QPSK']]
+        resp = self.oracle_obj.check_paths(net_spec_dict=self.net_spec_dict, version=0, paths_matrix=paths_matrix,
+                                           mod_formats_matrix=mod_formats_matrix,
+                                           mod_formats_dict=self.mod_formats_dict)
+        self.assertTrue(resp[0])
+
+        self.net_spec_dict[('A', 'B')]['cores_matrix']['c'][:] = 1
+        resp = self.oracle_obj.check_paths(net_spec_dict=self.net_spec_dict, version=0, paths_matrix=paths_matrix,
+                                           mod_formats_matrix=mod_formats_matrix,
+                                           mod_formats_dict=self.mod_formats_dict)
+        self.assertTrue(resp[0])
+
+        resp = self.oracle_obj.check_paths(net_spec_dict=self.net_spec_dict, version=1, paths_matrix=paths_matrix,
+                                           mod_formats_matrix=mod_formats_matrix,
+                                           mod_formats_dict=self.mod_formats_dict)
+        self.assertFalse(resp[0])
+
+    def test_matches_mock_arrival(self):
+        """
+        Test that random networks get the same answers as a mock allocation, for every supported method, guard band,
+        and path length.
+        """
+        rng = np.random.default_rng(0)
+        paths_matrix = [self.node_list[start:end] for start in range(4) for end in range(start + 2, 6)]
+        sdn_props = self._get_sdn_props()
+        for trial in range(200):
+            self.engine_props['allocation_method'] = ['first_fit', 'priority_first'][trial % 2]
+            self.engine_props['guard_slots'] = trial % 4
+            taken_prob = rng.uniform(0.3, 0.95)
+            for cores_arr in {id(link_dict['cores_matrix']['c']): link_dict['cores_matrix']['c']
+                              for link_dict in self.net_spec_dict.values()}.values():
+                cores_arr[:] = np.where(rng.random(cores_arr.shape) < taken_prob, rng.integers(-9, 9, cores_arr.shape),
+                                        0)
+            self.mod_formats_dict['QPSK']['slots_needed'] = int(rng.integers(1, 6))
+            mod_formats_matrix = [['QPSK' if rng.random() < 0.8 else False, '16-QAM'] for _ in paths_matrix]
+
+            resp = self.oracle_obj.check_paths(net_spec_dict=self.net_spec_dict, version=trial,
+                                               paths_matrix=paths_matrix, mod_formats_matrix=mod_formats_matrix,
+                                               mod_formats_dict=self.mod_formats_dict)
+            for path_index, path_list in enumerate(paths_matrix):
+                was_allocated = RLHelpers.mock_handle_arrival(engine_props=self.engine_props, sdn_props=sdn_props,
+                                                              path_list=path_list,
+                                                              mod_format_list=mod_formats_matrix[path_index])
+                self.assertEqual(bool(resp[path_index]), was_allocated, f'{trial}: {path_list}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import tracemalloc
+import unittest
+
+from helper_scripts.memory_helpers import MemoryTracker, _get_component, get_peak_rss
+
+
+class TestMemoryHelpers(unittest.TestCase):
+    """
+    Tests memory_helpers.py
+    """
+
+    def setUp(self):
+        self.was_tracing = tracemalloc.is_tracing()
+        self.memory_obj = MemoryTracker()
+
+    def tearDown(self):
+        self.memory_obj.stop()
+
+    def test_get_component(self):
+        """
+        Test that allocations are attributed by file and then by package.
+        """
+        self.assertEqual(_get_component(file_path='/repo/src/engine.py'), 'engine')
+        self.assertEqual(_get_component(file_path='/repo/helper_scripts/trace_helpers.py'), 'requests')
+        self.assertEqual(_get_component(file_path='/lib/site-packages/networkx/classes/graph.py'), 'networkx')
+        self.assertEqual(_get_component(file_path='/lib/python3/json/decoder.py'), 'other')
+
+    def test_get_report(self):
+        """
+        Test that memory still held is reported with the container counts.
+        """
+        held_list = [bytearray(2 ** 20) for _ in range(4)]
+        resp = self.memory_obj.get_report(counts_dict={'reqs_dict': 1})
+
+        self.assertEqual(len(held_list), 4)
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertGreaterEqual(resp['traced_mb'], 4.0)
+        self.assertGreaterEqual(resp['peak_traced_mb'], resp['traced_mb'])
+        self.assertGreaterEqual(sum(resp['components_dict'].values()), 4.0)
+        self.assertIn('test_memory_helpers.py', resp['top_list'][0][0])
+        self.assertEqual(resp['counts_dict'], {'reqs_dict': 1})
+
+    def test_get_summary_list(self):
+        """
+        Test the readable lines of a report.
+        """
+        report_dict = {
+            'traced_mb': 1.5, 'peak_traced_mb': 2.0, 'peak_rss_mb': None,
+            'components_dict': {'engine': 1.0, 'stats': 0.5}, 'top_list': [], 'counts_dict': {'reqs_dict': 3},
+        }
+        resp = MemoryTracker.get_summary_list(report_dict=report_dict)
+
+        self.assertEqual(resp, ['traced: 1.50 MB, peak traced: 2.00 MB, peak RSS: unknown',
+                                'engine: 1.00 MB, stats: 0.50 MB', 'reqs_dict: 3'])
+
+    def test_stop(self):
+        """
+        Test that tracing is only stopped by the tracker that started it.
+        """
+        other_obj = MemoryTracker()
+        other_obj.stop()
+        self.assertTrue(tracemalloc.is_tracing())
+
+        self.memory_obj.stop()
+        self.assertEqual(tracemalloc.is_tracing(), self.was_tracing)
+
+    def test_get_peak_rss(self):
+        """
+        Test that the peak resident set size is positive where it is reported.
+        """
+        resp = get_peak_rss()
+        if resp is not None:
+            self.assertGreater(resp, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
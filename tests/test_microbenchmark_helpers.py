@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from helper_scripts.microbenchmark_helpers import create_spectrum, get_primitives, time_primitive, get_setups
+from helper_scripts.microbenchmark_helpers import run_microbenchmarks, AXIS_DICT, BASE_SETUP_DICT
+
+
+class TestMicrobenchmarkHelpers(unittest.TestCase):
+    """
+    Tests microbenchmark_helpers.py
+    """
+
+    def test_create_spectrum(self):
+        """Test the size, occupancy, and guard bands of the generated spectrum."""
+        path_list, net_spec_dict = create_spectrum(num_slots=1024, num_cores=7, path_len=3, occupancy=0.5)
+
+        self.assertEqual(path_list, [0, 1, 2, 3])
+        self.assertEqual(len(net_spec_dict), 6)
+        self.assertIs(net_spec_dict[(0, 1)]['cores_matrix'], net_spec_dict[(1, 0)]['cores_matrix'])
+        core_arr = net_spec_dict[(2, 3)]['cores_matrix']['c'][6]
+        self.assertEqual(core_arr.shape, (1024,))
+        self.assertAlmostEqual(np.mean(core_arr != 0), 0.5, delta=0.1)
+        # Every channel ends with exactly one guard slot
+        req_id_arr = np.unique(core_arr[core_arr > 0])
+        self.assertEqual(len(req_id_arr), len(np.unique(core_arr[core_arr < 0])))
+
+        _, other_dict = create_spectrum(num_slots=1024, num_cores=7, path_len=3, occupancy=0.5)
+        self.assertTrue(np.array_equal(other_dict[(2, 3)]['cores_matrix']['c'],
+                                       net_spec_dict[(2, 3)]['cores_matrix']['c']))
+
+    def test_primitives(self):
+        """Test that every primitive runs on the base setup and timing reports seconds per call."""
+        path_list, net_spec_dict = create_spectrum(num_slots=256, num_cores=7, path_len=2, occupancy=0.3)
+        primitives_dict = get_primitives(path_list=path_list, net_spec_dict=net_spec_dict)
+
+        self.assertIn('check_super_channels', primitives_dict)
+        for func in primitives_dict.values():
+            func()
+        resp = time_primitive(func=primitives_dict['find_path_cong'], min_time=0.001, num_repeats=1)
+        self.assertGreater(resp, 0.0)
+        self.assertLess(resp, 0.1)
+
+    def test_run_microbenchmarks(self):
+        """Test the rows of each curve, errors, and skipping slow primitives."""
+        self.assertEqual(len(get_setups()), sum(len(value_list) for value_list in AXIS_DICT.values()))
+        self.assertEqual(get_setups(axis_list=['path_len'])[0], ('path_len', dict(BASE_SETUP_DICT, path_len=1)))
+
+        resp = run_microbenchmarks(axis_list=['num_slots'], primitive_list=['find_core_frag_cong', 'find_path_cong'],
+                                   max_seconds=0.0, min_time=0.001)
+        self.assertEqual(len(resp), 2 * len(AXIS_DICT['num_slots']))
+        frag_list = [row_dict for row_dict in resp if row_dict['primitive'] == 'find_core_frag_cong']
+        self.assertTrue(frag_list[0]['error'].startswith('NotImplementedError'))
+        self.assertIsNotNone(frag_list[1]['seconds'])
+
+        cong_list = [row_dict for row_dict in resp if row_dict['primitive'] == 'find_path_cong']
+        self.assertIsNotNone(cong_list[0]['seconds'])
+        self.assertEqual({row_dict['error'] for row_dict in cong_list[1:]}, {'skipped'})
+
+
+if __name__ == '__main__':
+    unittest.main()
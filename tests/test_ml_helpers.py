@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import MagicMock
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from sklearn.tree import DecisionTreeClassifier
+
+from arg_scripts.sdn_args import SDNProps
+from helper_scripts.ml_helpers import FEATURE_LIST, FeatureEncoder, check_features, get_ml_obs
+
+
+class TestFeatureEncoder(unittest.TestCase):
+    """
+    Tests the feature encoder in ml_helpers.py
+    """
+
+    def setUp(self):
+        topology = nx.Graph()
+        topology.add_edge('A', 'B', length=100)
+        topology.add_edge('B', 'C', length=200)
+        self.engine_props = {'k_paths': 2, 'cores_per_link': 2, 'topology': topology}
+        self.net_spec_dict = {
+            ('A', 'B'): {'cores_matrix': {'c': np.array([[1, 1, -1, 0], [0, 0, 0, 0]])}},
+            ('B', 'C'): {'cores_matrix': {'c': np.array([[0, 0, 0, 0], [2, -2, 0, 0]])}},
+        }
+        self.req_dict = {'bandwidth': '100', 'mod_formats': {'QPSK': {'max_length': 2000}}}
+        self.encoder_obj = FeatureEncoder(engine_props=self.engine_props)
+
+    def test_get_obs_matrix(self):
+        """
+        Test the features of every path, more paths than expected grow the reused matrix.
+        """
+        paths_matrix = [['A', 'B'], ['A', 'B', 'C'], ['B', 'C']]
+        obs_matrix = self.encoder_obj.get_obs_matrix(req_dict=self.req_dict, paths_matrix=paths_matrix,
+                                                     net_spec_dict=self.net_spec_dict)
+
+        self.assertEqual(obs_matrix.shape, (3, len(FEATURE_LIST)))
+        self.assertEqual(obs_matrix[0].tolist(), [100, 2000, 0.375, 0, 1, 0, 0])
+        self.assertEqual(obs_matrix[1].tolist(), [300, 2000, 0.3125, 0, 1, 0, 0])
+        self.assertEqual(obs_matrix[2].tolist(), [200, 2000, 0.25, 0, 1, 0, 0])
+
+        self.req_dict['bandwidth'] = '25'
+        obs_matrix = self.encoder_obj.get_obs_matrix(req_dict=self.req_dict, paths_matrix=[['A', 'B']],
+                                                     net_spec_dict=self.net_spec_dict)
+        self.assertEqual(obs_matrix[0, 3:].tolist(), [0, 0, 0, 0])
+
+    def test_predict(self):
+        """
+        Test that every valid path is scored by one call to the model.
+        """
+        model = MagicMock()
+        model.predict.return_value = np.array([4, 2])
+        resp = self.encoder_obj.predict(model=model, req_dict=self.req_dict, net_spec_dict=self.net_spec_dict,
+                                        paths_matrix=[['A', 'B'], False, ['A', 'B', 'C']])
+
+        self.assertEqual(resp, [4, None, 2])
+        model.predict.assert_called_once()
+        self.assertEqual(model.predict.call_args[0][0].shape, (2, len(FEATURE_LIST)))
+
+        model.reset_mock()
+        self.assertEqual(self.encoder_obj.predict(model=model, req_dict=self.req_dict, paths_matrix=[False],
+                                                  net_spec_dict=self.net_spec_dict), [None])
+        model.predict.assert_not_called()
+
+    def test_predict_matches_data_frame(self):
+        """
+        Test that a model trained on a data frame predicts the same from encoded rows as from get_ml_obs.
+        """
+        rng = np.random.default_rng(0)
+        train_df = pd.DataFrame(rng.random((50, len(FEATURE_LIST))), columns=FEATURE_LIST)
+        model = DecisionTreeClassifier(random_state=0).fit(train_df, rng.integers(1, 4, 50))
+        check_features(model=model)
+
+        sdn_props = SDNProps()
+        sdn_props.net_spec_dict = self.net_spec_dict
+        paths_matrix = [['A', 'B'], ['A', 'B', 'C']]
+        resp = self.encoder_obj.predict(model=model, req_dict=self.req_dict, paths_matrix=paths_matrix,
+                                        net_spec_dict=self.net_spec_dict)
+        for path_index, path_list in enumerate(paths_matrix):
+            sdn_props.path_list = path_list
+            input_df = get_ml_obs(req_dict=self.req_dict, engine_props=self.engine_props, sdn_props=sdn_props)
+            self.assertEqual(list(input_df.columns), FEATURE_LIST)
+            self.assertEqual(resp[path_index], model.predict(input_df)[0])
+
+    def test_check_features(self):
+        """
+        Test that a model trained on other columns is rejected.
+        """
+        model = MagicMock()
+        model.feature_names_in_ = np.array(list(reversed(FEATURE_LIST)), dtype=object)
+        with self.assertRaises(ValueError):
+            check_features(model=model)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -149,6 +149,15 @@ class TestCoreAgent(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.core_agent.end_iter()
 
+    def test_end_iter_bandit(self):
+        """
+        Test that a core bandit gets the chance to save its model once an iteration ends.
+        """
+        self.core_agent.core_algorithm = 'ucb_bandit'
+        self.core_agent.agent_obj = MagicMock()
+        self.core_agent.end_iter()
+        self.core_agent.agent_obj.end_iter.assert_called_once()
+
     def test_setup_env_q_learning(self):
         """
         Test setup_env method when core_algorithm is 'q_learning'.
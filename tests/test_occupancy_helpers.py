@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from helper_scripts.occupancy_helpers import COMPACT_DTYPE, create_occupancy, update_occupancy, is_range_free
+
+
+class TestOccupancyHelpers(unittest.TestCase):
+    """
+    Tests occupancy_helpers.py
+    """
+
+    def setUp(self):
+        cores_arr = np.zeros((2, 20), dtype=COMPACT_DTYPE)
+        cores_arr[0][3:6] = 7
+        cores_arr[0][6] = -7
+        cores_arr[1][16] = 2
+        self.link_dict = {'cores_matrix': {'c': cores_arr}}
+        self.link_dict['occupied_matrix'] = create_occupancy(cores_matrix=self.link_dict['cores_matrix'])
+
+    def test_create_occupancy(self):
+        """
+        Test that every request and guard band slot is packed as a taken bit.
+        """
+        occupied_arr = self.link_dict['occupied_matrix']['c']
+        self.assertEqual(occupied_arr.shape, (2, 3))
+        self.assertTrue(np.array_equal(np.unpackbits(occupied_arr, axis=-1)[:, :20],
+                                       self.link_dict['cores_matrix']['c'] != 0))
+
+    def test_update_occupancy(self):
+        """
+        Test that a core is repacked after its spectrum changes.
+        """
+        self.link_dict['cores_matrix']['c'][1][16] = 0
+        self.link_dict['cores_matrix']['c'][1][0] = 3
+        update_occupancy(link_dict=self.link_dict, band='c', core_num=1)
+
+        self.assertTrue(is_range_free(occupied_list=[self.link_dict['occupied_matrix']['c'][1]], start_slot=1,
+                                      end_slot=20))
+        self.assertFalse(is_range_free(occupied_list=[self.link_dict['occupied_matrix']['c'][1]], start_slot=0,
+                                       end_slot=1))
+
+    def test_is_range_free(self):
+        """
+        Test ranges within a byte, across bytes, and over several cores.
+        """
+        core_arr, other_arr = self.link_dict['occupied_matrix']['c']
+        self.assertTrue(is_range_free(occupied_list=[core_arr], start_slot=0, end_slot=3))
+        self.assertFalse(is_range_free(occupied_list=[core_arr], start_slot=2, end_slot=4))
+        self.assertFalse(is_range_free(occupied_list=[core_arr], start_slot=6, end_slot=7))
+        self.assertTrue(is_range_free(occupied_list=[core_arr], start_slot=7, end_slot=20))
+        self.assertFalse(is_range_free(occupied_list=[core_arr, other_arr], start_slot=7, end_slot=20))
+        self.assertTrue(is_range_free(occupied_list=[core_arr, other_arr], start_slot=7, end_slot=16))
+
+    def test_is_range_free_empty(self):
+        """
+        Test that an empty range is never free.
+        """
+        core_arr = self.link_dict['occupied_matrix']['c'][0]
+        self.assertFalse(is_range_free(occupied_list=[core_arr], start_slot=10, end_slot=10))
+        self.assertFalse(is_range_free(occupied_list=[core_arr], start_slot=12, end_slot=10))
+
+
+if __name__ == '__main__':
+    unittest.main()
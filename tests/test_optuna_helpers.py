@@ -0,0 +1,82 @@
+import os
+import shutil
+import unittest
+
+import optuna
+
+from helper_scripts.optuna_helpers import get_storage, get_pruner, run_study, is_multi_process
+
+
+def _objective(trial: optuna.Trial):
+    return trial.suggest_float('x', low=0.0, high=1.0)
+
+
+class TestOptunaHelpers(unittest.TestCase):
+    """
+    Tests optuna_helpers.py
+    """
+
+    def setUp(self):
+        self.save_dir = os.path.join('tests', 'optuna_test')
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+    def tearDown(self):
+        shutil.rmtree(self.save_dir, ignore_errors=True)
+
+    def test_get_storage(self):
+        """
+        Test the storage types.
+        """
+        resp = get_storage(storage_type='sqlite', save_dir=self.save_dir)
+        self.assertEqual(resp, f"sqlite:///{os.path.join(self.save_dir, 'study.db')}")
+        self.assertIsInstance(get_storage(storage_type='journal', save_dir=self.save_dir),
+                              optuna.storages.JournalStorage)
+        self.assertIsNone(get_storage(storage_type='None', save_dir=self.save_dir))
+        with self.assertRaises(NotImplementedError):
+            get_storage(storage_type='redis', save_dir=self.save_dir)
+
+    def test_get_pruner(self):
+        """
+        Test the pruner types.
+        """
+        self.assertIsInstance(get_pruner(pruner_type='median'), optuna.pruners.MedianPruner)
+        self.assertIsInstance(get_pruner(pruner_type='hyperband'), optuna.pruners.HyperbandPruner)
+        self.assertIsInstance(get_pruner(pruner_type=None), optuna.pruners.NopPruner)
+        with self.assertRaises(NotImplementedError):
+            get_pruner(pruner_type='random')
+
+    def test_is_multi_process(self):
+        """
+        Test that trials only run in processes of their own with more than one job and storage on disk.
+        """
+        self.assertTrue(is_multi_process(n_jobs=2, storage_type='journal'))
+        self.assertFalse(is_multi_process(n_jobs=2, storage_type=None))
+        self.assertFalse(is_multi_process(n_jobs=1, storage_type='sqlite'))
+        self.assertFalse(is_multi_process(n_jobs=None, storage_type='sqlite'))
+
+    def test_run_study(self):
+        """
+        Test that trials run in this process with a study in memory.
+        """
+        study = optuna.create_study(direction='maximize')
+        run_study(study=study, objective=_objective, n_trials=3, n_jobs=2, storage_type=None, save_dir=self.save_dir)
+        self.assertEqual(len(study.trials), 3)
+
+    def test_run_study_processes(self):
+        """
+        Test that processes share the study's storage and stop once it has enough trials.
+        """
+        study = optuna.create_study(direction='maximize', study_name='test_study',
+                                    storage=get_storage(storage_type='journal', save_dir=self.save_dir))
+        run_study(study=study, objective=_objective, n_trials=6, n_jobs=2, storage_type='journal',
+                  save_dir=self.save_dir)
+
+        complete_list = study.get_trials(states=(optuna.trial.TrialState.COMPLETE,))
+        # A process may start one more trial while another finishes the last one
+        self.assertGreaterEqual(len(complete_list), 6)
+        self.assertLessEqual(len(complete_list), 7)
+        self.assertEqual(len({trial.number for trial in complete_list}), len(complete_list))
+
+
+if __name__ == '__main__':
+    unittest.main()
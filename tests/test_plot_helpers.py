@@ -1,9 +1,13 @@
 # pylint: disable=protected-access
 
+import os
+import json
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 import numpy as np
-from helper_scripts.plot_helpers import PlotHelpers, find_times
+from helper_scripts.plot_helpers import PlotHelpers, find_times, find_sims
+from helper_scripts.catalog_helpers import update_catalog, get_catalog_fp
 from arg_scripts.plot_args import PlotArgs, PlotProps
 
 
@@ -164,5 +168,49 @@ class TestPlotHelpers(unittest.TestCase):
         self.assertEqual(len(resp['dates_matrix']), 2)
 
 
+class TestFindSims(unittest.TestCase):
+    """Unit tests for searching simulations saved with and without the results catalog."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_obj = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.base_fp = os.path.join(self.tmp_obj.name, 'data')
+        # Input files are searched relative to the script directories
+        os.makedirs(os.path.join(self.tmp_obj.name, 'plot_scripts'))
+        os.chdir(os.path.join(self.tmp_obj.name, 'plot_scripts'))
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_obj.cleanup()
+
+    def _save_input(self, sim_start: str, engine_props: dict):
+        input_fp = os.path.join(self.base_fp, 'input', 'NSFNet', '1019', sim_start)
+        os.makedirs(input_fp, exist_ok=True)
+        with open(os.path.join(input_fp, 'sim_input_s1.json'), 'w', encoding='utf-8') as file_obj:
+            json.dump(engine_props, file_obj)
+
+    def test_find_sims(self):
+        """Test that a run saved without the catalog is found next to a catalogued run."""
+        engine_props = {'network': 'NSFNet', 'date': '1019', 'sim_start': '10_00_00_000000', 'thread_num': 's1',
+                        'erlang': 300.0, 'max_segments': 1}
+        update_catalog(engine_props=engine_props, iteration=0, header_dict={'blocking_mean': 0.05},
+                       iter_dict={'sim_block_list': [0.05]}, base_fp=self.base_fp)
+        self._save_input(sim_start='10_00_00_000000', engine_props=engine_props)
+        self._save_input(sim_start='09_00_00_000000', engine_props=dict(engine_props, sim_start='09_00_00_000000'))
+
+        filter_dict = {'and_filter_list': [['max_segments', 1]], 'or_filter_list': [], 'not_filter_list': []}
+        resp = find_sims(dates_dict={'1019': 'NSFNet'}, filter_dict=filter_dict,
+                         catalog_fp=get_catalog_fp(base_fp=self.base_fp))
+
+        self.assertEqual(sorted(resp['times_matrix']), [['09_00_00_000000'], ['10_00_00_000000']])
+        self.assertEqual(resp['sims_matrix'], [['s1'], ['s1']])
+        self.assertEqual(resp['dates_matrix'], [['1019'], ['1019']])
+
+        filter_dict['and_filter_list'] = [['max_segments', 4]]
+        resp = find_sims(dates_dict={'1019': 'NSFNet'}, filter_dict=filter_dict,
+                         catalog_fp=get_catalog_fp(base_fp=self.base_fp))
+        self.assertEqual(resp['times_matrix'], [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+import os
+import pstats
+import shutil
+import unittest
+
+from helper_scripts.profile_helpers import run_profiled, merge_profiles, get_top_functions, get_collapsed_stacks
+from helper_scripts.profile_helpers import MERGED_NAME, COLLAPSED_NAME
+
+
+def _inner_loop(num_iters: int):
+    return sum(index * index for index in range(num_iters))
+
+
+def _outer_loop(num_iters: int):
+    return _inner_loop(num_iters=num_iters) + _inner_loop(num_iters=num_iters)
+
+
+class TestProfileHelpers(unittest.TestCase):
+    """
+    Tests profile_helpers.py
+    """
+
+    def setUp(self):
+        self.profile_dir = os.path.join('tests', 'profile_test_data')
+
+    def tearDown(self):
+        if os.path.exists(self.profile_dir):
+            shutil.rmtree(self.profile_dir)
+
+    def test_run_profiled(self):
+        """Test that the profiled function returns its result and saves a profile."""
+        profile_fp = os.path.join(self.profile_dir, 's1_300.0.prof')
+        resp = run_profiled(func=_outer_loop, profile_fp=profile_fp, num_iters=10)
+
+        self.assertEqual(resp, 570)
+        self.assertTrue(os.path.isfile(profile_fp))
+        self.assertEqual(os.listdir(self.profile_dir), ['s1_300.0.prof'])
+
+    def test_merge_profiles(self):
+        """Test merging the profiles of two Erlangs into one pstats file and collapsed stacks."""
+        self.assertIsNone(merge_profiles(profile_dir=self.profile_dir))
+        for erlang in [300.0, 400.0]:
+            run_profiled(func=_outer_loop, profile_fp=os.path.join(self.profile_dir, f's1_{erlang}.prof'),
+                         num_iters=20000)
+
+        stats_obj = merge_profiles(profile_dir=self.profile_dir)
+        inner_list = [stats_tuple for func_tuple, stats_tuple in stats_obj.stats.items()
+                      if func_tuple[2] == '_inner_loop']
+        # Two calls per profile
+        self.assertEqual(inner_list[0][1], 4)
+
+        merged_obj = pstats.Stats(os.path.join(self.profile_dir, MERGED_NAME))
+        self.assertEqual(len(merged_obj.stats), len(stats_obj.stats))
+        # Merging again must not count the merged profile
+        self.assertEqual(merge_profiles(profile_dir=self.profile_dir).total_calls, stats_obj.total_calls)
+
+        with open(os.path.join(self.profile_dir, COLLAPSED_NAME), 'r', encoding='utf-8') as file_obj:
+            line_list = file_obj.read().splitlines()
+        self.assertTrue(line_list)
+        for line in line_list:
+            stack_str, time_us = line.rsplit(' ', 1)
+            self.assertGreater(int(time_us), 0)
+            self.assertNotIn(' ', stack_str)
+        self.assertTrue(any('_outer_loop;' in line and '_inner_loop' in line for line in line_list))
+
+        collapsed_dict = get_collapsed_stacks(stats_obj=stats_obj)
+        self.assertLessEqual(sum(collapsed_dict.values()), stats_obj.total_tt * 1e6 + len(collapsed_dict))
+
+    def test_get_top_functions(self):
+        """Test that the functions with the most time spent in them come first."""
+        profile_fp = os.path.join(self.profile_dir, 's1_300.0.prof')
+        run_profiled(func=_outer_loop, profile_fp=profile_fp, num_iters=20000)
+
+        resp = get_top_functions(stats_obj=pstats.Stats(profile_fp), num_funcs=2)
+        self.assertEqual(len(resp), 2)
+        self.assertGreaterEqual(resp[0][2], resp[1][2])
+        self.assertTrue(any('_inner_loop' in row[0] or 'genexpr' in row[0] for row in resp))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import numpy as np
@@ -48,12 +49,26 @@ class TestQLearningHelpers(unittest.TestCase):
 
     def test_setup_env(self):
         """Test the setup_env method."""
-        with patch.object(self.q_learning_helpers, '_init_q_tables') as mock_init_q_tables:
-            self.q_learning_helpers.setup_env()
-            self.assertEqual(self.q_learning_helpers.props.epsilon, self.engine_props['epsilon_start'])
-            self.assertIsInstance(self.q_learning_helpers.props.routes_matrix, np.ndarray)
-            self.assertIsInstance(self.q_learning_helpers.props.cores_matrix, np.ndarray)
-            mock_init_q_tables.assert_called_once()
+        self.q_learning_helpers.setup_env()
+        self.assertEqual(self.q_learning_helpers.props.epsilon, self.engine_props['epsilon_start'])
+        self.assertEqual(self.q_learning_helpers.props.routes_matrix.shape, (5, 5, 3, 2))
+        self.assertEqual(self.q_learning_helpers.props.cores_matrix.shape, (5, 5, 3, 2, 2))
+        self.assertEqual(self.q_learning_helpers.props.routes_matrix.dtype, np.float32)
+        self.assertFalse(np.any(self.q_learning_helpers.props.cores_matrix))
+        # Paths are only found once they are needed
+        self.assertTrue(np.all(self.q_learning_helpers.props.path_ids_matrix == -1))
+
+    def test_get_paths(self):
+        """Test that paths are found once and shared through the paths table."""
+        self.q_learning_helpers.setup_env()
+        with patch('helper_scripts.ql_helpers.nx.shortest_simple_paths',
+                   wraps=nx.shortest_simple_paths) as mock_paths:
+            paths_list = self.q_learning_helpers.get_paths(source=0, destination=2)
+            self.assertEqual(self.q_learning_helpers.get_paths(source=0, destination=2), paths_list)
+            mock_paths.assert_called_once()
+
+        self.assertEqual(paths_list, [['0', '1', '2'], ['0', '4', '3', '2']])
+        self.assertEqual(self.q_learning_helpers.props.path_ids_matrix[0, 2].tolist(), [0, 1, -1])
 
     def test_update_routes_matrix(self):
         """Test the update_routes_matrix method."""
@@ -67,10 +82,11 @@ class TestQLearningHelpers(unittest.TestCase):
 
         # Manually set up the routes_matrix with known values
         self.q_learning_helpers.props.routes_matrix[self.rl_props.source][self.rl_props.destination][
-            self.rl_props.chosen_path_index][level_index] = ('path', 1.0)
+            self.rl_props.chosen_path_index][level_index] = 1.0
 
         # Mock the methods called within update_routes_matrix
-        with patch.object(self.q_learning_helpers, 'get_max_future_q', return_value=5.0):
+        with patch.object(self.q_learning_helpers, 'get_max_future_q', return_value=5.0), \
+                patch.object(self.q_learning_helpers, 'get_paths', return_value=[['0', '1']] * 3):
             with patch.object(self.q_learning_helpers, 'update_q_stats') as mock_update_q_stats:
                 self.q_learning_helpers.update_routes_matrix(reward=reward, level_index=level_index,
                                                              net_spec_dict=net_spec_dict)
@@ -90,8 +106,8 @@ class TestQLearningHelpers(unittest.TestCase):
                         self.engine_props['learn_rate'] * (reward + discount_factor * max_future_q))
                 updated_q_value = \
                     self.q_learning_helpers.props.routes_matrix[self.rl_props.source][self.rl_props.destination][
-                        self.rl_props.chosen_path_index][level_index]['q_value']
-                self.assertAlmostEqual(updated_q_value, new_q_value)
+                        self.rl_props.chosen_path_index][level_index]
+                self.assertAlmostEqual(updated_q_value, new_q_value, places=5)
 
     def test_update_cores_matrix(self):
         """Test the update_cores_matrix method."""
@@ -105,7 +121,8 @@ class TestQLearningHelpers(unittest.TestCase):
         net_spec_dict = MagicMock()
 
         # Mock the methods called within update_cores_matrix
-        with patch.object(self.q_learning_helpers, 'get_max_future_q', return_value=10.0):
+        with patch.object(self.q_learning_helpers, 'get_max_future_q', return_value=10.0), \
+                patch.object(self.q_learning_helpers, 'get_paths', return_value=[['0', '1']] * 3):
             with patch.object(self.q_learning_helpers, 'update_q_stats') as mock_update_q_stats:
                 self.q_learning_helpers.update_cores_matrix(reward=reward, core_index=core_index,
                                                             level_index=level_index,
@@ -118,12 +135,13 @@ class TestQLearningHelpers(unittest.TestCase):
                                                             td_error=expected_td_error)
 
     @patch('helper_scripts.ql_helpers.create_dir')
-    @patch('helper_scripts.ql_helpers.np.save')
+    @patch('helper_scripts.ql_helpers.np.savez')
     @patch('builtins.open', new_callable=MagicMock)
-    def test_save_model(self, mock_open_func, mock_np_save, mock_create_dir):
+    def test_save_model(self, mock_open_func, mock_np_savez, mock_create_dir):
         """Test the save_model method."""
         path_algorithm = 'q_learning'
         core_algorithm = 'first_fit'
+        self.q_learning_helpers.setup_env()
 
         # Call the method being tested
         self.q_learning_helpers.save_model(path_algorithm=path_algorithm, core_algorithm=core_algorithm)
@@ -135,14 +153,35 @@ class TestQLearningHelpers(unittest.TestCase):
 
         # Verify that the numpy save function was called with the correct filepath
         save_fp = os.path.join(os.getcwd(), save_dir,
-                               f"e{self.engine_props['erlang']}_routes_c{self.engine_props['cores_per_link']}.npy")
-        mock_np_save.assert_called_once_with(save_fp, self.q_learning_helpers.props.routes_matrix)
+                               f"e{self.engine_props['erlang']}_routes_c{self.engine_props['cores_per_link']}.npz")
+        mock_np_savez.assert_called_once()
+        self.assertEqual(mock_np_savez.call_args.args, (save_fp,))
+        self.assertIs(mock_np_savez.call_args.kwargs['q_table'], self.q_learning_helpers.props.routes_matrix)
 
         # Verify that the open function was called to save parameters
         param_fp = os.path.join(save_dir,
                                 f"e{self.engine_props['erlang']}_params_c{self.engine_props['cores_per_link']}.json")
         mock_open_func.assert_called_once_with(param_fp, 'w', encoding='utf-8')
 
+    def test_save_load_model(self):
+        """Test that a saved model loads without pickling, paths included."""
+        self.q_learning_helpers.setup_env()
+        self.q_learning_helpers.get_paths(source=0, destination=2)
+        self.q_learning_helpers.props.cores_matrix[0, 2, 1, 1, 0] = 0.25
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch('helper_scripts.ql_helpers.os.getcwd',
+                                                             return_value=tmp_dir):
+            save_dir = os.path.join(tmp_dir, 'logs', 'q_learning', 'TestNetwork', '2023-08-12', 'start_time')
+            with patch('helper_scripts.ql_helpers.create_dir', side_effect=lambda file_path: os.makedirs(
+                    os.path.join(tmp_dir, file_path))), patch.object(self.q_learning_helpers, '_save_params'):
+                self.q_learning_helpers.save_model(path_algorithm='first_fit', core_algorithm='q_learning')
+
+            loaded_obj = QLearningHelpers(rl_props=self.rl_props, engine_props=self.engine_props)
+            loaded_obj.load_model(model_fp=os.path.join(save_dir, 'e10_cores_c2.npz'), matrix_flag='cores_matrix')
+
+        self.assertTrue(np.array_equal(loaded_obj.props.cores_matrix, self.q_learning_helpers.props.cores_matrix))
+        self.assertEqual(loaded_obj.get_paths(source=0, destination=2), [['0', '1', '2'], ['0', '4', '3', '2']])
+
     def test_get_max_curr_q(self):
         """Test the get_max_curr_q method."""
         cong_list = [(0, 0, 0), (1, 1, 1)]
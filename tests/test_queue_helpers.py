@@ -0,0 +1,119 @@
+import os
+import json
+import time
+import shutil
+import unittest
+import multiprocessing
+
+from helper_scripts.queue_helpers import JobQueue, run_worker
+
+
+def _write_result(job_dict: dict):
+    time.sleep(0.01)
+    result_fp = os.path.join(job_dict['result_dir'], f"{job_dict['job_num']}_{os.getpid()}.json")
+    with open(result_fp, 'w', encoding='utf-8') as file_obj:
+        json.dump(job_dict, file_obj)
+
+
+def _start_worker(queue_dir: str):
+    run_worker(queue_obj=JobQueue(queue_dir=queue_dir, lease_time=10.0), job_func=_write_result, poll_time=0.05)
+
+
+class TestQueueHelpers(unittest.TestCase):
+    """
+    Tests queue_helpers.py
+    """
+
+    def setUp(self):
+        self.queue_dir = os.path.join('tests', 'queue_test_data', 'queue')
+        self.result_dir = os.path.join('tests', 'queue_test_data', 'results')
+        os.makedirs(self.result_dir, exist_ok=True)
+        self.queue_obj = JobQueue(queue_dir=self.queue_dir, lease_time=10.0)
+
+    def tearDown(self):
+        shutil.rmtree(os.path.join('tests', 'queue_test_data'))
+
+    def test_claim_and_complete(self):
+        """
+        Test that a job moves from pending to leased to done.
+        """
+        job_id = self.queue_obj.put(job_dict={'job_num': 1})
+        self.assertEqual(self.queue_obj.claim(), (job_id, {'job_num': 1}))
+        self.assertIsNone(self.queue_obj.claim())
+        self.assertFalse(self.queue_obj.is_finished())
+
+        self.queue_obj.complete(job_id=job_id)
+        self.assertTrue(self.queue_obj.is_finished())
+        self.assertTrue(os.path.isfile(os.path.join(self.queue_dir, 'done', f'{job_id}.json')))
+
+    def test_expired_lease_requeued(self):
+        """
+        Test that a job without heartbeats is returned to the queue.
+        """
+        job_id = self.queue_obj.put(job_dict={'job_num': 1})
+        self.queue_obj.claim()
+        self.assertEqual(self.queue_obj.requeue_expired(), [])
+
+        leased_fp = os.path.join(self.queue_dir, 'leased', f'{job_id}.json')
+        old_time = time.time() - 60.0
+        os.utime(leased_fp, (old_time, old_time))
+        self.assertEqual(self.queue_obj.requeue_expired(), [job_id])
+        self.assertEqual(self.queue_obj.claim()[0], job_id)
+
+    def test_stale_owner(self):
+        """
+        Test that a worker whose lease expired neither renews nor finishes a job leased again by another worker.
+        """
+        job_id = self.queue_obj.put(job_dict={'job_num': 1})
+        self.queue_obj.claim()
+        leased_fp = os.path.join(self.queue_dir, 'leased', f'{job_id}.json')
+        old_time = time.time() - 60.0
+        os.utime(leased_fp, (old_time, old_time))
+
+        other_obj = JobQueue(queue_dir=self.queue_dir, lease_time=10.0)
+        self.assertEqual(other_obj.requeue_expired(), [job_id])
+        self.assertEqual(other_obj.claim(), (job_id, {'job_num': 1}))
+
+        os.utime(leased_fp, (old_time, old_time))
+        self.assertFalse(self.queue_obj.heartbeat(job_id=job_id))
+        self.assertEqual(os.path.getmtime(leased_fp), old_time)
+        self.queue_obj.complete(job_id=job_id, is_failed=True, error_str='Stale')
+        self.assertTrue(os.path.isfile(leased_fp))
+        self.assertFalse(self.queue_obj.is_finished())
+
+        self.assertTrue(other_obj.heartbeat(job_id=job_id))
+        other_obj.complete(job_id=job_id)
+        self.assertTrue(os.path.isfile(os.path.join(self.queue_dir, 'done', f'{job_id}.json')))
+        self.assertFalse(os.path.isfile(os.path.join(self.queue_dir, 'failed', f'{job_id}.err')))
+
+    def test_failed_job(self):
+        """
+        Test that a job raising an error is moved to failed with its traceback.
+        """
+        job_id = self.queue_obj.put(job_dict={'job_num': 1})
+        jobs_done = run_worker(queue_obj=self.queue_obj, job_func=lambda job_dict: 1 / 0, poll_time=0.01)
+        self.assertEqual(jobs_done, 0)
+        self.assertTrue(os.path.isfile(os.path.join(self.queue_dir, 'failed', f'{job_id}.err')))
+
+    def test_multiple_workers(self):
+        """
+        Test that several worker processes run every job exactly once.
+        """
+        num_jobs = 20
+        for job_num in range(num_jobs):
+            self.queue_obj.put(job_dict={'job_num': job_num, 'result_dir': self.result_dir})
+
+        process_list = [multiprocessing.Process(target=_start_worker, args=(self.queue_dir,)) for _ in range(3)]
+        for process_obj in process_list:
+            process_obj.start()
+        for process_obj in process_list:
+            process_obj.join(timeout=60)
+
+        result_list = os.listdir(self.result_dir)
+        self.assertEqual(len(result_list), num_jobs)
+        self.assertEqual({int(file_name.split('_')[0]) for file_name in result_list}, set(range(num_jobs)))
+        self.assertTrue(self.queue_obj.is_finished())
+
+
+if __name__ == '__main__':
+    unittest.main()
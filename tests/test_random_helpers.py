@@ -1,5 +1,8 @@
 import unittest
-from helper_scripts.random_helpers import set_seed, get_uniform_rv, get_exponential_rv
+
+import numpy as np
+
+from helper_scripts.random_helpers import set_seed, get_uniform_rv, get_exponential_rv, get_generator, get_random_int
 
 
 class TestRandomGenerators(unittest.TestCase):
@@ -42,3 +45,47 @@ class TestRandomGenerators(unittest.TestCase):
         scale_param = 5
         result = get_exponential_rv(scale_param)
         self.assertTrue(result >= 0, "The result should be non-negative.")
+
+    def test_generator_streams(self):
+        """
+        Tests that streams are reproducible, independent of creation order, and distinct per key.
+        """
+        first_rng = get_generator(seed=1, stream_key_list=['s1', 250.0, 0, 'requests'])
+        first_list = get_uniform_rv(rng=first_rng, size=5).tolist()
+
+        get_generator(seed=1, stream_key_list=['s2', 250.0, 0, 'requests']).uniform(0, 1, size=100)
+        second_rng = get_generator(seed=1, stream_key_list=['s1', 250.0, 0, 'requests'])
+        self.assertEqual(first_list, get_uniform_rv(rng=second_rng, size=5).tolist())
+
+        other_rng = get_generator(seed=1, stream_key_list=['s1', 250.0, 0, 'path_agent'])
+        self.assertNotEqual(first_list, get_uniform_rv(rng=other_rng, size=5).tolist())
+
+    def test_generator_ignores_global_state(self):
+        """
+        Tests that draws from a generator are not affected by the global numpy state.
+        """
+        rng = get_generator(seed=3)
+        first_val = get_exponential_rv(scale_param=2.0, rng=rng)
+        set_seed(7)
+        np.random.uniform(0, 1, size=10)
+        rng = get_generator(seed=3)
+        self.assertEqual(first_val, get_exponential_rv(scale_param=2.0, rng=rng))
+
+    def test_batched_draws(self):
+        """
+        Tests batched draws match single draws from the same stream.
+        """
+        batch_arr = get_uniform_rv(scale_param=10, rng=get_generator(seed=5), size=20)
+        rng = get_generator(seed=5)
+        self.assertEqual(batch_arr.tolist(), [get_uniform_rv(scale_param=10, rng=rng) for _ in range(20)])
+        self.assertTrue(all(0 <= value < 10 for value in batch_arr))
+
+    def test_random_int_legacy(self):
+        """
+        Tests that the global numpy state is used when no generator is given.
+        """
+        set_seed(11)
+        expected_list = [np.random.randint(0, 7) for _ in range(10)]
+        set_seed(11)
+        self.assertEqual(expected_list, [get_random_int(high=7) for _ in range(10)])
+        self.assertTrue(0 <= get_random_int(high=7, rng=get_generator(seed=11)) < 7)
@@ -1,6 +1,8 @@
 import unittest
 
-from src.request_generator import get_requests
+import numpy as np
+
+from src.request_generator import get_requests, iter_requests
 
 
 class TestGetRequests(unittest.TestCase):
@@ -68,3 +70,23 @@ class TestGetRequests(unittest.TestCase):
         for _, value in requests.items():
             if value['request_type'] == 'arrival':
                 self.assertLess(value['arrive'], value['depart'])
+
+    def test_rng_streams(self):
+        """
+        Test that requests from an independent stream do not depend on the global random state.
+        """
+        self.engine_props['rng_streams'] = True
+        expected_dict = get_requests(seed=self.seed, engine_props=self.engine_props)
+        np.random.seed(1)
+        np.random.uniform(0, 1, size=10)
+        self.assertEqual(expected_dict, get_requests(seed=self.seed, engine_props=self.engine_props))
+
+    def test_iter_requests(self):
+        """
+        Test that streamed requests are in time order and identical to the sorted requests.
+        """
+        expected_dict = dict(sorted(get_requests(seed=self.seed, engine_props=self.engine_props).items()))
+        resp_list = list(iter_requests(seed=self.seed, engine_props=self.engine_props))
+
+        self.assertEqual([curr_time for curr_time, _ in resp_list], list(expected_dict.keys()))
+        self.assertEqual(dict(resp_list), expected_dict)
@@ -43,7 +43,7 @@ class TestRLHelpers(unittest.TestCase):
 
     def test_classify_paths(self):
         """Test the classify_paths method."""
-        paths_list = np.array([['path1'], ['path2']])
+        paths_list = ['path1', 'path2']
         with patch('helper_scripts.rl_helpers.find_path_cong', return_value=0.2):
             with patch('helper_scripts.rl_helpers.classify_cong', return_value=1):
                 result = self.rl_helpers.classify_paths(paths_list)
@@ -51,11 +51,12 @@ class TestRLHelpers(unittest.TestCase):
 
     def test_classify_cores(self):
         """Test the classify_cores method."""
-        cores_list = [{'path': ['path1'], 2: 'congestion_level'}]  # Ensure the dictionary has the expected keys
-        with patch('helper_scripts.rl_helpers.find_core_cong', return_value=0.3):
+        cores_list = np.array([[0.0, 0.1, 0.5]])
+        with patch('helper_scripts.rl_helpers.find_core_cong', return_value=0.3) as mock_core_cong:
             with patch('helper_scripts.rl_helpers.classify_cong', return_value=2):
-                result = self.rl_helpers.classify_cores(cores_list)
-                self.assertEqual(result, [(0, 'congestion_level', 2)])
+                result = self.rl_helpers.classify_cores(cores_list=cores_list, path_list=['path1'])
+                self.assertEqual(result, [(0, 0.5, 2)])
+                self.assertEqual(mock_core_cong.call_args.kwargs['path_list'], ['path1'])
 
     def test_update_route_props(self):
         """Test the update_route_props method."""
@@ -112,6 +113,32 @@ class TestRLHelpers(unittest.TestCase):
         self.assertFalse(result)
         mock_spectrum_assignment_instance.get_spectrum.assert_called_once()
 
+    def test_find_feasible_path(self):
+        """Test that the oracle answers supported methods and mock allocations answer the others."""
+        cores_matrix = {'c': np.zeros((7, 8))}
+        cores_matrix['c'][:, 1:] = 1
+        self.engine_obj.net_spec_dict = {('A', 'B'): {'cores_matrix': cores_matrix},
+                                         ('B', 'A'): {'cores_matrix': cores_matrix},
+                                         ('B', 'C'): {'cores_matrix': {'c': np.zeros((7, 8))}}}
+        self.engine_obj.net_spec_dict[('C', 'B')] = self.engine_obj.net_spec_dict[('B', 'C')]
+        self.engine_obj.engine_props = {'allocation_method': 'first_fit', 'snr_type': None, 'cores_per_link': 7,
+                                        'guard_slots': 1, 'fixed_grid': False, 'band_list': ['c']}
+        self.engine_obj.sdn_obj.spectrum_version = 0
+        sdn_props = MagicMock()
+        sdn_props.mod_formats_dict = {'QPSK': {'slots_needed': 2}}
+
+        resp = self.rl_helpers.find_feasible_path(paths_matrix=[['A', 'B'], ['B', 'C']],
+                                                  mod_formats_matrix=[['QPSK'], ['QPSK']], sdn_props=sdn_props)
+        self.assertEqual(resp, 1)
+        self.assertIsNotNone(self.rl_helpers.oracle_obj)
+
+        self.engine_obj.engine_props['allocation_method'] = 'best_fit'
+        with patch.object(RLHelpers, 'mock_handle_arrival', return_value=False) as mock_arrival:
+            resp = self.rl_helpers.find_feasible_path(paths_matrix=[['A', 'B'], ['B', 'C']],
+                                                      mod_formats_matrix=[['QPSK'], ['QPSK']], sdn_props=sdn_props)
+            self.assertIsNone(resp)
+            self.assertEqual(mock_arrival.call_count, 2)
+
     @patch('helper_scripts.rl_helpers.SDNProps')
     def test_update_mock_sdn(self, mock_sdn_props):
         """Test the update_mock_sdn method."""
@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+import pytest
+from gymnasium import Env, spaces
+
+pytest.importorskip('stable_baselines3')
+
+from helper_scripts.rl_setup_helpers import get_worker_props, setup_vec_env  # pylint: disable=wrong-import-position
+
+
+class _StubEnv(Env):  # pylint: disable=abstract-method
+    """ Numbers and seeds itself as SimEnv does. """
+
+    def __init__(self, render_mode=None, custom_callback=None, sim_dict=None, worker_num=None):
+        # pylint: disable=unused-argument
+        super().__init__()
+        self.sim_dict = dict(sim_dict['s1'])
+        self.sim_dict['thread_num'], self.seed_num = get_worker_props(worker_num=worker_num)
+        self.observation_space = spaces.Box(low=0.0, high=1.0, shape=(1,), dtype=np.float32)
+        self.action_space = spaces.Discrete(2)
+
+    def reset(self, seed=None, options=None):
+        return np.zeros(1, dtype=np.float32), dict()
+
+    def step(self, action):
+        return np.zeros(1, dtype=np.float32), 0.0, False, False, dict()
+
+
+class TestRLSetupHelpers(unittest.TestCase):
+    """
+    Tests the vectorized environment in rl_setup_helpers.py
+    """
+
+    def setUp(self):
+        self.sim_dict = {'network': 'NSFNet', 'date': '1019', 'sim_start': '10_00_00_000000', 'thread_num': 's1',
+                         'callback': object()}
+
+    def _get_workers(self, num_envs: int):
+        vec_env = setup_vec_env(env_cls=_StubEnv, sim_dict=self.sim_dict, num_envs=num_envs)
+        try:
+            return vec_env.get_attr('sim_dict'), vec_env.get_attr('seed_num')
+        finally:
+            vec_env.close()
+
+    def test_worker_props(self):
+        """
+        Test that workers come after the environment that built them.
+        """
+        self.assertEqual(get_worker_props(), ('s1', 0))
+        self.assertEqual(get_worker_props(worker_num=1), ('s2', 1))
+
+    def test_setup_vec_env(self):
+        """
+        Test that workers share the parent's start time with their own simulation numbers and seeds.
+        """
+        worker_list, seed_list = self._get_workers(num_envs=3)
+
+        self.assertEqual([worker_dict['thread_num'] for worker_dict in worker_list], ['s2', 's3', 's4'])
+        self.assertEqual(len(set(seed_list)), 3)
+        self.assertNotIn(0, seed_list)
+        for worker_dict in worker_list:
+            self.assertEqual((worker_dict['date'], worker_dict['sim_start']), ('1019', '10_00_00_000000'))
+            self.assertNotIn('callback', worker_dict)
+        self.assertEqual(self.sim_dict['thread_num'], 's1')
+
+    def test_setup_vec_env_start_time(self):
+        """
+        Test that a start time is created on the parent's dictionary when it has none.
+        """
+        self.sim_dict['sim_start'] = None
+        worker_list, _ = self._get_workers(num_envs=1)
+
+        self.assertIsNotNone(self.sim_dict['sim_start'])
+        self.assertEqual(worker_list[0]['sim_start'], self.sim_dict['sim_start'])
+        self.assertEqual(worker_list[0]['date'], self.sim_dict['date'])
+
+
+if __name__ == '__main__':
+    unittest.main()
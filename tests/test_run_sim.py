@@ -0,0 +1,121 @@
+import os
+import json
+import sys
+import shutil
+import unittest
+import subprocess
+import concurrent.futures
+from unittest.mock import patch
+
+from config_scripts.setup_config import read_config
+from config_scripts.parse_args import parse_args
+from helper_scripts.queue_helpers import JobQueue
+from run_sim import NetworkSimulator, enqueue, run_job
+from src.engine import Engine
+
+SIM_START = '9999_00_00_00_000000'
+
+
+def _run_job(job_dict: dict):
+    with patch('run_sim.Engine') as mock_engine:
+        run_job(job_dict=job_dict)
+
+    return [call.kwargs['engine_props']['mod_per_bw'] for call in mock_engine.call_args_list]
+
+
+class TestRunSim(unittest.TestCase):
+    """
+    Tests the job queue entry points of run_sim.py
+    """
+
+    def setUp(self):
+        with patch('sys.argv', ['program_name']):
+            self.thread_params = read_config(args_dict=parse_args(),
+                                             config_path=os.path.join('tests', 'fixtures', 'valid_config.ini'))['s1']
+        self.thread_params['thread_erlangs'] = True
+        self.thread_params['use_cache'] = False
+        self.thread_params['mod_assumption'] = 'YUE_MOD_ASSUMPTIONS'
+        self.thread_params['mod_assumption_path'] = None
+        self.thread_params['erlangs'] = {'start': 100, 'stop': 900, 'step': 100}
+        self.input_dir = os.path.join('data', 'input', self.thread_params['network'], SIM_START.split('_')[0])
+        self.queue_dir = os.path.join('tests', 'run_sim_test_data')
+        self.output_dir = os.path.join('data', 'output', self.thread_params['network'], SIM_START.split('_')[0])
+        self.cache_dir = os.path.join('data', 'cache')
+        self.cache_set = set(os.listdir(self.cache_dir)) if os.path.isdir(self.cache_dir) else set()
+
+    def tearDown(self):
+        shutil.rmtree(self.input_dir, ignore_errors=True)
+        shutil.rmtree(self.queue_dir, ignore_errors=True)
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        if os.path.isdir(self.cache_dir):
+            for cache_key in set(os.listdir(self.cache_dir)) - self.cache_set:
+                shutil.rmtree(os.path.join(self.cache_dir, cache_key))
+
+    def _check_jobs(self, job_list: list):
+        bw_fp = os.path.join(self.input_dir, SIM_START.split('_', 1)[1], 'bw_info_s1.json')
+        with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+            resp_list = list(executor.map(_run_job, job_list))
+
+        with open(bw_fp, 'r', encoding='utf-8') as file_obj:
+            bw_info_dict = json.load(file_obj)
+        self.assertEqual(len(resp_list), 8)
+        for mod_list in resp_list:
+            self.assertEqual(mod_list, [bw_info_dict])
+        self.assertEqual([file_name for file_name in os.listdir(os.path.dirname(bw_fp)) if file_name.endswith('.tmp')],
+                         [])
+
+    def test_run_job_concurrent(self):
+        """
+        Test that jobs of one simulation running at the same time all read complete input.
+        """
+        job_list = [{'thread_num': 's1', 'thread_params': self.thread_params, 'sim_start': SIM_START,
+                     'erlang_list': [float(erlang)]} for erlang in range(100, 900, 100)]
+        self._check_jobs(job_list=job_list)
+
+    def test_enqueue_creates_input(self):
+        """
+        Test that input is created once when jobs are queued, before any job runs.
+        """
+        with patch('run_sim.datetime') as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = SIM_START
+            enqueue(sims_dict={'s1': self.thread_params}, queue_dir=self.queue_dir)
+        self.assertTrue(os.path.exists(os.path.join(self.input_dir, SIM_START.split('_', 1)[1], 'bw_info_s1.json')))
+
+        queue_obj = JobQueue(queue_dir=self.queue_dir)
+        job_list = list()
+        claim_resp = queue_obj.claim()
+        while claim_resp is not None:
+            job_list.append(claim_resp[1])
+            claim_resp = queue_obj.claim()
+        self._check_jobs(job_list=job_list)
+
+    def test_bounded_memory_cache_hit(self):
+        """
+        Test that a result saved in bounded memory mode is found by the next run of the same point.
+        """
+        self.thread_params.update({'bounded_memory': True, 'use_cache': True, 'thread_erlangs': False,
+                                   'num_requests': 50, 'max_iters': 1, 'save_snapshots': False,
+                                   'output_train_data': False, 'is_only_core_node': True,
+                                   'erlangs': {'start': 100, 'stop': 200, 'step': 100}})
+        curr_sim = NetworkSimulator()
+        curr_sim.setup_sim(thread_num='s1', thread_params=self.thread_params, sim_start=SIM_START)
+        curr_sim.setup_input()
+        with patch('run_sim.Engine', wraps=Engine) as mock_engine:
+            curr_sim.run_erlangs(erlang_list=[100.0])
+            curr_sim.run_erlangs(erlang_list=[100.0])
+
+        mock_engine.assert_called_once()
+        self.assertIsNone(mock_engine.call_args.kwargs['engine_props']['stream_stats'])
+
+    def test_worker_requires_queue_dir(self):
+        """
+        Test that a worker without a queue directory fails with a clear message.
+        """
+        resp = subprocess.run([sys.executable, 'run_sim.py', '--worker'], capture_output=True, text=True,
+                              check=False, timeout=60)
+        self.assertNotEqual(resp.returncode, 0)
+        self.assertIn('ValueError: --worker requires --queue_dir', resp.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ import numpy as np
 
 from src.sdn_controller import SDNController
 from arg_scripts.sdn_args import SDNProps  # Class import for sdn_props
+from helper_scripts.occupancy_helpers import COMPACT_DTYPE, create_occupancy
+from helper_scripts.usage_helpers import create_usage
 
 
 class TestSDNController(unittest.TestCase):
@@ -46,6 +48,7 @@ class TestSDNController(unittest.TestCase):
             for core_num in range(self.engine_props['cores_per_link']):
                 core_arr = self.controller.sdn_props.net_spec_dict[link]['cores_matrix']['c'][core_num]
                 self.assertTrue(np.all(core_arr[:4] == 0), "Request and guard band not properly cleared")
+        self.assertEqual(self.controller.spectrum_version, 1)
 
     def test_allocate(self):
         """
@@ -65,6 +68,64 @@ class TestSDNController(unittest.TestCase):
 
             self.assertEqual(core_matrix[2], self.controller.sdn_props.req_id * -1,
                              msg="Guard band not properly allocated.")
+        self.assertEqual(self.controller.spectrum_version, 1)
+
+    def test_allocate_release_compact(self):
+        """
+        Test that the packed occupancy follows allocations and releases of a compact spectrum.
+        """
+        self.controller.engine_props['compact_spectrum'] = True
+        for link_dict in self.controller.sdn_props.net_spec_dict.values():
+            link_dict['cores_matrix']['c'] = np.zeros((7, 10), dtype=COMPACT_DTYPE)
+            link_dict['occupied_matrix'] = create_occupancy(cores_matrix=link_dict['cores_matrix'])
+        self.controller.spectrum_obj.spectrum_props.start_slot = 0
+        self.controller.spectrum_obj.spectrum_props.end_slot = 3
+        self.controller.spectrum_obj.spectrum_props.core_num = 0
+        self.controller.spectrum_obj.spectrum_props.curr_band = 'c'
+        self.controller.allocate()
+
+        for link_dict in self.controller.sdn_props.net_spec_dict.values():
+            occupied_arr = np.unpackbits(link_dict['occupied_matrix']['c'][0])[:10]
+            self.assertTrue(np.array_equal(occupied_arr, link_dict['cores_matrix']['c'][0] != 0))
+            self.assertEqual(occupied_arr[:3].tolist(), [1, 1, 1])
+        with self.assertRaises(BufferError):
+            self.controller.allocate()
+
+        self.controller.release()
+        for link_dict in self.controller.sdn_props.net_spec_dict.values():
+            self.assertFalse(np.any(link_dict['occupied_matrix']['c']))
+
+    def test_allocate_release_usage(self):
+        """
+        Test that the usage counters follow a request taking two slices, the second on another core, and its release.
+        """
+        net_spec_dict = dict()
+        for source, dest in [('A', 'B'), ('B', 'C')]:
+            cores_matrix = {'c': np.zeros((7, 10))}
+            usage_dict = create_usage(cores_matrix=cores_matrix)
+            net_spec_dict[(source, dest)] = {'cores_matrix': cores_matrix, 'usage_dict': usage_dict}
+            net_spec_dict[(dest, source)] = {'cores_matrix': cores_matrix, 'usage_dict': usage_dict}
+        self.controller.sdn_props.net_spec_dict = net_spec_dict
+        spectrum_props = self.controller.spectrum_obj.spectrum_props
+        spectrum_props.curr_band = 'c'
+        for start_slot, end_slot, core_num in [(0, 3, 0), (3, 6, 0), (0, 3, 2)]:
+            spectrum_props.start_slot, spectrum_props.end_slot, spectrum_props.core_num = start_slot, end_slot, core_num
+            self.controller.allocate()
+
+        for link_tuple, link_dict in net_spec_dict.items():
+            usage_dict = link_dict['usage_dict']
+            self.assertEqual(usage_dict['taken_matrix']['c'].tolist(), [6, 0, 3, 0, 0, 0, 0])
+            self.assertEqual(usage_dict['guard_matrix']['c'].tolist(), [2, 0, 1, 0, 0, 0, 0])
+            self.assertEqual(usage_dict['active_matrix']['c'].tolist(), [1, 0, 1, 0, 0, 0, 0])
+            # Only the first link of the path counts the request
+            self.assertEqual(usage_dict['num_reqs'], int('A' in link_tuple))
+
+        self.controller.release()
+        for link_dict in net_spec_dict.values():
+            usage_dict = link_dict['usage_dict']
+            for usage_key in ['taken_matrix', 'guard_matrix', 'active_matrix']:
+                self.assertFalse(np.any(usage_dict[usage_key]['c']))
+            self.assertEqual(usage_dict['num_reqs'], 0)
 
     def test_update_req_stats(self):
         """
@@ -13,6 +13,7 @@ class TestReadConfig(unittest.TestCase):
     def setUp(self):
         self.valid_conf = os.path.join('tests', 'fixtures', 'valid_config.ini')
         self.invalid_conf = os.path.join('tests', 'fixtures', 'invalid_config.ini')
+        self.sweep_conf = os.path.join('tests', 'fixtures', 'sweep_config.ini')
         self.mock_args = ['program_name']
 
         os.makedirs('tests/ini', exist_ok=True)
@@ -95,6 +96,35 @@ class TestReadConfig(unittest.TestCase):
         self.assertIsInstance(config_dict['s2'], dict)
         self.assertIsInstance(config_dict['s3'], dict)
 
+    @patch('sys.argv', ['program_name'])
+    def test_sweep_expansion(self):
+        """
+        Test that the sweep section expands into every unique combination of values.
+        """
+        args_obj = parse_args()
+        config_dict = read_config(args_obj, self.sweep_conf)
+        # s1 and s2 only differ in max_segments, which is also swept, so their combinations are identical
+        self.assertEqual(len(config_dict), 8)
+        self.assertEqual(list(config_dict.keys()), [f's{sim_num}' for sim_num in range(1, 9)])
+
+        combination_set = {(sim_dict['allocation_method'], sim_dict['cores_per_link'], sim_dict['max_segments'])
+                           for sim_dict in config_dict.values()}
+        self.assertEqual(len(combination_set), 8)
+        self.assertIn(('last_fit', 7, 4), combination_set)
+        self.assertIsInstance(config_dict['s1']['cores_per_link'], int)
+
+    @patch('sys.argv', ['program_name'])
+    def test_sweep_command_line_priority(self):
+        """
+        Test that command line arguments are not overridden by the sweep.
+        """
+        with patch('sys.argv', ['program_name', '--cores_per_link', '13']):
+            args_obj = parse_args()
+        config_dict = read_config(args_obj, self.sweep_conf)
+        self.assertEqual(len(config_dict), 4)
+        for sim_dict in config_dict.values():
+            self.assertEqual(sim_dict['cores_per_link'], 13)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -29,13 +29,14 @@ class TestSetupHelpers(unittest.TestCase):
         self.network_dict = {'nodes': [], 'links': []}
         self.pt_info = {'cores': 7, 'specifications': {}}
 
+    @patch('helper_scripts.setup_helpers.os.replace')
     @patch('helper_scripts.setup_helpers.create_bw_info')
     @patch('helper_scripts.setup_helpers.create_network')
     @patch('helper_scripts.setup_helpers.create_pt')
     @patch('helper_scripts.setup_helpers.save_input')
     @patch('builtins.open', new_callable=mock_open, read_data=json.dumps({'bandwidth': 100}))
     def test_create_input(self, mock_open_file, mock_save_input, mock_create_pt, mock_create_network,
-                          mock_create_bw_info):
+                          mock_create_bw_info, mock_replace):  # pylint: disable=too-many-arguments
         """ Tests create input. """
         # Setup mock return values
         mock_create_bw_info.return_value = self.bw_info_dict
@@ -48,12 +49,14 @@ class TestSetupHelpers(unittest.TestCase):
         # Assertions
         mock_create_bw_info.assert_called_once_with(mod_assumption=self.engine_props['mod_assumption'],
                                                     mod_assumptions_path=self.engine_props['mod_assumption_path'])
-        mock_save_input.assert_called_once_with(
-            base_fp=self.base_fp,
-            properties=self.engine_props,
-            file_name=f"bw_info_{self.engine_props['thread_num']}.json",
-            data_dict=self.bw_info_dict
-        )
+        mock_save_input.assert_called_once()
+        tmp_file = mock_save_input.call_args.kwargs['file_name']
+        self.assertTrue(tmp_file.startswith(f".bw_info_{self.engine_props['thread_num']}.json."))
+        self.assertEqual(mock_save_input.call_args.kwargs['data_dict'], self.bw_info_dict)
+        input_fp = os.path.join(self.base_fp, 'input', self.engine_props['network'], self.engine_props['date'],
+                                self.engine_props['sim_start'])
+        mock_replace.assert_called_once_with(os.path.join(input_fp, tmp_file),
+                                             os.path.join(input_fp, f"bw_info_{self.engine_props['thread_num']}.json"))
         mock_create_network.assert_called_once_with(
             base_fp=self.base_fp,
             const_weight=self.engine_props['const_link_weight'],
@@ -72,6 +75,26 @@ class TestSetupHelpers(unittest.TestCase):
         self.assertEqual(result['mod_per_bw'], {'bandwidth': 100})
         self.assertEqual(result['topology_info'], self.pt_info)
 
+    @patch('helper_scripts.setup_helpers.os.path.exists', return_value=True)
+    @patch('helper_scripts.setup_helpers.create_bw_info')
+    @patch('helper_scripts.setup_helpers.create_network')
+    @patch('helper_scripts.setup_helpers.create_pt')
+    @patch('helper_scripts.setup_helpers.save_input')
+    @patch('builtins.open', new_callable=mock_open, read_data=json.dumps({'bandwidth': 100}))
+    def test_create_input_exists(self, mock_open_file, mock_save_input, mock_create_pt, mock_create_network,
+                                 mock_create_bw_info, mock_exists):  # pylint: disable=too-many-arguments
+        """ Tests that input already created for the simulation is only read. """
+        mock_create_network.return_value = self.network_dict, self.core_nodes
+        mock_create_pt.return_value = self.pt_info
+
+        result = create_input(self.base_fp, self.engine_props)
+
+        mock_exists.assert_called_once()
+        mock_create_bw_info.assert_not_called()
+        mock_save_input.assert_not_called()
+        mock_open_file.assert_called_once()
+        self.assertEqual(result['mod_per_bw'], {'bandwidth': 100})
+
     @patch('helper_scripts.setup_helpers.create_dir')
     @patch('builtins.open', new_callable=mock_open)
     def test_save_input(self, mock_open_file, mock_create_dir):
@@ -18,6 +18,25 @@ from helper_scripts.sim_helpers import (
     get_super_channels, get_hfrag, classify_cong, parse_yaml_file, get_arrival_rates,
     run_simulation_for_arrival_rates, save_study_results, modify_multiple_json_values
 )
+from helper_scripts.usage_helpers import create_usage
+
+
+class _ArrivalEnv:  # pylint: disable=too-few-public-methods
+    """ An environment built again in every worker process. """
+
+    # pylint: disable=unused-argument
+    def __init__(self, render_mode=None, custom_callback=None, sim_dict=None, worker_num=None):
+        self.worker_num = worker_num
+        self.engine_obj = MagicMock()
+        self.engine_obj.engine_props = {}
+        self.sim_dict = sim_dict['s1']
+        self.path_agent = MagicMock()
+        self.path_agent.reward_penalty_list = []
+
+
+def _run_arrival(env, sim_dict):
+    env.path_agent.reward_penalty_list = [env.engine_obj.engine_props['erlang'], sim_dict['num_workers'],
+                                          env.worker_num]
 
 
 class TestSimHelpers(unittest.TestCase):
@@ -122,6 +141,27 @@ class TestSimHelpers(unittest.TestCase):
         calculated_core_cong = find_core_cong(core_index, net_spec_dict, path_list)
         self.assertAlmostEqual(calculated_core_cong, expected_core_cong, places=2)
 
+    def test_find_cong_usage(self):
+        """Test that links with usage counters give the same congestion without their cores being scanned."""
+        net_spec_dict = {
+            (1, 2): {'cores_matrix': {'c': np.array([[0, 1, -1], [1, 1, 0]]), 'l': np.array([[2, 0], [0, 0]])}},
+            (2, 3): {'cores_matrix': {'c': np.array([[1, 0, 0], [0, 0, 1]]), 'l': np.array([[0, 0], [-3, 3]])}}
+        }
+        usage_spec_dict = copy.deepcopy(net_spec_dict)
+        for link_dict in usage_spec_dict.values():
+            usage_dict = create_usage(cores_matrix=link_dict['cores_matrix'])
+            for band, cores_arr in link_dict['cores_matrix'].items():
+                usage_dict['taken_matrix'][band][:] = np.count_nonzero(cores_arr, axis=1)
+                # The counters are trusted, the cores are not read again
+                cores_arr[:] = 0
+            link_dict['usage_dict'] = usage_dict
+
+        path_list = [1, 2, 3]
+        self.assertEqual(find_path_cong(path_list, usage_spec_dict), find_path_cong(path_list, net_spec_dict))
+        for core_index in range(2):
+            self.assertEqual(find_core_cong(core_index, usage_spec_dict, path_list),
+                             find_core_cong(core_index, net_spec_dict, path_list))
+
     def test_find_core_frag_cong(self):
         """Test finding fragmentation and congestion on a core."""
         net_spec_dict = {
@@ -271,6 +311,24 @@ class TestSimHelpers(unittest.TestCase):
         self.assertTrue(np.array_equal(sc_index_mat, expected_sc_index_mat))
         self.assertTrue(np.array_equal(resp_frag_arr, expected_resp_frag_arr))
 
+    def test_get_hfrag_split_runs(self):
+        """Test scores when the path has several free runs, or none at all."""
+        net_spec_dict = {
+            (1, 2): {'cores_matrix': {'c': np.array([[0, 0, 0, 0, 0, 0, 1, 0, 0, 0, -1, 0]])}},
+            (2, 3): {'cores_matrix': {'c': np.array([[0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2]])}}
+        }
+        sc_index_mat, resp_frag_arr = get_hfrag([1, 2, 3], 0, 'c', 2, 12, net_spec_dict)
+
+        self.assertTrue(np.array_equal(sc_index_mat, np.array([[0, 2], [1, 3], [2, 4], [3, 5], [7, 9]])))
+        # Taking the lone super-channel of the second run leaves four, the first run keeps one or two of its four
+        self.assertEqual(resp_frag_arr[:4].tolist(), [0.896, 1.195, 1.195, 0.896])
+        self.assertEqual(resp_frag_arr[7], 0.299)
+        self.assertTrue(np.isinf(resp_frag_arr[[4, 5, 6, 8, 9, 10, 11]]).all())
+
+        sc_index_mat, resp_frag_arr = get_hfrag([1, 2, 3], 0, 'c', 9, 12, net_spec_dict)
+        self.assertEqual(len(sc_index_mat), 0)
+        self.assertTrue(np.isinf(resp_frag_arr).all())
+
     def test_classify_cong(self):
         """Test classifying congestion percentage into levels."""
         curr_cong = 0.2
@@ -324,6 +382,21 @@ class TestSimHelpers(unittest.TestCase):
         result = run_simulation_for_arrival_rates(env, arrival_list, mock_run_func)
         self.assertAlmostEqual(result, expected_mean_reward, places=5)
 
+        trial = MagicMock()
+        trial.should_prune.side_effect = [False, True]
+        self.assertIsNone(run_simulation_for_arrival_rates(env, arrival_list, mock_run_func, trial=trial))
+        trial.report.assert_called_with(20.0, step=1)
+        self.assertEqual(trial.report.call_count, 2)
+
+    def test_run_simulation_for_arrival_rates_parallel(self):
+        """Test that every arrival rate runs in its own process and environment."""
+        env = _ArrivalEnv(sim_dict={'s1': {'holding_time': 2, 'cores_per_link': 4, 'num_workers': 2}})
+        result = run_simulation_for_arrival_rates(env, [10, 20, 30], _run_arrival, num_workers=2)
+
+        # Erlangs of 5, 10, and 15 with a single worker per environment, workers are numbered after env
+        self.assertAlmostEqual(result, 13.0, places=5)
+        self.assertEqual(env.sim_dict['num_workers'], 2)
+
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.makedirs')
     @patch('pickle.dump')
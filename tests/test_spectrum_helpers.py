@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import numpy as np
 from helper_scripts.spectrum_helpers import SpectrumHelpers
+from helper_scripts.occupancy_helpers import create_occupancy
 
 
 class TestSpectrumHelpers(unittest.TestCase):
@@ -62,6 +63,22 @@ class TestSpectrumHelpers(unittest.TestCase):
         self.helpers.check_other_links()
         self.assertTrue(self.spectrum_props.is_free)
 
+    def test_check_free_spectrum_compact(self):
+        """Test the _check_free_spectrum method with a packed occupancy."""
+        self.engine_props['compact_spectrum'] = True
+        for link_dict in self.sdn_props.net_spec_dict.values():
+            link_dict['cores_matrix']['c'][0][6] = 3
+            link_dict['occupied_matrix'] = create_occupancy(cores_matrix=link_dict['cores_matrix'])
+        self.helpers.curr_band = 'c'
+        self.helpers.core_num = 0
+        self.helpers.start_index = 0
+        self.helpers.end_index = 5
+        self.assertTrue(self.helpers._check_free_spectrum((1, 2), (2, 1)))
+
+        # The guard band now reaches the taken slot
+        self.helpers.end_index = 6
+        self.assertFalse(self.helpers._check_free_spectrum((1, 2), (2, 1)))
+
     def test_update_spec_props(self):
         """Test the _update_spec_props method."""
         # Set necessary variables
@@ -2,14 +2,16 @@
 
 import unittest
 import shutil
+from statistics import stdev
 from unittest.mock import MagicMock, patch, mock_open
 
 import numpy as np
 import networkx as nx
 
-from helper_scripts.stats_helpers import SimStats
+from helper_scripts.stats_helpers import SimStats, ColumnarStats
 from arg_scripts.stats_args import StatsProps
 from arg_scripts.stats_args import SNAP_KEYS_LIST
+from helper_scripts.usage_helpers import create_usage
 
 
 class TestSimStats(unittest.TestCase):
@@ -95,6 +97,33 @@ class TestSimStats(unittest.TestCase):
         self.assertEqual(guard_slots, 2)
         self.assertEqual(active_reqs, 1)
 
+    def test_get_snapshot_info_usage(self):
+        """
+        Test that the network snapshot reads the usage counters, and matches a scan of the cores.
+        """
+        net_spec_dict = dict()
+        for source, dest in [(0, 1), (1, 2)]:
+            cores_matrix = {'c': np.zeros((2, 6)), 'l': np.zeros((2, 4))}
+            usage_dict = create_usage(cores_matrix=cores_matrix)
+            net_spec_dict[(source, dest)] = {'cores_matrix': cores_matrix, 'usage_dict': usage_dict}
+            net_spec_dict[(dest, source)] = {'cores_matrix': cores_matrix, 'usage_dict': usage_dict}
+        # Request 1 goes through both links, request 2 only uses the second one
+        for link in [(0, 1), (1, 2)]:
+            net_spec_dict[link]['cores_matrix']['c'][0][:3] = [1, 1, -1]
+            net_spec_dict[link]['usage_dict']['taken_matrix']['c'][0] = 3
+            net_spec_dict[link]['usage_dict']['guard_matrix']['c'][0] = 1
+        net_spec_dict[(1, 2)]['cores_matrix']['l'][1][:2] = [2, -2]
+        net_spec_dict[(1, 2)]['usage_dict']['taken_matrix']['l'][1] = 2
+        net_spec_dict[(1, 2)]['usage_dict']['guard_matrix']['l'][1] = 1
+        net_spec_dict[(0, 1)]['usage_dict']['num_reqs'] = 1
+        net_spec_dict[(1, 2)]['usage_dict']['num_reqs'] = 1
+
+        snapshot_tuple = SimStats._get_snapshot_info(net_spec_dict=net_spec_dict, path_list=None)
+        self.assertEqual(snapshot_tuple, (8, 3, 2))
+        scan_spec_dict = {link: {'cores_matrix': link_data['cores_matrix']}
+                          for link, link_data in net_spec_dict.items()}
+        self.assertEqual(SimStats._get_snapshot_info(net_spec_dict=scan_spec_dict, path_list=None), snapshot_tuple)
+
     def test_update_snapshot(self):
         """Test update snapshot."""
         # Manually initialize snapshots_dict for the specific request number
@@ -362,5 +391,120 @@ class TestSimStats(unittest.TestCase):
         mock_file.assert_called_once_with('mocked/path/to/simulation_results/10_erlang.json', 'w', encoding='utf-8')
 
 
+
+class TestColumnarStats(unittest.TestCase):
+    """
+    Tests ColumnarStats in stats_helpers.py
+    """
+
+    def setUp(self):
+        """Set up two simulations, one with list and one with columnar statistics."""
+        self.engine_props = {
+            'num_requests': 4,
+            'snapshot_step': 2,
+            'cores_per_link': 2,
+            'save_snapshots': False,
+            'mod_per_bw': {'50': {'QPSK': {}, '16QAM': {}}, '100': {'QPSK': {}, '16QAM': {}}},
+            'output_train_data': False,
+            'band_list': ['c'],
+            'save_start_end_slots': True,
+            'max_segments': 1,
+        }
+        self.topology = nx.Graph()
+        self.topology.add_edge('A', 'B', length=10)
+        self.topology.add_edge('B', 'C', length=15)
+
+        self.sim_stats_list = list()
+        for is_columnar in (False, True):
+            engine_props = dict(self.engine_props, columnar_stats=is_columnar)
+            sim_stats = SimStats(engine_props=engine_props, sim_info='Simulation Info', stats_props=StatsProps())
+            sim_stats.topology = self.topology
+            sim_stats.init_iter_stats()
+            self.sim_stats_list.append(sim_stats)
+
+    @staticmethod
+    def _get_sdn_data(path_list: list, bandwidth: str, mod_list: list, core_list: list, weight: float):
+        sdn_data = MagicMock()
+        sdn_data.was_routed = True
+        sdn_data.path_list = path_list
+        sdn_data.route_time = 0.5
+        sdn_data.num_trans = len(mod_list)
+        sdn_data.path_weight = weight
+        sdn_data.bandwidth = bandwidth
+        sdn_data.modulation_list = mod_list
+        sdn_data.bandwidth_list = [bandwidth] * len(mod_list)
+        sdn_data.band_list = ['c'] * len(mod_list)
+        sdn_data.core_list = core_list
+        sdn_data.start_slot_list = [index * 4 for index in range(len(mod_list))]
+        sdn_data.end_slot_list = [index * 4 + 3 for index in range(len(mod_list))]
+        sdn_data.xt_list = [0.1] * len(mod_list)
+        sdn_data.stat_key_list = ['modulation_list', 'xt_list', 'core_list', 'band_list', 'start_slot_list',
+                                  'end_slot_list']
+        sdn_data.get_data.side_effect = lambda key: getattr(sdn_data, key)
+
+        return sdn_data
+
+    def test_matches_list_stats(self):
+        """Test that columnar statistics summarize to the same values as the list based statistics."""
+        sdn_data_list = [
+            self._get_sdn_data(path_list=['A', 'B'], bandwidth='50', mod_list=['QPSK'], core_list=[0], weight=10),
+            self._get_sdn_data(path_list=['A', 'B', 'C'], bandwidth='50', mod_list=['16QAM'], core_list=[1],
+                               weight=25),
+            self._get_sdn_data(path_list=['A', 'B', 'C'], bandwidth='100', mod_list=['QPSK', 'QPSK'],
+                               core_list=[0, 1], weight=25),
+        ]
+        for sim_stats in self.sim_stats_list:
+            for sdn_data in sdn_data_list:
+                sim_stats.iter_update(req_data={'bandwidth': sdn_data.bandwidth}, sdn_data=sdn_data)
+            sim_stats.end_iter_update()
+
+        list_props, columnar_props = (sim_stats.stats_props for sim_stats in self.sim_stats_list)
+        self.assertEqual(list_props.hops_list, columnar_props.hops_list.tolist())
+        self.assertEqual(list_props.lengths_list, columnar_props.lengths_list.tolist())
+        self.assertEqual(list_props.cores_dict, columnar_props.cores_dict)
+        self.assertEqual(list_props.start_slot_list, columnar_props.start_slot_list)
+        self.assertEqual(list_props.weights_dict, columnar_props.weights_dict)
+        self.assertEqual(list_props.mods_used_dict, columnar_props.mods_used_dict)
+        self.assertEqual(self.sim_stats_list[0].total_trans, self.sim_stats_list[1].total_trans)
+
+    def test_stream_stats(self):
+        """Test that streaming aggregates summarize to the same values as the list based statistics."""
+        engine_props = dict(self.engine_props, stream_stats=True)
+        stream_stats = SimStats(engine_props=engine_props, sim_info='Simulation Info', stats_props=StatsProps())
+        stream_stats.topology = self.topology
+        stream_stats.init_iter_stats()
+        sdn_data_list = [
+            self._get_sdn_data(path_list=['A', 'B'], bandwidth='50', mod_list=['QPSK'], core_list=[0], weight=10),
+            self._get_sdn_data(path_list=['A', 'B', 'C'], bandwidth='50', mod_list=['QPSK'], core_list=[1],
+                               weight=25),
+        ]
+        for sim_stats in (self.sim_stats_list[0], stream_stats):
+            for sdn_data in sdn_data_list:
+                sim_stats.iter_update(req_data={'bandwidth': sdn_data.bandwidth}, sdn_data=sdn_data)
+            sim_stats.end_iter_update()
+
+        list_props = self.sim_stats_list[0].stats_props
+        self.assertEqual(list_props.weights_dict, stream_stats.stats_props.weights_dict)
+        self.assertEqual(list_props.mods_used_dict, stream_stats.stats_props.mods_used_dict)
+        self.assertEqual(stream_stats.stats_props.hops_list.get_summary(),
+                         {'mean': 1.5, 'std': stdev([1, 2]), 'min': 1.0, 'max': 2.0})
+        self.assertIsNone(stream_stats.columnar_obj)
+
+    def test_grow(self):
+        """Test that the arrays grow when more segments are recorded than preallocated."""
+        columnar_obj = ColumnarStats(engine_props=self.engine_props)
+        sdn_data = self._get_sdn_data(path_list=['A', 'B'], bandwidth='50', mod_list=['QPSK'] * 6,
+                                      core_list=[0] * 6, weight=10)
+        columnar_obj.record(sdn_data=sdn_data, path_len=10)
+
+        self.assertEqual(columnar_obj.num_segments, 6)
+        self.assertGreaterEqual(len(columnar_obj.segments_dict['modulation']), 6)
+        self.assertEqual(columnar_obj.num_slots, 6)
+
+        columnar_obj.reset()
+        self.assertEqual(columnar_obj.num_reqs, 0)
+        self.assertEqual(columnar_obj.num_segments, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import patch
+
+from helper_scripts.timer_helpers import PhaseTimer
+
+
+class TestTimerHelpers(unittest.TestCase):
+    """
+    Tests timer_helpers.py
+    """
+
+    def setUp(self):
+        self.timer_obj = PhaseTimer()
+
+    @patch('helper_scripts.timer_helpers.time.perf_counter_ns')
+    def test_get_stats(self, mock_perf_counter):
+        """Test the counts, times, and histograms of each phase and algorithm."""
+        # Elapsed: 1000 ns and 3000 ns of routing, 500 ns of spectrum
+        mock_perf_counter.side_effect = [1000, 5000, 10500]
+        self.timer_obj.add(phase='routing', algorithm='k_shortest_path', start_ns=0)
+        self.timer_obj.add(phase='routing', algorithm='k_shortest_path', start_ns=2000)
+        self.timer_obj.add(phase='spectrum', algorithm='first_fit', start_ns=10000)
+
+        resp = self.timer_obj.get_stats()
+        routing_dict = resp['routing']['k_shortest_path']
+        self.assertEqual(list(resp), ['routing', 'spectrum'])
+        self.assertEqual(routing_dict['count'], 2)
+        self.assertEqual(routing_dict['total_ms'], 0.004)
+        self.assertEqual(routing_dict['mean_us'], 2.0)
+        self.assertEqual(routing_dict['min_us'], 1.0)
+        self.assertEqual(routing_dict['max_us'], 3.0)
+        # 1000 ns is below 1024 and 3000 ns below 4096
+        self.assertEqual(routing_dict['hist_dict'], {'1024': 1, '4096': 1})
+        self.assertEqual(resp['spectrum']['first_fit']['count'], 1)
+
+    @patch('helper_scripts.timer_helpers.time.perf_counter_ns')
+    def test_summary_and_reset(self, mock_perf_counter):
+        """Test that the summary lists the most expensive phase first and reset clears every phase."""
+        mock_perf_counter.side_effect = [100, 900]
+        self.timer_obj.add(phase='stats', algorithm='list_stats', start_ns=0)
+        self.timer_obj.add(phase='release', algorithm='first_fit', start_ns=0)
+
+        summary_list = self.timer_obj.get_summary_list()
+        self.assertTrue(summary_list[0].startswith('release (first_fit): 1 calls'))
+        self.assertIn('90.0%', summary_list[0])
+
+        self.timer_obj.reset()
+        self.assertEqual(self.timer_obj.get_stats(), dict())
+        self.assertEqual(self.timer_obj.get_summary_list(), list())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+from src.request_generator import get_requests
+from helper_scripts.trace_helpers import get_trace, get_trace_key, trace_to_requests, iter_trace_requests
+
+
+class TestTraceHelpers(unittest.TestCase):
+    """
+    Tests trace_helpers.py
+    """
+
+    def setUp(self):
+        self.base_fp = os.path.join('tests', 'trace_test_data')
+        self.engine_props = {
+            'core_nodes': [],
+            'topology_info': {'nodes': {'A': {}, 'B': {}, 'C': {}, 'D': {}}},
+            'mod_per_bw': {'50': {'QPSK': {'slots_needed': 4}}, '100': {'QPSK': {'slots_needed': 8}}},
+            'request_distribution': {'50': 0.5, '100': 0.5},
+            'num_requests': 50,
+            'arrival_rate': 2.0,
+            'holding_time': 1.5,
+            'is_only_core_node': True,
+            'allocation_method': 'first_fit',
+        }
+
+    def tearDown(self):
+        if os.path.exists(self.base_fp):
+            shutil.rmtree(self.base_fp)
+
+    def test_trace_matches_generator(self):
+        """
+        Test that requests rebuilt from a trace are identical to the sorted generator output.
+        """
+        expected_dict = dict(sorted(get_requests(seed=3, engine_props=self.engine_props).items()))
+        trace_arr = get_trace(seed=3, engine_props=self.engine_props, base_fp=self.base_fp)
+        resp_dict = trace_to_requests(trace_arr=trace_arr, engine_props=self.engine_props)
+
+        self.assertEqual(list(resp_dict.keys()), list(expected_dict.keys()))
+        self.assertEqual(resp_dict, expected_dict)
+
+    def test_iter_trace_requests(self):
+        """
+        Test that requests streamed from a trace in chunks are identical to those rebuilt all at once.
+        """
+        trace_arr = get_trace(seed=3, engine_props=self.engine_props, base_fp=self.base_fp)
+        expected_dict = trace_to_requests(trace_arr=trace_arr, engine_props=self.engine_props)
+        resp_list = list(iter_trace_requests(trace_arr=trace_arr, engine_props=self.engine_props, chunk_size=7))
+
+        self.assertEqual([curr_time for curr_time, _ in resp_list], list(expected_dict.keys()))
+        self.assertEqual(dict(resp_list), expected_dict)
+
+    @patch('helper_scripts.trace_helpers.get_requests', wraps=get_requests)
+    def test_trace_generated_once(self, mock_get_requests):
+        """
+        Test that simulations sharing traffic parameters reuse the saved trace.
+        """
+        get_trace(seed=1, engine_props=self.engine_props, base_fp=self.base_fp)
+        self.engine_props['allocation_method'] = 'last_fit'
+        get_trace(seed=1, engine_props=self.engine_props, base_fp=self.base_fp)
+        self.assertEqual(mock_get_requests.call_count, 1)
+
+        get_trace(seed=2, engine_props=self.engine_props, base_fp=self.base_fp)
+        self.assertEqual(mock_get_requests.call_count, 2)
+
+    def test_key_depends_on_traffic(self):
+        """
+        Test that the trace key changes with the seed and the arrival rate.
+        """
+        base_key = get_trace_key(seed=1, engine_props=self.engine_props)
+        self.assertNotEqual(base_key, get_trace_key(seed=2, engine_props=self.engine_props))
+        self.engine_props['arrival_rate'] = 4.0
+        self.assertNotEqual(base_key, get_trace_key(seed=1, engine_props=self.engine_props))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from helper_scripts.usage_helpers import create_usage, reset_usage, get_network_usage
+
+
+class TestUsageHelpers(unittest.TestCase):
+    """
+    Tests usage_helpers.py
+    """
+
+    def setUp(self):
+        self.cores_matrix = {'c': np.zeros((3, 8)), 'l': np.zeros((3, 4))}
+        self.usage_dict = create_usage(cores_matrix=self.cores_matrix)
+
+    def test_create_usage(self):
+        """
+        Test that every core of every band starts with zeroed counters.
+        """
+        for usage_key in ['taken_matrix', 'guard_matrix', 'active_matrix']:
+            self.assertEqual(list(self.usage_dict[usage_key].keys()), ['c', 'l'])
+            for usage_arr in self.usage_dict[usage_key].values():
+                self.assertEqual(usage_arr.tolist(), [0, 0, 0])
+        self.assertEqual(self.usage_dict['num_reqs'], 0)
+
+    def test_reset_usage(self):
+        """
+        Test that counters are zeroed in place.
+        """
+        taken_arr = self.usage_dict['taken_matrix']['c']
+        taken_arr[1] = 5
+        self.usage_dict['guard_matrix']['l'][2] = 1
+        self.usage_dict['num_reqs'] = 2
+        reset_usage(usage_dict=self.usage_dict)
+
+        self.assertIs(self.usage_dict['taken_matrix']['c'], taken_arr)
+        self.assertFalse(np.any(taken_arr))
+        self.assertFalse(np.any(self.usage_dict['guard_matrix']['l']))
+        self.assertEqual(self.usage_dict['num_reqs'], 0)
+
+    def test_get_network_usage(self):
+        """
+        Test that links are added up once even though both directions share their counters.
+        """
+        self.usage_dict['taken_matrix']['c'][0] = 4
+        self.usage_dict['taken_matrix']['l'][2] = 2
+        self.usage_dict['guard_matrix']['c'][0] = 1
+        self.usage_dict['num_reqs'] = 1
+        other_dict = create_usage(cores_matrix=self.cores_matrix)
+        other_dict['taken_matrix']['c'][1] = 3
+        other_dict['guard_matrix']['c'][1] = 1
+        other_dict['num_reqs'] = 1
+        net_spec_dict = {
+            ('A', 'B'): {'usage_dict': self.usage_dict}, ('B', 'A'): {'usage_dict': self.usage_dict},
+            ('B', 'C'): {'usage_dict': other_dict}, ('C', 'B'): {'usage_dict': other_dict},
+        }
+
+        self.assertEqual(get_network_usage(net_spec_dict=net_spec_dict), (9, 2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+import unittest
+
+from helper_scripts.writer_helpers import ResultsWriter, ARRAY_MIN_LEN
+
+
+class TestWriterHelpers(unittest.TestCase):
+    """
+    Tests writer_helpers.py
+    """
+
+    def setUp(self):
+        self.save_fp = os.path.join('tests', 'writer_test_data')
+        self.slots_list = list(range(ARRAY_MIN_LEN * 2))
+        self.header_dict = {'blocking_mean': 0.1, 'blocking_variance': None}
+
+    def tearDown(self):
+        if os.path.exists(self.save_fp):
+            shutil.rmtree(self.save_fp)
+
+    def test_consolidate(self):
+        """Test that the consolidated results match a synchronous save."""
+        writer_obj = ResultsWriter(save_fp=self.save_fp, erlang=300.0)
+        expected_dict = {'iter_stats': dict()}
+        for iteration in range(3):
+            iter_dict = {'sim_block_list': [0.1] * (iteration + 1), 'cores_dict': {0: iteration},
+                         'start_slot_list': self.slots_list, 'hops_mean': 2.5}
+            header_dict = dict(self.header_dict, blocking_mean=0.1 * iteration)
+            writer_obj.put(iteration=iteration, header_dict=header_dict, iter_dict=iter_dict)
+            expected_dict['iter_stats'][iteration] = iter_dict
+            expected_dict.update(header_dict)
+        writer_obj.close()
+
+        with open(os.path.join(self.save_fp, '300.0_erlang.json'), 'r', encoding='utf-8') as file_obj:
+            resp = json.load(file_obj)
+        self.assertEqual(resp, json.loads(json.dumps(expected_dict)))
+        self.assertEqual(list(resp), ['iter_stats', 'blocking_mean', 'blocking_variance'])
+        # Long lists are kept in binary, not in the records
+        with open(os.path.join(self.save_fp, '300.0_erlang.jsonl'), 'r', encoding='utf-8') as file_obj:
+            self.assertNotIn(str(self.slots_list[-1]), file_obj.readline())
+        self.assertTrue(os.path.isfile(os.path.join(self.save_fp, '300.0_erlang_arrays', '0.npz')))
+
+    def test_latest_record(self):
+        """Test that saving an iteration twice keeps the latest record."""
+        writer_obj = ResultsWriter(save_fp=self.save_fp, erlang=300.0)
+        writer_obj.put(iteration=0, header_dict=self.header_dict, iter_dict={'trans_mean': 1.0})
+        writer_obj.put(iteration=0, header_dict=self.header_dict, iter_dict={'trans_mean': 2.0})
+        writer_obj.close()
+
+        self.assertEqual(writer_obj.consolidate()['iter_stats'], {0: {'trans_mean': 2.0}})
+
+    def test_error(self):
+        """Test that an error on the writer thread is raised on the simulation thread."""
+        writer_obj = ResultsWriter(save_fp=self.save_fp, erlang=300.0)
+        writer_obj.put(iteration=0, header_dict=self.header_dict, iter_dict={'bad_stat': {1, 2}})
+
+        with self.assertRaises(RuntimeError):
+            writer_obj.close()
+
+
+if __name__ == '__main__':
+    unittest.main()